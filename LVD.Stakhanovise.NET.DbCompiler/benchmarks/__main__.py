@@ -0,0 +1,83 @@
+﻿import os
+import sys
+import shutil
+import argparse
+import tempfile
+
+BENCHMARKS_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+DB_COMPILER_DIRECTORY = os.path.dirname(BENCHMARKS_DIRECTORY)
+sys.path.insert(0, os.path.join(DB_COMPILER_DIRECTORY, 'compiler'))
+
+from engine.filesystem.memory_file_system import MemoryFileSystem
+
+from .synthetic_schema_generator import SyntheticSchemaGenerator
+from .compiler_benchmark import CompilerBenchmark
+from .benchmark_report import BenchmarkReport
+
+def parseArguments() -> argparse.Namespace:
+    argumentParser = argparse.ArgumentParser(description = 'Stakhanovise.NET Db Compiler benchmarks')
+    argumentParser.add_argument('--tables', type = int, default = 200, help = 'Number of generated tables.')
+    argumentParser.add_argument('--columns', type = int, default = 20, help = 'Number of columns per generated table.')
+    argumentParser.add_argument('--indexes', type = int, default = 3, help = 'Number of indexes per generated table.')
+    argumentParser.add_argument('--sequences', type = int, default = 20, help = 'Number of generated sequences.')
+    argumentParser.add_argument('--functions', type = int, default = 20, help = 'Number of generated functions.')
+    argumentParser.add_argument('--body-lines', type = int, default = 200, help = 'Number of BODY lines per generated function.')
+    argumentParser.add_argument('--repetitions', type = int, default = 10, help = 'Number of measured compilations.')
+    argumentParser.add_argument('--warmup', type = int, default = 1, help = 'Number of compilations to run before measuring.')
+    argumentParser.add_argument('--work-dir', default = None, help = 'Directory to generate the synthetic source tree in. Defaults to a temporary directory.')
+    argumentParser.add_argument('--keep', action = 'store_true', default = False, help = 'Do not remove the temporary directory the source tree was generated in.')
+    argumentParser.add_argument('--jobs', type = int, default = None, help = 'Number of worker processes used to parse the definition files.')
+    argumentParser.add_argument('--stream', action = 'store_true', default = None, help = 'Compile in streaming mode.')
+    argumentParser.add_argument('--in-memory', action = 'store_true', default = False, help = 'Generate the source tree and write the outputs in memory instead of on disk.')
+    argumentParser.add_argument('--output', default = None, help = 'Write the JSON report to this file instead of the standard output.')
+    return argumentParser.parse_args()
+
+def runBenchmarks(args: argparse.Namespace) -> BenchmarkReport:
+    fileSystem = MemoryFileSystem() if args.in_memory else None
+    isTemporaryWorkDirectory = not args.work_dir and fileSystem is None
+
+    if fileSystem is not None:
+        workDirectory = args.work_dir or os.path.join(tempfile.gettempdir(), 'sk_dbcompiler_bench_in_memory')
+    else:
+        workDirectory = args.work_dir or tempfile.mkdtemp(prefix = 'sk_dbcompiler_bench_')
+
+    generator = SyntheticSchemaGenerator(args.tables, 
+        args.columns, 
+        args.indexes, 
+        args.sequences, 
+        args.functions, 
+        args.body_lines, 
+        os.path.join(DB_COMPILER_DIRECTORY, 'src'), 
+        fileSystem)
+
+    try:
+        schema = generator.generate(workDirectory)
+        benchmark = CompilerBenchmark(schema['source_directory'], 
+            schema['solution_root_directory'], 
+            fileSystem = fileSystem, 
+            jobs = args.jobs, 
+            streaming = args.stream)
+        samples = benchmark.run(args.repetitions, args.warmup)
+    finally:
+        if isTemporaryWorkDirectory and not args.keep:
+            shutil.rmtree(workDirectory, ignore_errors = True)
+
+    parameters = generator.getParameters()
+    parameters['repetitions'] = args.repetitions
+    parameters['warmup'] = args.warmup
+    parameters['in_memory'] = args.in_memory
+    parameters['jobs'] = args.jobs
+    parameters['streaming'] = args.stream == True
+
+    return BenchmarkReport(parameters, schema, samples)
+
+if __name__ == '__main__':
+    args = parseArguments()
+    report = runBenchmarks(args)
+
+    if args.output:
+        filePointer = open(args.output, 'w', encoding = 'utf-8')
+        filePointer.write(report.toJson())
+        filePointer.close()
+    else:
+        print(report.toJson())
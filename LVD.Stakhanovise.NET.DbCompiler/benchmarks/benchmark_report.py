@@ -0,0 +1,63 @@
+﻿import sys
+import json
+import platform
+
+REPORTED_PERCENTILES = [ 50, 90, 95, 99 ]
+
+def percentile(sortedSamples: list[float], percent: float) -> float:
+    if len(sortedSamples) == 0:
+        return None
+    if len(sortedSamples) == 1:
+        return sortedSamples[0]
+
+    rank = (len(sortedSamples) - 1) * (percent / 100.0)
+    lowerIndex = int(rank)
+    upperIndex = min(lowerIndex + 1, len(sortedSamples) - 1)
+    fraction = rank - lowerIndex
+
+    return sortedSamples[lowerIndex] + (sortedSamples[upperIndex] - sortedSamples[lowerIndex]) * fraction
+
+class BenchmarkReport:
+    _parameters: dict = None
+    _schema: dict = None
+    _samples: dict[str, list[float]] = None
+
+    def __init__(self, parameters: dict, schema: dict, samples: dict[str, list[float]]) -> None:
+        self._parameters = parameters
+        self._schema = schema
+        self._samples = samples
+
+    def toDict(self) -> dict:
+        return {
+            'environment': self._describeEnvironment(),
+            'parameters': self._parameters,
+            'schema': self._schema,
+            'unit': 'seconds',
+            'phases': dict([(phaseName, self._summarizeSamples(phaseSamples)) 
+                for phaseName, phaseSamples in self._samples.items()])
+        }
+
+    def toJson(self) -> str:
+        return json.dumps(self.toDict(), indent = 2)
+
+    def _describeEnvironment(self) -> dict:
+        return {
+            'python': sys.version.split()[0],
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'machine': platform.machine()
+        }
+
+    def _summarizeSamples(self, phaseSamples: list[float]) -> dict:
+        sortedSamples = sorted(phaseSamples)
+        summary = {
+            'samples': len(sortedSamples),
+            'min': sortedSamples[0],
+            'max': sortedSamples[-1],
+            'mean': sum(sortedSamples) / len(sortedSamples)
+        }
+
+        for reportedPercentile in REPORTED_PERCENTILES:
+            summary['p%d' % reportedPercentile] = percentile(sortedSamples, reportedPercentile)
+
+        return summary
@@ -0,0 +1,79 @@
+﻿import time
+
+from engine.compiler import Compiler
+from engine.compiler_hooks import PHASE_EXPORT, PHASE_COMMIT, PHASE_EXPAND
+from engine.filesystem.file_system import FileSystem
+from engine.profiling.compiler_profiler import CompilerProfiler
+from engine.profiling.profiled_phase import ProfiledPhase
+
+PHASE_TOTAL = 'total'
+
+SUBJECT_PHASES = [PHASE_EXPORT, PHASE_COMMIT, PHASE_EXPAND]
+
+PhaseTimings = dict[str, float]
+
+class CompilerBenchmark:
+    _sourceDirectory: str = None
+    _solutionRootDirectory: str = None
+    _makefileName: str = None
+    _fileSystem: FileSystem = None
+    _jobs: int = None
+    _streaming: bool = None
+
+    def __init__(self, sourceDirectory: str, solutionRootDirectory: str, makefileName: str = 'makefile', fileSystem: FileSystem = None, jobs: int = None, streaming: bool = None) -> None:
+        self._sourceDirectory = sourceDirectory
+        self._solutionRootDirectory = solutionRootDirectory
+        self._makefileName = makefileName
+        self._fileSystem = fileSystem
+        self._jobs = jobs
+        self._streaming = streaming
+
+    def run(self, repetitions: int, warmupRepetitions: int = 0) -> dict[str, list[float]]:
+        samples: dict[str, list[float]] = {}
+
+        for repetition in range(warmupRepetitions + repetitions):
+            phaseTimings = self._runOnce()
+            if repetition < warmupRepetitions:
+                continue
+
+            for phaseName, elapsed in phaseTimings.items():
+                samples.setdefault(phaseName, []).append(elapsed)
+
+        return samples
+
+    def _runOnce(self) -> PhaseTimings:
+        profiler = CompilerProfiler(traceMemory = False)
+        compiler = Compiler(self._sourceDirectory, 
+            self._solutionRootDirectory, 
+            useCache = False, 
+            jobs = self._jobs, 
+            hooks = profiler, 
+            streaming = self._streaming, 
+            fileSystem = self._fileSystem)
+
+        profiler.start()
+        startTime = time.perf_counter()
+        try:
+            compiler.compile(self._makefileName)
+        finally:
+            totalTime = time.perf_counter() - startTime
+            profiler.stop()
+
+        phaseTimings = self._collectPhaseTimings(profiler.getRecords())
+        phaseTimings[PHASE_TOTAL] = totalTime
+        return phaseTimings
+
+    def _collectPhaseTimings(self, records: list[ProfiledPhase]) -> PhaseTimings:
+        phaseTimings: PhaseTimings = {}
+
+        for record in records:
+            phaseName = self._getPhaseName(record)
+            phaseTimings[phaseName] = phaseTimings.get(phaseName, 0) + record.getWallTime()
+
+        return phaseTimings
+
+    def _getPhaseName(self, record: ProfiledPhase) -> str:
+        if record.getPhase() in SUBJECT_PHASES and record.getSubject() is not None:
+            return record.getPhase() + ':' + record.getSubject()
+        else:
+            return record.getPhase()
@@ -0,0 +1,203 @@
+﻿import os
+import shutil
+
+from engine.filesystem.file_system import FileSystem
+from engine.filesystem.local_file_system import LocalFileSystem
+
+COLUMN_TYPES = [ 'bigint', 
+    'integer', 
+    'uuid', 
+    'character varying(250)', 
+    'text', 
+    'timestamp with time zone', 
+    'boolean', 
+    'numeric(18,4)' ]
+
+MAPPING_SYMBOLS = {
+    'queue_table_name': 'sk_tasks_queue_t',
+    'results_queue_table_name': 'sk_task_results_t',
+    'execution_time_stats_table_name': 'sk_task_execution_time_stats_t',
+    'metrics_table_name': 'sk_metrics_t',
+    'new_task_notification_channel_name': 'sk_task_queue_item_added',
+    'dequeue_function_name': 'sk_try_dequeue_task',
+    'tenant_prefix': 'bench'
+}
+
+BENCHMARK_PROJECT_NAME = 'LVD.Stakhanovise.NET.DbCompiler.Benchmark'
+
+class SyntheticSchemaGenerator:
+    _tableCount: int = 0
+    _columnCount: int = 0
+    _indexCount: int = 0
+    _sequenceCount: int = 0
+    _functionCount: int = 0
+    _functionBodyLineCount: int = 0
+    _assetsSourceDirectory: str = None
+    _fileSystem: FileSystem = None
+    _definitionBytes: int = 0
+
+    def __init__(self, tableCount: int, 
+            columnCount: int, 
+            indexCount: int, 
+            sequenceCount: int, 
+            functionCount: int, 
+            functionBodyLineCount: int, 
+            assetsSourceDirectory: str, 
+            fileSystem: FileSystem = None) -> None:
+        self._tableCount = tableCount
+        self._columnCount = max(columnCount, 2)
+        self._indexCount = indexCount
+        self._sequenceCount = sequenceCount
+        self._functionCount = functionCount
+        self._functionBodyLineCount = functionBodyLineCount
+        self._assetsSourceDirectory = assetsSourceDirectory
+        self._fileSystem = fileSystem or LocalFileSystem()
+
+    def generate(self, rootDirectory: str) -> dict:
+        sourceDirectory = os.path.join(rootDirectory, 'src')
+        solutionRootDirectory = os.path.join(rootDirectory, 'solution')
+        self._definitionBytes = 0
+
+        self._recreateDirectory(sourceDirectory)
+        self._recreateDirectory(solutionRootDirectory)
+
+        self._copyAssets(sourceDirectory)
+        self._writeProject(solutionRootDirectory)
+        self._writeFile(sourceDirectory, 'makefile', self._renderMakefile())
+        self._writeFile(sourceDirectory, 'sk_mapping.dbmap', self._renderMapping())
+
+        for sequenceIndex in range(self._sequenceCount):
+            self._writeDefinitionFile(sourceDirectory, 'bench_seq_%05d.dbdef' % sequenceIndex, self._renderSequence(sequenceIndex))
+
+        for tableIndex in range(self._tableCount):
+            self._writeDefinitionFile(sourceDirectory, 'bench_tbl_%05d.dbdef' % tableIndex, self._renderTable(tableIndex))
+
+        for functionIndex in range(self._functionCount):
+            self._writeDefinitionFile(sourceDirectory, 'bench_func_%05d.dbdef' % functionIndex, self._renderFunction(functionIndex))
+
+        return {
+            'source_directory': sourceDirectory,
+            'solution_root_directory': solutionRootDirectory,
+            'definition_files': self._sequenceCount + self._tableCount + self._functionCount,
+            'definition_bytes': self._definitionBytes
+        }
+
+    def getParameters(self) -> dict:
+        return {
+            'tables': self._tableCount,
+            'columns': self._columnCount,
+            'indexes': self._indexCount,
+            'sequences': self._sequenceCount,
+            'functions': self._functionCount,
+            'function_body_lines': self._functionBodyLineCount
+        }
+
+    def _recreateDirectory(self, directory: str) -> None:
+        if self._fileSystem.isLocal() and os.path.isdir(directory):
+            shutil.rmtree(directory)
+        self._fileSystem.makeDirectories(directory)
+
+    def _copyAssets(self, sourceDirectory: str) -> None:
+        for assetsDirectoryName in [ 'parts', 'templates' ]:
+            assetsDirectory = os.path.join(self._assetsSourceDirectory, assetsDirectoryName)
+            for assetFileName in os.listdir(assetsDirectory):
+                assetFilePointer = open(os.path.join(assetsDirectory, assetFileName), 'rb')
+                assetFileContents = assetFilePointer.read()
+                assetFilePointer.close()
+
+                targetDirectory = os.path.join(sourceDirectory, assetsDirectoryName)
+                self._fileSystem.makeDirectories(targetDirectory)
+                self._fileSystem.writeBytes(os.path.join(targetDirectory, assetFileName), assetFileContents)
+
+    def _writeProject(self, solutionRootDirectory: str) -> None:
+        projectDirectory = os.path.join(solutionRootDirectory, BENCHMARK_PROJECT_NAME)
+        for projectSubdirectoryName in [ 'Scripts', 'Objects', 'Docs', 'Model' ]:
+            self._fileSystem.makeDirectories(os.path.join(projectDirectory, projectSubdirectoryName))
+
+        self._writeFile(projectDirectory, 
+            BENCHMARK_PROJECT_NAME + '.csproj', 
+            '<Project Sdk="Microsoft.NET.Sdk">\n\t<PropertyGroup>\n\t\t<TargetFramework>netstandard2.1</TargetFramework>\n\t</PropertyGroup>\n</Project>\n')
+
+    def _renderMakefile(self) -> str:
+        return '\n'.join([
+            'MAP=sk_mapping.dbmap',
+            'DEFINITIONS=*.dbdef',
+            'OUTPUT=sql_script(proj=%s; dir=Scripts; mode=consolidated; file=sk_db.sql; item_group=SK_DbScripts; build_action=None)' % BENCHMARK_PROJECT_NAME,
+            'OUTPUT=sql_script(proj=%s; dir=Objects; mode=single; item_group=SK_Setup_DbScripts; file=$db_object$.sql; build_action=EmbeddedResource; copy_output=Never)' % BENCHMARK_PROJECT_NAME,
+            'OUTPUT=markdown_docs(header=parts/readme_db_header.md; footer=parts/readme_db_footer.md; proj=%s; dir=Docs; file=README-DB.md; item_group=SK_DbDocs; build_action=None)' % BENCHMARK_PROJECT_NAME,
+            'OUTPUT=mapping_code(proj=%s; ns=LVD.Stakhanovise.NET.Model; dir=Model; cls=QueuedTaskMapping)' % BENCHMARK_PROJECT_NAME
+        ])
+
+    def _renderMapping(self) -> str:
+        return '\n'.join([ 'MAP: %s=%s' % (symbolName, symbolValue) 
+            for symbolName, symbolValue in MAPPING_SYMBOLS.items() ])
+
+    def _renderSequence(self, sequenceIndex: int) -> str:
+        return '\n'.join([
+            'SEQ',
+            'NAME: $tenant_prefix$_seq_%05d' % sequenceIndex,
+            'PROPS: start=1; increment=1; min_value=1; max_value=9223372036854775807; cache=1',
+            'PROPS: description=Synthetic sequence %d' % sequenceIndex
+        ])
+
+    def _renderTable(self, tableIndex: int) -> str:
+        tableName = '$tenant_prefix$_tbl_%05d' % tableIndex
+        lines = [
+            'TBL',
+            'NAME: ' + tableName,
+            'PROPS: title=Synthetic table %d; description=Generated for benchmarking purposes' % tableIndex
+        ]
+
+        for columnIndex in range(self._columnCount):
+            lines.append(self._renderColumn(tableIndex, columnIndex))
+
+        lines.append('CONSTRAINT: pk_%s(col_0); type=pk' % tableName)
+        lines.append('CONSTRAINT: unq_%s_col_1(col_1); type=unq' % tableName)
+
+        for indexIndex in range(self._indexCount):
+            firstColumnIndex = (indexIndex + 1) % self._columnCount
+            secondColumnIndex = (indexIndex + 2) % self._columnCount
+            lines.append('IDX: idx_%s_%d(col_%d=ASC, col_%d=DESC); type=btree' % (tableName, 
+                indexIndex, 
+                firstColumnIndex, 
+                secondColumnIndex))
+
+        return '\n'.join(lines)
+
+    def _renderColumn(self, tableIndex: int, columnIndex: int) -> str:
+        columnType = COLUMN_TYPES[(tableIndex + columnIndex) % len(COLUMN_TYPES)]
+        if columnIndex == 0:
+            return 'COL: col_0(type=bigint; not_null=true; default=nextval(\'public.$tenant_prefix$_tbl_%05d_seq\'::regclass))' % tableIndex
+        elif columnIndex % 3 == 0:
+            return 'COL: col_%d(type=%s; not_null=true)' % (columnIndex, columnType)
+        else:
+            return 'COL: col_%d(type=%s)' % (columnIndex, columnType)
+
+    def _renderFunction(self, functionIndex: int) -> str:
+        lines = [
+            'FUNC',
+            'NAME: $tenant_prefix$_func_%05d' % functionIndex,
+            'PROPS: title=Synthetic function %d; description=Generated for benchmarking purposes' % functionIndex,
+            'PROPS: language=plpgsql; separator=$$',
+            'PARAM: select_types(type=character varying[]; direction=in; description=Task types)',
+            'PARAM: ref_now(type=timestamp with time zone; direction=in; description=Reference timestamp)',
+            'RET: table(task_id=uuid; task_type=character varying; task_locked_until_ts=timestamp with time zone)',
+            'BODY:',
+            '\tBEGIN'
+        ]
+
+        for bodyLineIndex in range(self._functionBodyLineCount):
+            lines.append('\t\tPERFORM t%d.task_id FROM $queue_table_name$ t%d WHERE t%d.task_locked_until_ts < ref_now AND t%d.task_type = ANY(select_types);' % ((bodyLineIndex, ) * 4))
+
+        lines.append('\t\tRETURN QUERY SELECT t.task_id, t.task_type, t.task_locked_until_ts FROM $queue_table_name$ t;')
+        lines.append('\tEND;')
+        lines.append('BODY;')
+        return '\n'.join(lines)
+
+    def _writeDefinitionFile(self, directory: str, fileName: str, fileContents: str) -> None:
+        self._definitionBytes += self._writeFile(directory, fileName, fileContents)
+
+    def _writeFile(self, directory: str, fileName: str, fileContents: str) -> int:
+        encodedFileContents = fileContents.encode('utf-8')
+        self._fileSystem.writeBytes(os.path.join(directory, fileName), encodedFileContents)
+        return len(encodedFileContents)
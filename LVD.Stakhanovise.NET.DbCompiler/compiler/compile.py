@@ -1,11 +1,166 @@
 ﻿import os
+import sys
+import argparse
 from engine.compiler import Compiler
+from engine.compiler_hooks import CompilerHooks
+from engine.compiler_selection import CompilerSelection
+from engine.model.compiler_variant_info import CompilerVariantInfo
+from engine.profiling.compiler_profiler import CompilerProfiler
+from engine.profiling.profile_report_writer import ProfileReportWriter
+from engine.profiling.profile_report_writer import PROFILE_FORMAT_TABLE
+from engine.profiling.profile_report_writer import PROFILE_FORMAT_JSON
+from engine.watch.compile_watcher import CompileWatcher
+from engine.watch.source_directory_watcher_factory import SourceDirectoryWatcherFactory
 
-def compileDb(sourceDirectory: str, solutionRootDirectory: str):
-    compiler = Compiler(sourceDirectory, solutionRootDirectory)
-    compiler.compile()
+def createCompiler(args: argparse.Namespace, hooks: CompilerHooks = None) -> Compiler:
+    selection = CompilerSelection(args.only_output, args.objects)
+    return Compiler(args.source_dir, 
+        args.solution_root, 
+        useCache = not args.no_cache, 
+        jobs = args.jobs, 
+        concurrentOutputs = args.concurrent_outputs, 
+        hooks = hooks, 
+        streaming = args.stream, 
+        selection = selection, 
+        variants = createVariants(args), 
+        validate = args.validate)
+
+def createVariants(args: argparse.Namespace) -> list[CompilerVariantInfo]:
+    variants: list[CompilerVariantInfo] = []
+
+    for mappingFileName in args.variant_map or []:
+        variantName = os.path.splitext(os.path.basename(mappingFileName))[0]
+        variants.append(CompilerVariantInfo(variantName, mappingFileName = mappingFileName))
+
+    for prefix in args.variant_prefix or []:
+        variantName = prefix.strip('_') or prefix
+        variants.append(CompilerVariantInfo(variantName, prefix = prefix))
+
+    return variants
+
+def compileDb(args: argparse.Namespace):
+    compiler = createCompiler(args)
+    compiler.compile(args.makefile)
+
+def profileDb(args: argparse.Namespace, 
+        profileFormat: str = PROFILE_FORMAT_TABLE, 
+        profileOutputFilePath: str = None, 
+        profileDumpFilePath: str = None):
+    profiler = CompilerProfiler(cProfileDumpFilePath = profileDumpFilePath)
+    compiler = createCompiler(args, profiler)
+
+    profiler.start()
+    try:
+        compiler.compile(args.makefile)
+    finally:
+        profiler.stop()
+        writeProfileReport(profiler, profileFormat, profileOutputFilePath)
+
+def writeProfileReport(profiler: CompilerProfiler, profileFormat: str, profileOutputFilePath: str = None):
+    reportWriter = ProfileReportWriter(profiler.getRecords())
+    report = reportWriter.render(profileFormat)
+
+    if profileOutputFilePath:
+        with open(profileOutputFilePath, 'w', encoding = 'utf-8') as profileOutputFile:
+            profileOutputFile.write(report + '\n')
+    else:
+        sys.stdout.write(report + '\n')
+
+def watchDb(args: argparse.Namespace, forcePolling: bool = False):
+    compiler = createCompiler(args)
+    watcherFactory = SourceDirectoryWatcherFactory()
+    watcher = watcherFactory.createWatcher(args.source_dir, forcePolling)
+    compileWatcher = CompileWatcher(compiler, watcher, args.makefile)
+    compileWatcher.run()
+
+def parseArguments() -> argparse.Namespace:
+    argumentParser = argparse.ArgumentParser(description = 'Stakhanovise.NET Db Compiler')
+    argumentParser.add_argument('--source-dir', 
+        default = './src', 
+        help = 'Directory containing the makefile, the mapping file and the definition files.')
+    argumentParser.add_argument('--solution-root', 
+        default = '../', 
+        help = 'Root directory of the solution containing the target projects.')
+    argumentParser.add_argument('--makefile', 
+        default = 'makefile', 
+        help = 'Name of the makefile, relative to the source directory.')
+    argumentParser.add_argument('--only-output', 
+        action = 'append', 
+        default = None, 
+        metavar = 'OUTPUTS', 
+        help = 'Only run the output routines with the given names (comma separated, e.g. sql_script,mapping_code). Can be repeated.')
+    argumentParser.add_argument('--objects', 
+        action = 'append', 
+        default = None, 
+        metavar = 'PATTERNS', 
+        help = 'Only parse and output the database objects whose names match the given glob patterns (comma separated, e.g. sk_tasks_*). Can be repeated.')
+    argumentParser.add_argument('--variant-map', 
+        action = 'append', 
+        default = None, 
+        metavar = 'MAPPING_FILE', 
+        help = 'Add a variant that uses the given mapping file (relative to the source directory). Can be repeated.')
+    argumentParser.add_argument('--variant-prefix', 
+        action = 'append', 
+        default = None, 
+        metavar = 'PREFIX', 
+        help = 'Add a variant that prefixes the mapped object names with the given prefix. Can be repeated.')
+    argumentParser.add_argument('--no-cache', 
+        action = 'store_true', 
+        default = False, 
+        help = 'Do not read or update the compiler cache; parse every definition file and run every selected output routine.')
+    argumentParser.add_argument('--jobs', 
+        type = int, 
+        default = None, 
+        help = 'Number of worker processes used to parse definition files. Overrides the JOBS makefile property.')
+    argumentParser.add_argument('--concurrent-outputs', 
+        action = 'store_true', 
+        default = None, 
+        help = 'Run independent output routines concurrently. Overrides the CONCURRENT_OUTPUTS makefile property.')
+    argumentParser.add_argument('--stream', 
+        action = 'store_true', 
+        default = None, 
+        help = 'Parse definition files one at a time and push each object to the output routines as soon as it is parsed. Overrides the STREAMING makefile property.')
+    argumentParser.add_argument('--validate', 
+        action = 'store_true', 
+        default = None, 
+        help = 'Parse the generated SQL and function bodies offline (using pglast) and stop with the offending file and line before any output routine runs. Overrides the VALIDATE makefile property.')
+    argumentParser.add_argument('--watch', 
+        action = 'store_true', 
+        default = False, 
+        help = 'Keep running, watch the source directory and recompile whenever a source file changes.')
+    argumentParser.add_argument('--poll', 
+        action = 'store_true', 
+        default = False, 
+        help = 'In watch mode, detect changes by polling the source directory instead of using inotify.')
+    argumentParser.add_argument('--profile', 
+        action = 'store_true', 
+        default = False, 
+        help = 'Record wall time, CPU time and peak memory for each compiler phase and print a report.')
+    argumentParser.add_argument('--profile-format', 
+        choices = [PROFILE_FORMAT_TABLE, PROFILE_FORMAT_JSON], 
+        default = PROFILE_FORMAT_TABLE, 
+        help = 'Format of the profile report.')
+    argumentParser.add_argument('--profile-output', 
+        default = None, 
+        help = 'Write the profile report to the given file instead of the standard output.')
+    argumentParser.add_argument('--profile-dump', 
+        default = None, 
+        help = 'Also run cProfile during the compile and dump its stats to the given file.')
+
+    args = argumentParser.parse_args()
+    if args.watch and args.profile:
+        argumentParser.error('--profile cannot be used together with --watch')
+
+    return args
 
 if __name__ == '__main__':
-    sourceDirectory = './src'
-    solutionRootDirectory = '../'
-    compileDb(sourceDirectory, solutionRootDirectory)
\ No newline at end of file
+    args = parseArguments()
+    if args.watch:
+        watchDb(args, args.poll)
+    elif args.profile:
+        profileDb(args, 
+            args.profile_format, 
+            args.profile_output, 
+            args.profile_dump)
+    else:
+        compileDb(args)
\ No newline at end of file
@@ -0,0 +1,156 @@
+import os
+import pickle
+
+from ..helper.content_hash import hash_bytes
+from ..helper.content_hash import hash_file
+from ..helper.content_hash import hash_parts
+from ..filesystem.file_system import FileSystem
+from ..filesystem.local_file_system import LocalFileSystem
+from ..model.db_object import DbObject
+
+CACHE_FORMAT_VERSION = 5
+CACHE_FILE_NAME = 'compiler.cache'
+
+KEY_VERSION = 'version'
+KEY_CODE_FINGERPRINT = 'code_fingerprint'
+KEY_OBJECTS = 'objects'
+KEY_OUTPUTS = 'outputs'
+
+class CompilerCache:
+    _codeFingerprint: str = None
+    _cacheDirectory: str = None
+    _state: dict = None
+    _dirty: bool = False
+    _fileSystem: FileSystem = None
+
+    def __init__(self, cacheDirectory: str, fileSystem: FileSystem = None) -> None:
+        self._cacheDirectory = cacheDirectory
+        self._fileSystem = fileSystem or LocalFileSystem()
+        self._state = self._createEmptyState()
+        self._dirty = False
+
+    def _createEmptyState(self) -> dict:
+        return {
+            KEY_VERSION: CACHE_FORMAT_VERSION,
+            KEY_CODE_FINGERPRINT: __class__.getCodeFingerprint(),
+            KEY_OBJECTS: {},
+            KEY_OUTPUTS: {}
+        }
+
+    def load(self) -> None:
+        cacheFilePath = self._getCacheFilePath()
+        state = None
+
+        if self._fileSystem.exists(cacheFilePath):
+            try:
+                state = pickle.loads(self._fileSystem.readBytes(cacheFilePath))
+            except Exception:
+                state = None
+
+        if self._isValidState(state):
+            self._state = state
+        else:
+            self._state = self._createEmptyState()
+
+        self._dirty = False
+
+    def _isValidState(self, state: dict) -> bool:
+        return (isinstance(state, dict)
+            and state.get(KEY_VERSION) == CACHE_FORMAT_VERSION
+            and state.get(KEY_CODE_FINGERPRINT) == __class__.getCodeFingerprint()
+            and isinstance(state.get(KEY_OBJECTS), dict)
+            and isinstance(state.get(KEY_OUTPUTS), dict))
+
+    @staticmethod
+    def getCodeFingerprint() -> str:
+        if __class__._codeFingerprint is None:
+            __class__._codeFingerprint = __class__._computeCodeFingerprint()
+        return __class__._codeFingerprint
+
+    @staticmethod
+    def _computeCodeFingerprint() -> str:
+        engineDirectory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        fingerprintParts = []
+
+        for directoryPath, directoryNames, fileNames in os.walk(engineDirectory):
+            directoryNames.sort()
+            for fileName in sorted(fileNames):
+                if fileName.endswith('.py'):
+                    codeFilePath = os.path.join(directoryPath, fileName)
+                    fingerprintParts.append(os.path.relpath(codeFilePath, engineDirectory).replace(os.sep, '/'))
+                    fingerprintParts.append(hash_file(codeFilePath))
+
+        return hash_parts(fingerprintParts)
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+
+        if not self._fileSystem.isDirectory(self._cacheDirectory):
+            self._fileSystem.makeDirectories(self._cacheDirectory)
+
+        cacheFilePath = self._getCacheFilePath()
+        self._fileSystem.writeBytes(cacheFilePath, pickle.dumps(self._state, protocol = pickle.HIGHEST_PROTOCOL))
+        self._dirty = False
+
+    def clear(self) -> None:
+        self._state = self._createEmptyState()
+        self._dirty = True
+
+    def _getCacheFilePath(self) -> str:
+        return os.path.join(self._cacheDirectory, CACHE_FILE_NAME)
+
+    def getObject(self, sourceFileName: str, sourceHash: str) -> DbObject:
+        entry = self._state[KEY_OBJECTS].get(sourceFileName, None)
+        if entry is None:
+            return None
+
+        if entry['source_hash'] != sourceHash:
+            return None
+
+        return entry['object']
+
+    def storeObject(self, sourceFileName: str, sourceHash: str, obj: DbObject) -> None:
+        self._state[KEY_OBJECTS][sourceFileName] = {
+            'source_hash': sourceHash,
+            'object': obj
+        }
+        self._dirty = True
+
+    def retainObjects(self, sourceFileNames: list[str]) -> None:
+        cachedObjects = self._state[KEY_OBJECTS]
+        staleSourceFileNames = [sourceFileName
+            for sourceFileName in cachedObjects.keys()
+                if sourceFileName not in sourceFileNames]
+
+        for staleSourceFileName in staleSourceFileNames:
+            del cachedObjects[staleSourceFileName]
+            self._dirty = True
+
+    def isOutputUpToDate(self, outputKey: str, fingerprint: str) -> bool:
+        entry = self._state[KEY_OUTPUTS].get(outputKey, None)
+        if entry is None or entry['fingerprint'] != fingerprint:
+            return False
+
+        for outputFilePath, outputFileHash in entry['files'].items():
+            if not self._fileSystem.exists(outputFilePath):
+                return False
+            if self._hashFile(outputFilePath) != outputFileHash:
+                return False
+
+        return True
+
+    def storeOutput(self, outputKey: str, fingerprint: str, outputFilePaths: list[str]) -> None:
+        outputFiles = {}
+        for outputFilePath in outputFilePaths:
+            if self._fileSystem.exists(outputFilePath):
+                outputFiles[outputFilePath] = self._hashFile(outputFilePath)
+
+        self._state[KEY_OUTPUTS][outputKey] = {
+            'fingerprint': fingerprint,
+            'files': outputFiles
+        }
+        self._dirty = True
+
+    def _hashFile(self, filePath: str) -> str:
+        return hash_bytes(self._fileSystem.readBytes(filePath))
@@ -1,67 +1,292 @@
 ﻿import os
+import sys
+import time
+from collections import deque
+from typing import Any, Callable, Iterable, Iterator
+from threading import Lock
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 
 from .compiler_asset_provider import CompilerAssetProvider
+from .compiler_hooks import CompilerHooks
+from .compiler_selection import CompilerSelection
+from .compiler_hooks import PHASE_COMPILE, PHASE_PARSE, PHASE_MAKEFILE, PHASE_MAPPING, PHASE_DISCOVERY, PHASE_DEFINITIONS
+from .compiler_hooks import PHASE_PARSE_FILE, PHASE_OUTPUT, PHASE_EXPORT, PHASE_COMMIT, PHASE_PROJECT_WRITE, PHASE_STREAM, PHASE_EXPAND, PHASE_VALIDATE, PHASE_SNIFF
+from .cache.compiler_cache import CompilerCache
+from .filesystem.file_system import FileSystem
 from .helper.vs_project_facade import VsProjectFacade
+from .helper.content_hash import hash_parts
+from .helper.source_buffer_cache import SourceBufferCache
 
 from .model.db import Db
 from .model.makefile_info import MakefileInfo
 from .model.db_mapping import DbMapping
+from .model.db_symbolic_mapping import DbSymbolicMapping
 from .model.db_object import DbObject
 from .model.compiler_output_info import CompilerOutputInfo
+from .model.compiler_variant_info import CompilerVariantInfo
 
 from .parser.makefile_parser import MakefileParser
 from .parser.db_mapping_parser import DbMappingParser
-from .parser.db_object_parser import DbObjectParser
-from .parser.db_object_parser_registry import DbObjectParserRegistry
+from .parser.db_definition_file_parser import DbDefinitionFileParser
 from .parser.source_definition_file_type_sniffer import SourceDefinitionFileTypeSniffer
 
 from .output.output_provider_registry import OutputProviderRegistry
 from .output.output_provider import OutputProvider
 
+from .validation.db_sql_validator import DbSqlValidator
+from .validation.db_validation_error import DbValidationError
+from .validation.db_validation_issue import DbValidationIssue
+
+CACHE_DIRECTORY_NAME = '.skcache'
+
+PendingOutput = tuple[CompilerOutputInfo, OutputProvider]
+ParsedSources = tuple[MakefileInfo, DbMapping, list[str]]
+OutputDbs = dict[str, Db]
+StreamedOutput = tuple[OutputProvider, DbMapping]
+
 class Compiler:
-    _parserRegistry: DbObjectParserRegistry = None
     _outputProviderRegistry: OutputProviderRegistry = None
     _compilerAssetProvider: CompilerAssetProvider = None
-    _sourceDefinitionFileTypeSniffer: SourceDefinitionFileTypeSniffer
+    _vsProjectFacade: VsProjectFacade = None
+    _sourceBufferCache: SourceBufferCache = None
+    _cache: CompilerCache = None
+    _cacheLoaded: bool = False
+    _mappingHash: str = None
+    _sourcesFingerprint: str = None
+    _jobs: int = None
+    _effectiveJobs: int = 1
+    _concurrentOutputs: bool = None
+    _effectiveConcurrentOutputs: bool = False
+    _streaming: bool = None
+    _effectiveStreaming: bool = False
+    _validate: bool = None
+    _effectiveValidate: bool = False
+    _outputStateLock: Lock = None
+    _hooks: CompilerHooks = None
+    _selection: CompilerSelection = None
+    _symbolicMapping: DbSymbolicMapping = None
+    _variants: list[CompilerVariantInfo] = None
+    _variantMappings: dict[str, DbMapping] = None
+    _variantMappingHashes: dict[str, str] = None
+    _watching: bool = False
+    _watchedObjects: dict[str, tuple[str, DbObject]] = None
+    _watchedOutputFingerprints: dict[str, str] = None
 
-    def __init__(self, sourceDirectory: str, solutionRootDirectory: str):
-        vsProjectFacade = VsProjectFacade(solutionRootDirectory)
-        compilerAssetProvider = CompilerAssetProvider(sourceDirectory)
+    def __init__(self, sourceDirectory: str, solutionRootDirectory: str, useCache: bool = True, jobs: int = None, concurrentOutputs: bool = None, hooks: CompilerHooks = None, streaming: bool = None, fileSystem: FileSystem = None, selection: CompilerSelection = None, variants: list[CompilerVariantInfo] = None, validate: bool = None):
+        vsProjectFacade = VsProjectFacade(solutionRootDirectory, fileSystem)
+        sourceBufferCache = SourceBufferCache(fileSystem = fileSystem)
+        compilerAssetProvider = CompilerAssetProvider(sourceDirectory, sourceBufferCache)
 
+        self._sourceBufferCache = sourceBufferCache
+        self._vsProjectFacade = vsProjectFacade
         self._compilerAssetProvider = compilerAssetProvider
         self._outputProviderRegistry = OutputProviderRegistry(vsProjectFacade, compilerAssetProvider)
-        self._sourceDefinitionFileTypeSniffer = SourceDefinitionFileTypeSniffer()
-        self._parserRegistry = DbObjectParserRegistry()
+        self._jobs = jobs
+        self._concurrentOutputs = concurrentOutputs
+        self._outputStateLock = Lock()
+        self._hooks = hooks or CompilerHooks()
+        self._streaming = streaming
+        self._validate = validate
+        self._selection = selection or CompilerSelection()
+        self._symbolicMapping = DbSymbolicMapping()
+        self._variants = variants or []
+        self._variantMappings = {}
+        self._variantMappingHashes = {}
+
+        if useCache:
+            self._cache = CompilerCache(compilerAssetProvider.getSourceFilePath(CACHE_DIRECTORY_NAME), 
+                compilerAssetProvider.getFileSystem())
 
     def compile(self, makefileName: str = 'makefile') -> None:
-        db = self._parse(makefileName)
-        self._output(db)
+        self._sourceBufferCache.clear()
+        self._loadCache()
+
+        try:
+            self._compile(makefileName)
+        finally:
+            self._saveCache()
+            self._sourceBufferCache.clear()
+
+    def recompile(self, changedFilePaths: list[str], makefileName: str = 'makefile') -> None:
+        if not self._cacheLoaded:
+            self._loadCache()
+        if not self._watching:
+            self._beginWatching()
+
+        for changedFilePath in changedFilePaths:
+            self._invalidateSourceFile(changedFilePath)
+
+        try:
+            self._compile(makefileName)
+        finally:
+            self._saveCache()
+
+    def _beginWatching(self) -> None:
+        self._watching = True
+        self._watchedOutputFingerprints = {}
+        if self._cache is None:
+            self._watchedObjects = {}
+
+    def _invalidateSourceFile(self, changedFilePath: str) -> None:
+        if os.path.isdir(changedFilePath):
+            self._sourceBufferCache.clear()
+        else:
+            self._sourceBufferCache.invalidate(changedFilePath)
+
+    def _loadCache(self) -> None:
+        if self._cache is not None:
+            self._cache.load()
+        self._cacheLoaded = True
+
+    def _saveCache(self) -> None:
+        if self._cache is not None:
+            self._cache.save()
+
+    def _compile(self, makefileName: str) -> None:
+        self._runPhase(PHASE_COMPILE, makefileName, 
+            lambda: self._parseAndOutput(makefileName))
+
+    def _parseAndOutput(self, makefileName: str) -> None:
+        parsedSources = self._runPhase(PHASE_PARSE, makefileName, 
+            lambda: self._parseSources(makefileName))
+
+        if self._effectiveStreaming:
+            self._streamOutput(parsedSources)
+        else:
+            makefileInfo = parsedSources[0]
+            selectedOutputs = self._getSelectedOutputs(makefileInfo)
+            readObjects = self._usesDefinitionObjects(selectedOutputs)
+
+            objects = self._runPhase(PHASE_DEFINITIONS, None, 
+                lambda: self._readObjects(parsedSources, readObjects))
+
+            if self._effectiveValidate and readObjects:
+                validationMappings = self._getValidationMappings(selectedOutputs, parsedSources[1])
+                self._runPhase(PHASE_VALIDATE, None, 
+                    lambda: self._validateObjects(objects, validationMappings))
+            self._output(parsedSources, objects, selectedOutputs)
 
-    def _parse(self, makefileName: str) -> Db:
+    def _runPhase(self, phase: str, subject: str, action: Callable[[], Any]) -> Any:
+        self._hooks.beforePhase(phase, subject)
+        try:
+            return action()
+        finally:
+            self._hooks.afterPhase(phase, subject)
+
+    def _parseSources(self, makefileName: str) -> ParsedSources:
         #1 read makefile
-        makefileInfo = self._readMakefile(makefileName)
+        makefileInfo = self._runPhase(PHASE_MAKEFILE, makefileName, 
+            lambda: self._readMakefile(makefileName))
         if not makefileInfo:
             raise ValueError('No contents found in makefile!')
+
+        self._effectiveJobs = self._determineEffectiveJobs(makefileInfo)
+        self._effectiveConcurrentOutputs = self._determineEffectiveConcurrentOutputs(makefileInfo)
+        self._effectiveStreaming = self._determineEffectiveStreaming(makefileInfo)
+        self._effectiveValidate = self._determineEffectiveValidate(makefileInfo)
         
         #2 read mapping file
-        mapping = self._readDbMapping(makefileInfo)
+        mapping = self._runPhase(PHASE_MAPPING, makefileInfo.getMappingFileName(), 
+            lambda: self._readDbMapping(makefileInfo))
         if not mapping:
             raise ValueError('No contents found in mapping file!')
 
+        self._readVariantMappings(makefileInfo, mapping)
+
         #3 discover source files
-        sourceDefinitionFiles = self._discoverSourceDefinitionFiles(makefileInfo)
+        sourceDefinitionFiles = self._runPhase(PHASE_DISCOVERY, makefileInfo.getDefinitionFilesGlob(), 
+            lambda: self._discoverSourceDefinitionFiles(makefileInfo))
         if not sourceDefinitionFiles:
             raise ValueError('No source definition files found!')
 
+        if self._cache is not None:
+            self._cache.retainObjects(sourceDefinitionFiles)
+        if self._watchedObjects is not None:
+            self._retainWatchedObjects(sourceDefinitionFiles)
+
+        return (makefileInfo, mapping, sourceDefinitionFiles)
+
+    def _readObjects(self, parsedSources: ParsedSources, readObjects: bool = True) -> list[DbObject]:
         #4 read and parse source files
-        objects = self._readDefinitionObjects(sourceDefinitionFiles, mapping)
+        makefileInfo, mapping, sourceDefinitionFiles = parsedSources
+        if readObjects:
+            sourceDefinitionFiles = self._selectSourceDefinitionFiles(sourceDefinitionFiles, mapping)
+            return self._readDefinitionObjects(sourceDefinitionFiles)
+        else:
+            return []
 
-        return Db(makefileInfo, 
+    def _createDb(self, makefileInfo: MakefileInfo, mapping: DbMapping, objects: list[DbObject]) -> Db:
+        #5 expand the symbolic objects using the given mapping
+        db = Db(makefileInfo, 
             mapping, 
-            objects)
+            [obj.expandSymbols(mapping) for obj in objects])
+
+        #6 order the objects by their dependencies
+        for cycle in db.getDependencyGraph().getCycles():
+            self._reportWarning('Objects <' + ', '.join([obj.getName() for obj in cycle]) 
+                + '> reference each other; they are written in the default order (sequences, tables, functions) and may fail to apply')
+
+        return db
+
+    def _reportWarning(self, message: str) -> None:
+        print('Warning: ' + message, file = sys.stderr)
+
+    def _determineEffectiveJobs(self, makefileInfo: MakefileInfo) -> int:
+        jobs = self._jobs
+        if jobs is None:
+            jobs = makefileInfo.getJobs()
+        return max(jobs or 1, 1)
+
+    def _determineEffectiveConcurrentOutputs(self, makefileInfo: MakefileInfo) -> bool:
+        concurrentOutputs = self._concurrentOutputs
+        if concurrentOutputs is None:
+            concurrentOutputs = makefileInfo.getConcurrentOutputs()
+        return concurrentOutputs == True
+
+    def _determineEffectiveStreaming(self, makefileInfo: MakefileInfo) -> bool:
+        streaming = self._streaming
+        if streaming is None:
+            streaming = makefileInfo.getStreaming()
+        return streaming == True
+
+    def _determineEffectiveValidate(self, makefileInfo: MakefileInfo) -> bool:
+        validate = self._validate
+        if validate is None:
+            validate = makefileInfo.getValidate()
+        return validate == True
+
+    def _getValidationMappings(self, selectedOutputs: list[PendingOutput], mapping: DbMapping) -> list[DbMapping]:
+        validationMappings: list[DbMapping] = []
+
+        for outputInfo, outputProvider in selectedOutputs:
+            if not outputProvider.usesDefinitionObjects():
+                continue
+
+            outputMapping = self._getOutputMapping(outputInfo, mapping)
+            if not any(validationMapping is outputMapping for validationMapping in validationMappings):
+                validationMappings.append(outputMapping)
+
+        return validationMappings
+
+    def _validateObjects(self, objects: Iterable[DbObject], validationMappings: list[DbMapping]) -> None:
+        validators = [(DbSqlValidator(self._compilerAssetProvider, validationMapping), validationMapping) 
+            for validationMapping in validationMappings]
+        issues: list[DbValidationIssue] = []
+
+        for obj in objects:
+            for validator, validationMapping in validators:
+                issue = validator.validateObject(obj.expandSymbols(validationMapping))
+                if issue is not None:
+                    issues.append(issue)
+                    break
+
+        if issues:
+            raise DbValidationError(issues)
 
     def _readMakefile(self, makefileName: str) -> MakefileInfo:
-        makefileParser = MakefileParser()
+        makefileParser = MakefileParser(self._sourceBufferCache)
         makefilePath = self._getSourceFilePath(makefileName)
         return makefileParser.parse(makefilePath)
 
@@ -73,10 +298,54 @@ class Compiler:
         if not mappingFileName:
             raise ValueError('Mapping file expected but not specified!')
 
-        mappingParser = DbMappingParser()
+        mappingParser = DbMappingParser(self._sourceBufferCache)
         mappingFilePath = self._getSourceFilePath(mappingFileName)
+        self._mappingHash = self._getSourceFileHash(mappingFileName)
         return mappingParser.parse(mappingFilePath)
 
+    def _getSourceFileHash(self, fileName: str) -> str:
+        return self._compilerAssetProvider.getSourceFileHash(fileName)
+
+    def _readVariantMappings(self, makefileInfo: MakefileInfo, mapping: DbMapping) -> None:
+        self._variantMappings = {}
+        self._variantMappingHashes = {}
+
+        for variant in self._getVariants(makefileInfo):
+            variantName = variant.getName()
+            if variantName in self._variantMappings:
+                raise ValueError('Duplicate variant <' + variantName + '>')
+
+            variantMapping = mapping
+            variantMappingHash = self._mappingHash or ''
+
+            if variant.hasMappingFileName():
+                variantMapping = self._runPhase(PHASE_MAPPING, variant.getMappingFileName(), 
+                    lambda: self._readVariantMapping(variant))
+                variantMappingHash = self._getSourceFileHash(variant.getMappingFileName())
+
+            self._variantMappings[variantName] = variantMapping.withPrefix(variant.getPrefix())
+            self._variantMappingHashes[variantName] = hash_parts([variantMappingHash, variant.getSignature()])
+
+        if self._variantMappings and not self._hasVariantOutputs(makefileInfo):
+            self._reportWarning('Variants <' + ', '.join(self._variantMappings.keys()) 
+                + '> are ignored, since no output routine has the variants=true argument')
+
+    def _hasVariantOutputs(self, makefileInfo: MakefileInfo) -> bool:
+        return any(outputInfo.isVariantOutput() for outputInfo in makefileInfo.getOutputs() or [])
+
+    def _getVariants(self, makefileInfo: MakefileInfo) -> list[CompilerVariantInfo]:
+        return makefileInfo.getVariants() + self._variants
+
+    def _readVariantMapping(self, variant: CompilerVariantInfo) -> DbMapping:
+        mappingParser = DbMappingParser(self._sourceBufferCache)
+        mappingFilePath = self._getSourceFilePath(variant.getMappingFileName())
+
+        variantMapping = mappingParser.parse(mappingFilePath)
+        if not variantMapping:
+            raise ValueError('No contents found in mapping file for variant <' + variant.getName() + '>')
+
+        return variantMapping
+
     def _discoverSourceDefinitionFiles(self, makefileInfo: MakefileInfo) -> list[str]:
         pattern = makefileInfo.getDefinitionFilesGlob()
         if not pattern:
@@ -84,45 +353,447 @@ class Compiler:
 
         return self._compilerAssetProvider.discoverFilesByPattern(pattern)
 
-    def _readDefinitionObjects(self, sourceDefinitionFiles: list[str], mapping: DbMapping) -> list[DbObject]:
-        objects = []
+    def _selectSourceDefinitionFiles(self, sourceDefinitionFiles: list[str], mapping: DbMapping) -> list[str]:
+        if not self._selection.hasObjectPatterns():
+            return sourceDefinitionFiles
+
+        return self._runPhase(PHASE_SNIFF, None, 
+            lambda: self._sniffSelectedSourceDefinitionFiles(sourceDefinitionFiles, mapping))
+
+    def _sniffSelectedSourceDefinitionFiles(self, sourceDefinitionFiles: list[str], mapping: DbMapping) -> list[str]:
+        sourceDefinitionFileTypeSniffer = SourceDefinitionFileTypeSniffer(self._sourceBufferCache)
+        selectedSourceDefinitionFiles: list[str] = []
 
         for sourceDefinitionFile in sourceDefinitionFiles:
             sourceDefinitionFilePath = self._getSourceFilePath(sourceDefinitionFile)
-            
-            objectType = self._readDefinitionFileObjectType(sourceDefinitionFilePath)
-            if not sourceDefinitionFilePath:
-                raise ValueError('No object type found in definition file <' + sourceDefinitionFile + '>')
+            objectName = mapping.expandString(sourceDefinitionFileTypeSniffer.readName(sourceDefinitionFilePath))
+
+            if self._selection.isObjectSelected(objectName):
+                selectedSourceDefinitionFiles.append(sourceDefinitionFile)
+            else:
+                self._sourceBufferCache.invalidate(sourceDefinitionFilePath)
 
-            objectParser = self._getParser(objectType, mapping)
-            if not objectParser:
-                raise ValueError('Invalid object type <' + objectType + '> found in definition file <' + sourceDefinitionFile + '>')
+        if not selectedSourceDefinitionFiles:
+            raise ValueError('No source definition files found for objects <' + ', '.join(self._selection.getObjectPatterns()) + '>')
 
-            obj = objectParser.parseFromFile(sourceDefinitionFilePath)
-            if not obj:
-                raise ValueError('Failed to parse definition file <' + sourceDefinitionFile + '>')
+        return selectedSourceDefinitionFiles
 
-            objects.append(obj)
+    def _createSourceHashParts(self) -> list[str]:
+        sourceHashParts = [self._mappingHash or '']
+        selectionFingerprintPart = self._selection.getFingerprintPart()
+        if selectionFingerprintPart is not None:
+            sourceHashParts.append(selectionFingerprintPart)
+        return sourceHashParts
 
+    def _readDefinitionObjects(self, sourceDefinitionFiles: list[str]) -> list[DbObject]:
+        objects: list[DbObject] = [None] * len(sourceDefinitionFiles)
+        sourceHashes: list[str] = [None] * len(sourceDefinitionFiles)
+        sourceHashParts = self._createSourceHashParts()
+        parseIndexes: list[int] = []
+
+        for index, sourceDefinitionFile in enumerate(sourceDefinitionFiles):
+            sourceHash = self._getSourceFileHash(sourceDefinitionFile)
+            sourceHashParts.append(sourceDefinitionFile + ':' + sourceHash)
+            sourceHashes[index] = sourceHash
+
+            obj = self._readCachedDefinitionObject(sourceDefinitionFile, sourceHash)
+            if obj is not None:
+                objects[index] = obj
+            else:
+                parseIndexes.append(index)
+
+        parseSourceDefinitionFiles = [sourceDefinitionFiles[index] for index in parseIndexes]
+        parsedObjects = self._parseDefinitionFiles(parseSourceDefinitionFiles)
+
+        for index, obj in zip(parseIndexes, parsedObjects):
+            self._storeCachedDefinitionObject(sourceDefinitionFiles[index], sourceHashes[index], obj)
+            objects[index] = obj
+
+        self._sourcesFingerprint = hash_parts(sourceHashParts)
         return objects
 
-    def _readDefinitionFileObjectType(self, sourceDefinitionFilePath: str) -> str:
-       return self._sourceDefinitionFileTypeSniffer.readType(sourceDefinitionFilePath)
+    def _readCachedDefinitionObject(self, sourceDefinitionFile: str, sourceHash: str) -> DbObject:
+        wallStart = time.perf_counter()
+        cpuStart = time.thread_time()
+
+        obj = self._getCachedDefinitionObject(sourceDefinitionFile, sourceHash)
+        if obj is not None:
+            self._hooks.recordPhase(PHASE_PARSE_FILE, 
+                sourceDefinitionFile, 
+                time.perf_counter() - wallStart, 
+                time.thread_time() - cpuStart)
+
+        return obj
+
+    def _getCachedDefinitionObject(self, sourceDefinitionFile: str, sourceHash: str) -> DbObject:
+        if self._cache is not None:
+            return self._cache.getObject(sourceDefinitionFile, sourceHash)
+        elif self._watchedObjects is not None:
+            return self._getWatchedObject(sourceDefinitionFile, sourceHash)
+        else:
+            return None
+
+    def _getWatchedObject(self, sourceDefinitionFile: str, sourceHash: str) -> DbObject:
+        watchedObject = self._watchedObjects.get(sourceDefinitionFile, None)
+        if watchedObject is None or watchedObject[0] != sourceHash:
+            return None
+        return watchedObject[1]
+
+    def _storeCachedDefinitionObject(self, sourceDefinitionFile: str, sourceHash: str, obj: DbObject) -> None:
+        if self._cache is not None:
+            self._cache.storeObject(sourceDefinitionFile, sourceHash, obj)
+        elif self._watchedObjects is not None:
+            self._watchedObjects[sourceDefinitionFile] = (sourceHash, obj)
+
+    def _retainWatchedObjects(self, sourceDefinitionFiles: list[str]) -> None:
+        retainedSourceDefinitionFiles = set(sourceDefinitionFiles)
+        self._watchedObjects = { sourceDefinitionFile: watchedObject 
+            for sourceDefinitionFile, watchedObject in self._watchedObjects.items() 
+                if sourceDefinitionFile in retainedSourceDefinitionFiles }
+
+    def _parseDefinitionFiles(self, sourceDefinitionFiles: list[str]) -> list[DbObject]:
+        definitionFileParser = DbDefinitionFileParser(self._symbolicMapping, self._sourceBufferCache)
+        sourceDefinitionFilePaths = [self._getSourceFilePath(sourceDefinitionFile) 
+            for sourceDefinitionFile in sourceDefinitionFiles]
+
+        jobs = min(self._effectiveJobs, len(sourceDefinitionFiles))
+        if jobs <= 1:
+            return [self._runPhase(PHASE_PARSE_FILE, sourceDefinitionFile, 
+                    lambda: definitionFileParser.parse(sourceDefinitionFile, sourceDefinitionFilePath)) 
+                for sourceDefinitionFile, sourceDefinitionFilePath in zip(sourceDefinitionFiles, sourceDefinitionFilePaths)]
+
+        sourceDefinitionFileBuffers = [self._compilerAssetProvider.getSourceFileBuffer(sourceDefinitionFile) 
+            for sourceDefinitionFile in sourceDefinitionFiles]
+
+        chunkSize = max(len(sourceDefinitionFiles) // (jobs * 4), 1)
+        with ProcessPoolExecutor(max_workers = jobs) as executor:
+            parsedObjects = [self._recordParsedObjectTimings(sourceDefinitionFile, parseResult) 
+                for sourceDefinitionFile, parseResult in zip(sourceDefinitionFiles, 
+                    executor.map(definitionFileParser.parseWithTimings, 
+                        sourceDefinitionFiles, 
+                        sourceDefinitionFilePaths, 
+                        sourceDefinitionFileBuffers,
+                        chunksize = chunkSize))]
+
+        for sourceDefinitionFilePath in sourceDefinitionFilePaths:
+            self._sourceBufferCache.invalidate(sourceDefinitionFilePath)
+
+        return parsedObjects
 
-    def _getParser(self, objectType: str, mapping: DbMapping) -> DbObjectParser:
-        return self._parserRegistry.createParser(objectType, mapping)
+    def _recordParsedObjectTimings(self, sourceDefinitionFile: str, parseResult: tuple[DbObject, float, float]) -> DbObject:
+        obj, wallTime, cpuTime = parseResult
+        self._hooks.recordPhase(PHASE_PARSE_FILE, sourceDefinitionFile, wallTime, cpuTime)
+        return obj
 
-    def _output(self, db: Db) -> None:
-        outputs = db.getOutputs()
+    def _output(self, parsedSources: ParsedSources, objects: list[DbObject], selectedOutputs: list[PendingOutput]) -> None:
+        self._runPhase(PHASE_OUTPUT, None, 
+            lambda: self._exportOutputs(parsedSources, objects, selectedOutputs))
+
+    def _exportOutputs(self, parsedSources: ParsedSources, objects: list[DbObject], selectedOutputs: list[PendingOutput]) -> None:
+        pendingOutputs = self._getPendingOutputs(selectedOutputs)
+        outputDbs = self._createOutputDbs(parsedSources, objects, pendingOutputs)
+
+        self._vsProjectFacade.beginSession()
+        try:
+            if self._effectiveConcurrentOutputs and len(pendingOutputs) > 1:
+                self._exportOutputsConcurrently(outputDbs, pendingOutputs)
+            else:
+                self._exportOutputGroup(outputDbs, pendingOutputs)
+        finally:
+            self._runPhase(PHASE_PROJECT_WRITE, None, 
+                self._vsProjectFacade.endSession)
+
+    def _createOutputDbs(self, parsedSources: ParsedSources, objects: list[DbObject], pendingOutputs: list[PendingOutput]) -> OutputDbs:
+        makefileInfo, mapping, sourceDefinitionFiles = parsedSources
+        outputDbs: OutputDbs = {}
+
+        for outputInfo, outputProvider in pendingOutputs:
+            variantName = self._getOutputVariantName(outputInfo)
+            if variantName not in outputDbs:
+                outputMapping = self._getOutputMapping(outputInfo, mapping)
+                outputDbs[variantName] = self._runPhase(PHASE_EXPAND, variantName, 
+                    lambda: self._createDb(makefileInfo, outputMapping, objects))
+
+        return outputDbs
+
+    def _getOutputVariantName(self, outputInfo: CompilerOutputInfo) -> str:
+        variant = outputInfo.getVariant()
+        if variant is not None:
+            return variant.getName()
+        else:
+            return None
+
+    def _getOutputMapping(self, outputInfo: CompilerOutputInfo, mapping: DbMapping) -> DbMapping:
+        variantName = self._getOutputVariantName(outputInfo)
+        if variantName is not None:
+            return self._variantMappings[variantName]
+        else:
+            return mapping
+
+    def _expandVariantOutputs(self, outputs: list[CompilerOutputInfo], variants: list[CompilerVariantInfo]) -> list[CompilerOutputInfo]:
+        expandedOutputs: list[CompilerOutputInfo] = []
+
+        for outputInfo in outputs:
+            if outputInfo.isVariantOutput():
+                for variant in variants:
+                    expandedOutputs.append(outputInfo.createForVariant(variant))
+            else:
+                expandedOutputs.append(outputInfo)
+
+        return expandedOutputs
+
+    def _getSelectedOutputs(self, makefileInfo: MakefileInfo) -> list[PendingOutput]:
+        outputs = makefileInfo.getOutputs()
         if not outputs:
             raise ValueError('No output types provided!')
 
+        outputs = self._expandVariantOutputs(outputs, self._getVariants(makefileInfo))
+
+        outputNames = [outputInfo.getName() for outputInfo in outputs]
+        for selectedOutputName in self._selection.getOutputNames():
+            if selectedOutputName not in outputNames:
+                raise ValueError('Output <' + selectedOutputName + '> not found in makefile')
+
+        selectedOutputs: list[PendingOutput] = []
+
         for outputInfo in outputs:
+            if not self._selection.isOutputSelected(outputInfo):
+                continue
+
             outputProvider = self._getOutputProvider(outputInfo)
             if not outputProvider:
                 raise ValueError('Invalid output type <' + outputInfo.getName() + '>')
 
-            outputProvider.export(db)
+            if self._selection.hasObjectPatterns() and not self._supportsObjectSelection(outputProvider):
+                raise ValueError('Output <' + outputInfo.getName() + '> writes all the database objects at once and cannot be run with --objects; use --only-output to select the output routines to run')
+
+            selectedOutputs.append((outputInfo, outputProvider))
+
+        return selectedOutputs
+
+    def _supportsObjectSelection(self, outputProvider: OutputProvider) -> bool:
+        return not outputProvider.usesDefinitionObjects() or outputProvider.supportsObjectSelection()
+
+    def _usesDefinitionObjects(self, selectedOutputs: list[PendingOutput]) -> bool:
+        return any(outputProvider.usesDefinitionObjects() 
+            for outputInfo, outputProvider in selectedOutputs)
+
+    def _getPendingOutputs(self, selectedOutputs: list[PendingOutput]) -> list[PendingOutput]:
+        return [(outputInfo, outputProvider) for outputInfo, outputProvider in selectedOutputs 
+            if not self._isOutputUpToDate(outputInfo, outputProvider)]
+
+    def _streamOutput(self, parsedSources: ParsedSources) -> None:
+        self._runPhase(PHASE_OUTPUT, None, 
+            lambda: self._streamOutputs(parsedSources))
+
+    def _streamOutputs(self, parsedSources: ParsedSources) -> None:
+        makefileInfo, mapping, sourceDefinitionFiles = parsedSources
+        selectedOutputs = self._getSelectedOutputs(makefileInfo)
+        if self._usesDefinitionObjects(selectedOutputs):
+            sourceDefinitionFiles = self._selectSourceDefinitionFiles(sourceDefinitionFiles, mapping)
+
+        sourceDefinitionFiles = self._runPhase(PHASE_SNIFF, None, 
+            lambda: self._orderSourceDefinitionFilesForStreaming(sourceDefinitionFiles))
+        pendingOutputs = self._getPendingOutputs(selectedOutputs)
+
+        if self._effectiveValidate and self._usesDefinitionObjects(pendingOutputs):
+            validationMappings = self._getValidationMappings(pendingOutputs, mapping)
+            self._runPhase(PHASE_VALIDATE, None, 
+                lambda: self._validateObjects(self._streamDefinitionObjects(sourceDefinitionFiles), validationMappings))
+
+        self._vsProjectFacade.beginSession()
+        try:
+            self._streamToOutputs(mapping, sourceDefinitionFiles, pendingOutputs)
+        finally:
+            self._runPhase(PHASE_PROJECT_WRITE, None, 
+                self._vsProjectFacade.endSession)
+
+    def _orderSourceDefinitionFilesForStreaming(self, sourceDefinitionFiles: list[str]) -> list[str]:
+        sourceDefinitionFileTypeSniffer = SourceDefinitionFileTypeSniffer(self._sourceBufferCache)
+        objectTypeOrder = Db.getObjectTypeOrder()
+        sourceDefinitionFileRanks: dict[str, int] = {}
+        sourceHashParts = self._createSourceHashParts()
+
+        for sourceDefinitionFile in sourceDefinitionFiles:
+            sourceDefinitionFilePath = self._getSourceFilePath(sourceDefinitionFile)
+            sourceHash = self._getSourceFileHash(sourceDefinitionFile)
+            sourceHashParts.append(sourceDefinitionFile + ':' + sourceHash)
+
+            objectType = sourceDefinitionFileTypeSniffer.readType(sourceDefinitionFilePath)
+            if objectType in objectTypeOrder:
+                sourceDefinitionFileRanks[sourceDefinitionFile] = objectTypeOrder.index(objectType)
+            else:
+                sourceDefinitionFileRanks[sourceDefinitionFile] = len(objectTypeOrder)
+
+            self._sourceBufferCache.invalidate(sourceDefinitionFilePath)
+
+        self._sourcesFingerprint = hash_parts(sourceHashParts)
+        return sorted(sourceDefinitionFiles, 
+            key = lambda sourceDefinitionFile: sourceDefinitionFileRanks[sourceDefinitionFile])
+
+    def _streamToOutputs(self, mapping: DbMapping, sourceDefinitionFiles: list[str], pendingOutputs: list[PendingOutput]) -> None:
+        outputProviders = [outputProvider for outputInfo, outputProvider in pendingOutputs]
+        streamedOutputs: list[StreamedOutput] = [(outputProvider, self._getOutputMapping(outputInfo, mapping)) 
+            for outputInfo, outputProvider in pendingOutputs]
+
+        try:
+            for outputProvider, outputMapping in streamedOutputs:
+                outputProvider.beginStream()
+                outputProvider.writeMapping(outputMapping)
+
+            if any(outputProvider.usesDefinitionObjects() for outputProvider in outputProviders):
+                self._runPhase(PHASE_STREAM, None, 
+                    lambda: self._streamObjectsToOutputs(sourceDefinitionFiles, streamedOutputs))
+
+            for outputInfo, outputProvider in pendingOutputs:
+                self._runPhase(PHASE_COMMIT, outputInfo.getSignature(), 
+                    outputProvider.commit)
+                self._storeOutputState(outputInfo, outputProvider)
+        except BaseException:
+            for outputProvider in outputProviders:
+                outputProvider.abortStream()
+            raise
+
+    def _streamObjectsToOutputs(self, sourceDefinitionFiles: list[str], streamedOutputs: list[StreamedOutput]) -> None:
+        for obj in self._streamDefinitionObjects(sourceDefinitionFiles):
+            expandedObjects: dict[int, DbObject] = {}
+            for outputProvider, outputMapping in streamedOutputs:
+                expandedObject = expandedObjects.get(id(outputMapping), None)
+                if expandedObject is None:
+                    expandedObject = obj.expandSymbols(outputMapping)
+                    expandedObjects[id(outputMapping)] = expandedObject
+                outputProvider.writeObject(expandedObject)
+
+    def _streamDefinitionObjects(self, sourceDefinitionFiles: list[str]) -> Iterator[DbObject]:
+        definitionFileParser = DbDefinitionFileParser(self._symbolicMapping, self._sourceBufferCache)
+        jobs = min(self._effectiveJobs, len(sourceDefinitionFiles))
+
+        if jobs <= 1:
+            for sourceDefinitionFile in sourceDefinitionFiles:
+                yield self._runPhase(PHASE_PARSE_FILE, sourceDefinitionFile, 
+                    lambda: self._readStreamedDefinitionObject(definitionFileParser, sourceDefinitionFile))
+            return
+
+        pendingObjects: deque[DbObject | Future] = deque()
+        maxPendingObjects = jobs * 2
+
+        with ProcessPoolExecutor(max_workers = jobs) as executor:
+            for sourceDefinitionFile in sourceDefinitionFiles:
+                pendingObjects.append(self._submitStreamedDefinitionObject(executor, definitionFileParser, sourceDefinitionFile))
+                if len(pendingObjects) >= maxPendingObjects:
+                    yield self._resolvePendingObject(pendingObjects.popleft())
+
+            while len(pendingObjects) > 0:
+                yield self._resolvePendingObject(pendingObjects.popleft())
+
+    def _readStreamedDefinitionObject(self, definitionFileParser: DbDefinitionFileParser, sourceDefinitionFile: str) -> DbObject:
+        sourceDefinitionFilePath = self._getSourceFilePath(sourceDefinitionFile)
+        sourceHash = self._getSourceFileHash(sourceDefinitionFile)
+
+        obj = self._getCachedDefinitionObject(sourceDefinitionFile, sourceHash)
+        if obj is not None:
+            self._sourceBufferCache.invalidate(sourceDefinitionFilePath)
+            return obj
+
+        return definitionFileParser.parse(sourceDefinitionFile, sourceDefinitionFilePath)
+
+    def _submitStreamedDefinitionObject(self, executor: ProcessPoolExecutor, definitionFileParser: DbDefinitionFileParser, sourceDefinitionFile: str) -> DbObject | Future:
+        sourceDefinitionFilePath = self._getSourceFilePath(sourceDefinitionFile)
+        sourceBuffer = self._compilerAssetProvider.getSourceFileBuffer(sourceDefinitionFile)
+        self._sourceBufferCache.invalidate(sourceDefinitionFilePath)
+
+        obj = self._readCachedDefinitionObject(sourceDefinitionFile, sourceBuffer.getContentsHash())
+        if obj is not None:
+            return obj
+
+        return executor.submit(definitionFileParser.parseWithTimings, 
+            sourceDefinitionFile, 
+            sourceDefinitionFilePath, 
+            sourceBuffer)
+
+    def _resolvePendingObject(self, pendingObject: DbObject | Future) -> DbObject:
+        if isinstance(pendingObject, Future):
+            parseResult = pendingObject.result()
+            return self._recordParsedObjectTimings(parseResult[0].getSourceFile(), parseResult)
+        else:
+            return pendingObject
+
+    def _exportOutputsConcurrently(self, outputDbs: OutputDbs, pendingOutputs: list[PendingOutput]) -> None:
+        outputGroups = self._groupOutputsByConcurrencyGroup(pendingOutputs)
+
+        with ThreadPoolExecutor(max_workers = len(outputGroups)) as executor:
+            futures = [executor.submit(self._exportOutputGroup, outputDbs, outputGroup) 
+                for outputGroup in outputGroups]
+
+            for future in futures:
+                future.result()
+
+    def _groupOutputsByConcurrencyGroup(self, pendingOutputs: list[PendingOutput]) -> list[list[PendingOutput]]:
+        outputGroups: list[list[PendingOutput]] = []
+        outputGroupsByKey: dict[str, list[PendingOutput]] = {}
+
+        for pendingOutput in pendingOutputs:
+            concurrencyGroup = pendingOutput[1].getConcurrencyGroup()
+            outputGroup = outputGroupsByKey.get(concurrencyGroup, None) if concurrencyGroup is not None else None
+
+            if outputGroup is None:
+                outputGroup = []
+                outputGroups.append(outputGroup)
+                if concurrencyGroup is not None:
+                    outputGroupsByKey[concurrencyGroup] = outputGroup
+
+            outputGroup.append(pendingOutput)
+
+        return outputGroups
+
+    def _exportOutputGroup(self, outputDbs: OutputDbs, outputGroup: list[PendingOutput]) -> None:
+        for outputInfo, outputProvider in outputGroup:
+            db = outputDbs[self._getOutputVariantName(outputInfo)]
+            outputSignature = outputInfo.getSignature()
+            self._runPhase(PHASE_EXPORT, outputSignature, 
+                lambda: outputProvider.writeObjects(db))
+            self._runPhase(PHASE_COMMIT, outputSignature, 
+                outputProvider.commit)
+            self._storeOutputState(outputInfo, outputProvider)
+
+    def _isOutputUpToDate(self, outputInfo: CompilerOutputInfo, outputProvider: OutputProvider) -> bool:
+        if self._cache is not None and outputProvider.isCacheable():
+            outputFingerprint = self._getOutputFingerprint(outputInfo, outputProvider)
+            return self._cache.isOutputUpToDate(outputInfo.getSignature(), outputFingerprint)
+
+        if self._watchedOutputFingerprints is not None:
+            outputFingerprint = self._getOutputFingerprint(outputInfo, outputProvider)
+            return self._watchedOutputFingerprints.get(outputInfo.getSignature(), None) == outputFingerprint
+
+        return False
+
+    def _storeOutputState(self, outputInfo: CompilerOutputInfo, outputProvider: OutputProvider) -> None:
+        if self._cache is not None and outputProvider.isCacheable():
+            outputFingerprint = self._getOutputFingerprint(outputInfo, outputProvider)
+            with self._outputStateLock:
+                self._cache.storeOutput(outputInfo.getSignature(), 
+                    outputFingerprint, 
+                    outputProvider.getOutputFiles())
+        elif self._watchedOutputFingerprints is not None:
+            outputFingerprint = self._getOutputFingerprint(outputInfo, outputProvider)
+            with self._outputStateLock:
+                self._watchedOutputFingerprints[outputInfo.getSignature()] = outputFingerprint
+
+    def _getOutputFingerprint(self, outputInfo: CompilerOutputInfo, outputProvider: OutputProvider) -> str:
+        if outputProvider.usesDefinitionObjects():
+            fingerprintParts = [outputInfo.getSignature(), self._sourcesFingerprint or '']
+        else:
+            fingerprintParts = [outputInfo.getSignature(), self._mappingHash or '']
+
+        variantName = self._getOutputVariantName(outputInfo)
+        if variantName is not None:
+            fingerprintParts.append(self._variantMappingHashes[variantName])
+
+        for assetFileName in outputProvider.getSourceAssetDependencies():
+            assetHash = self._getSourceFileHash(assetFileName) or ''
+            fingerprintParts.append(assetFileName + ':' + assetHash)
+
+        return hash_parts(fingerprintParts)
 
     def _getOutputProvider(self, outputInfo: CompilerOutputInfo) -> OutputProvider:
         return self._outputProviderRegistry.createOutputProvider(outputInfo)
\ No newline at end of file
@@ -1,35 +1,54 @@
 ﻿import os
-import glob
+from .filesystem.file_system import FileSystem
 from .helper.path_resolver import PathResolver
+from .helper.source_buffer_cache import SourceBuffer
+from .helper.source_buffer_cache import SourceBufferCache
 
 class CompilerAssetProvider:
     _pathResolver: PathResolver = None
+    _sourceBufferCache: SourceBufferCache = None
     
-    def __init__(self, sourceDirectory: str) -> None:
+    def __init__(self, sourceDirectory: str, sourceBufferCache: SourceBufferCache = None) -> None:
         self._pathResolver = PathResolver(sourceDirectory)
+        self._sourceBufferCache = sourceBufferCache or SourceBufferCache()
+
+    def getFileSystem(self) -> FileSystem:
+        return self._sourceBufferCache.getFileSystem()
 
     def sourceFileExists(self, relativeFilePath: str) -> bool:
         absoluteFilePath = self.getSourceFilePath(relativeFilePath)
-        return os.path.exists(absoluteFilePath)
+        return self._sourceBufferCache.exists(absoluteFilePath)
 
     def getSourceFileContents(self, relativeFilePath: str) -> str:
         absoluteFilePath = self.getSourceFilePath(relativeFilePath)
 
-        if os.path.exists(absoluteFilePath):
-            filePointer = open(absoluteFilePath, 'r', encoding = 'utf_8_sig')
-            fileContents = filePointer.read()
-            filePointer.close()
+        if self._sourceBufferCache.exists(absoluteFilePath):
+            fileContents = self._sourceBufferCache.getContents(absoluteFilePath)
         else:
             fileContents = None
 
         return fileContents
 
+    def getSourceFileHash(self, relativeFilePath: str) -> str:
+        absoluteFilePath = self.getSourceFilePath(relativeFilePath)
+
+        if self._sourceBufferCache.exists(absoluteFilePath):
+            fileHash = self._sourceBufferCache.getContentsHash(absoluteFilePath)
+        else:
+            fileHash = None
+
+        return fileHash
+
+    def getSourceFileBuffer(self, relativeFilePath: str) -> SourceBuffer:
+        absoluteFilePath = self.getSourceFilePath(relativeFilePath)
+        return self._sourceBufferCache.getBuffer(absoluteFilePath)
+
     def getSourceFilePath(self, relativeFilePath: str) -> str:
         return self._pathResolver.resolvePath(relativeFilePath)
 
     def discoverFilesByPattern(self, pattern: str) -> list[str]:
         fileNames = []
         searchPath = self._pathResolver.resolvePath(pattern)
-        foundFiles = glob.glob(searchPath)
+        foundFiles = self.getFileSystem().findFiles(searchPath)
         fileNames = map(lambda foundFile: os.path.basename(foundFile), foundFiles)
         return list(fileNames)
\ No newline at end of file
@@ -0,0 +1,25 @@
+﻿PHASE_COMPILE = 'compile'
+PHASE_PARSE = 'parse'
+PHASE_MAKEFILE = 'makefile'
+PHASE_MAPPING = 'mapping'
+PHASE_DISCOVERY = 'discovery'
+PHASE_DEFINITIONS = 'definitions'
+PHASE_PARSE_FILE = 'parse_file'
+PHASE_OUTPUT = 'output'
+PHASE_EXPORT = 'export'
+PHASE_COMMIT = 'commit'
+PHASE_PROJECT_WRITE = 'project_write'
+PHASE_STREAM = 'stream'
+PHASE_EXPAND = 'expand'
+PHASE_VALIDATE = 'validate'
+PHASE_SNIFF = 'sniff'
+
+class CompilerHooks:
+    def beforePhase(self, phase: str, subject: str = None) -> None:
+        pass
+
+    def afterPhase(self, phase: str, subject: str = None) -> None:
+        pass
+
+    def recordPhase(self, phase: str, subject: str, wallTime: float, cpuTime: float) -> None:
+        pass
@@ -0,0 +1,53 @@
+﻿from fnmatch import fnmatchcase
+from .model.compiler_output_info import CompilerOutputInfo
+
+class CompilerSelection:
+    _outputNames: list[str] = None
+    _objectPatterns: list[str] = None
+
+    def __init__(self, outputNames: list[str] = None, objectPatterns: list[str] = None) -> None:
+        self._outputNames = self._normalizeValues(outputNames)
+        self._objectPatterns = self._normalizeValues(objectPatterns)
+
+    def _normalizeValues(self, values: list[str]) -> list[str]:
+        normalizedValues = []
+        for value in values or []:
+            for valuePart in value.split(','):
+                valuePart = valuePart.strip()
+                if len(valuePart) > 0 and valuePart not in normalizedValues:
+                    normalizedValues.append(valuePart)
+        return normalizedValues
+
+    def getOutputNames(self) -> list[str]:
+        return self._outputNames
+
+    def getObjectPatterns(self) -> list[str]:
+        return self._objectPatterns
+
+    def hasOutputNames(self) -> bool:
+        return len(self._outputNames) > 0
+
+    def hasObjectPatterns(self) -> bool:
+        return len(self._objectPatterns) > 0
+
+    def isOutputSelected(self, outputInfo: CompilerOutputInfo) -> bool:
+        return not self.hasOutputNames() or outputInfo.getName() in self._outputNames
+
+    def isObjectSelected(self, objectName: str) -> bool:
+        if not self.hasObjectPatterns():
+            return True
+
+        if not objectName:
+            return False
+
+        return any(fnmatchcase(objectName, objectPattern) 
+            for objectPattern in self._objectPatterns)
+
+    def getFingerprintPart(self) -> str:
+        if self.hasObjectPatterns():
+            return 'objects:' + ','.join(self._objectPatterns)
+        else:
+            return None
+
+    def __str__(self) -> str:
+        return "{outputs: %s, objects: %s}" % (self._outputNames, self._objectPatterns)
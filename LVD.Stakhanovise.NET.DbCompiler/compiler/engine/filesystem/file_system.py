@@ -0,0 +1,81 @@
+﻿from abc import ABC, abstractmethod
+
+class FileWriter(ABC):
+    @abstractmethod
+    def write(self, contents: str) -> None:
+        pass
+
+    @abstractmethod
+    def close(self) -> bool:
+        pass
+
+    @abstractmethod
+    def discard(self) -> None:
+        pass
+
+    @abstractmethod
+    def getFilePath(self) -> str:
+        pass
+
+class FileSystem(ABC):
+    def isLocal(self) -> bool:
+        return False
+
+    @abstractmethod
+    def exists(self, path: str) -> bool:
+        pass
+
+    @abstractmethod
+    def isFile(self, path: str) -> bool:
+        pass
+
+    @abstractmethod
+    def isDirectory(self, path: str) -> bool:
+        pass
+
+    @abstractmethod
+    def getSize(self, filePath: str) -> int:
+        pass
+
+    @abstractmethod
+    def readBytes(self, filePath: str) -> bytes:
+        pass
+
+    @abstractmethod
+    def writeBytes(self, filePath: str, fileContents: bytes) -> None:
+        pass
+
+    def contentsEqual(self, filePath: str, fileContents: bytes) -> bool:
+        try:
+            if self.getSize(filePath) != len(fileContents):
+                return False
+            return self.readBytes(filePath) == fileContents
+        except OSError:
+            return False
+
+    def writeBytesIfChanged(self, filePath: str, fileContents: bytes) -> bool:
+        if self.contentsEqual(filePath, fileContents):
+            return False
+
+        self.writeBytes(filePath, fileContents)
+        return True
+
+    @abstractmethod
+    def openWriter(self, filePath: str) -> FileWriter:
+        pass
+
+    @abstractmethod
+    def remove(self, filePath: str) -> None:
+        pass
+
+    @abstractmethod
+    def makeDirectory(self, directoryPath: str) -> None:
+        pass
+
+    @abstractmethod
+    def makeDirectories(self, directoryPath: str) -> None:
+        pass
+
+    @abstractmethod
+    def findFiles(self, pattern: str) -> list[str]:
+        pass
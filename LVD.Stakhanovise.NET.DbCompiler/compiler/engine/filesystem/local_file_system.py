@@ -0,0 +1,52 @@
+﻿import os
+import glob
+
+from .file_system import FileSystem
+from .file_system import FileWriter
+from ..helper.file_writer import file_contents_equal
+from ..helper.file_writer import write_file_atomically
+from ..helper.streaming_file_writer import StreamingFileWriter
+
+class LocalFileSystem(FileSystem):
+    def isLocal(self) -> bool:
+        return True
+
+    def exists(self, path: str) -> bool:
+        return os.path.exists(path)
+
+    def isFile(self, path: str) -> bool:
+        return os.path.isfile(path)
+
+    def isDirectory(self, path: str) -> bool:
+        return os.path.isdir(path)
+
+    def getSize(self, filePath: str) -> int:
+        return os.path.getsize(filePath)
+
+    def readBytes(self, filePath: str) -> bytes:
+        filePointer = open(filePath, 'rb')
+        try:
+            return filePointer.read()
+        finally:
+            filePointer.close()
+
+    def writeBytes(self, filePath: str, fileContents: bytes) -> None:
+        write_file_atomically(filePath, fileContents)
+
+    def contentsEqual(self, filePath: str, fileContents: bytes) -> bool:
+        return file_contents_equal(filePath, fileContents)
+
+    def openWriter(self, filePath: str) -> FileWriter:
+        return StreamingFileWriter(filePath)
+
+    def remove(self, filePath: str) -> None:
+        os.remove(filePath)
+
+    def makeDirectory(self, directoryPath: str) -> None:
+        os.mkdir(directoryPath)
+
+    def makeDirectories(self, directoryPath: str) -> None:
+        os.makedirs(directoryPath, exist_ok = True)
+
+    def findFiles(self, pattern: str) -> list[str]:
+        return glob.glob(pattern)
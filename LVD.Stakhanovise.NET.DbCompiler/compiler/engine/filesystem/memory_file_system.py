@@ -0,0 +1,122 @@
+﻿import os
+import fnmatch
+from threading import Lock
+
+from .file_system import FileSystem
+from .file_system import FileWriter
+from .memory_file_writer import MemoryFileWriter
+
+class MemoryFileSystem(FileSystem):
+    _files: dict[str, bytes] = None
+    _directories: set[str] = None
+    _lock: Lock = None
+
+    def __init__(self) -> None:
+        self._files = {}
+        self._directories = set()
+        self._lock = Lock()
+
+    def addFiles(self, rootDirectory: str, files: dict[str, str | bytes]) -> None:
+        for relativeFilePath, fileContents in files.items():
+            filePath = os.path.join(rootDirectory, relativeFilePath.replace('/', os.path.sep))
+            if isinstance(fileContents, str):
+                fileContents = fileContents.encode('utf-8')
+            self.writeBytes(filePath, fileContents)
+
+    def getFiles(self, rootDirectory: str) -> dict[str, bytes]:
+        rootPath = self._normalizePath(rootDirectory)
+        rootPrefix = rootPath.rstrip(os.path.sep) + os.path.sep
+        files: dict[str, bytes] = {}
+
+        with self._lock:
+            for filePath, fileContents in self._files.items():
+                if filePath.startswith(rootPrefix):
+                    relativeFilePath = filePath[len(rootPrefix):].replace(os.path.sep, '/')
+                    files[relativeFilePath] = fileContents
+
+        return files
+
+    def exists(self, path: str) -> bool:
+        normalizedPath = self._normalizePath(path)
+        with self._lock:
+            return normalizedPath in self._files or normalizedPath in self._directories
+
+    def isFile(self, path: str) -> bool:
+        normalizedPath = self._normalizePath(path)
+        with self._lock:
+            return normalizedPath in self._files
+
+    def isDirectory(self, path: str) -> bool:
+        normalizedPath = self._normalizePath(path)
+        with self._lock:
+            return normalizedPath in self._directories
+
+    def getSize(self, filePath: str) -> int:
+        return len(self.readBytes(filePath))
+
+    def readBytes(self, filePath: str) -> bytes:
+        normalizedFilePath = self._normalizePath(filePath)
+        with self._lock:
+            fileContents = self._files.get(normalizedFilePath, None)
+
+        if fileContents is None:
+            raise FileNotFoundError('File not found at path <' + filePath + '>')
+
+        return fileContents
+
+    def writeBytes(self, filePath: str, fileContents: bytes) -> None:
+        normalizedFilePath = self._normalizePath(filePath)
+        with self._lock:
+            if normalizedFilePath in self._directories:
+                raise IsADirectoryError('Cannot write file at path <' + filePath + '>: a directory exists at that path')
+
+            self._addParentDirectories(normalizedFilePath)
+            self._files[normalizedFilePath] = bytes(fileContents)
+
+    def openWriter(self, filePath: str) -> FileWriter:
+        return MemoryFileWriter(self, filePath)
+
+    def remove(self, filePath: str) -> None:
+        normalizedFilePath = self._normalizePath(filePath)
+        with self._lock:
+            if self._files.pop(normalizedFilePath, None) is None:
+                raise FileNotFoundError('File not found at path <' + filePath + '>')
+
+    def makeDirectory(self, directoryPath: str) -> None:
+        normalizedDirectoryPath = self._normalizePath(directoryPath)
+        with self._lock:
+            if normalizedDirectoryPath in self._directories or normalizedDirectoryPath in self._files:
+                raise FileExistsError('Path <' + directoryPath + '> already exists')
+            self._addParentDirectories(normalizedDirectoryPath)
+            self._directories.add(normalizedDirectoryPath)
+
+    def makeDirectories(self, directoryPath: str) -> None:
+        normalizedDirectoryPath = self._normalizePath(directoryPath)
+        with self._lock:
+            self._addParentDirectories(normalizedDirectoryPath)
+            self._directories.add(normalizedDirectoryPath)
+
+    def findFiles(self, pattern: str) -> list[str]:
+        normalizedPattern = self._normalizePath(pattern)
+        directoryPath, fileNamePattern = os.path.split(normalizedPattern)
+        matchHiddenFiles = fileNamePattern.startswith('.')
+
+        with self._lock:
+            filePaths = [filePath for filePath in self._files.keys() 
+                if os.path.dirname(filePath) == directoryPath 
+                    and (matchHiddenFiles or not os.path.basename(filePath).startswith('.'))
+                    and fnmatch.fnmatchcase(os.path.basename(filePath), fileNamePattern)]
+
+        return sorted(filePaths)
+
+    def _addParentDirectories(self, normalizedPath: str) -> None:
+        parentDirectoryPath = os.path.dirname(normalizedPath)
+        while parentDirectoryPath not in self._directories:
+            self._directories.add(parentDirectoryPath)
+            nextParentDirectoryPath = os.path.dirname(parentDirectoryPath)
+            if nextParentDirectoryPath == parentDirectoryPath:
+                break
+            parentDirectoryPath = nextParentDirectoryPath
+
+    def _normalizePath(self, path: str) -> str:
+        return os.path.normpath(os.path.abspath(path))
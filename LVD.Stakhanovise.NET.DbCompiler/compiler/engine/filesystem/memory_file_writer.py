@@ -0,0 +1,39 @@
+﻿from io import BytesIO
+
+from .file_system import FileWriter
+from ..helper.file_writer import encode_text_file_contents
+
+class MemoryFileWriter(FileWriter):
+    _fileSystem = None
+    _filePath: str = None
+    _encoding: str = None
+    _buffer: BytesIO = None
+
+    def __init__(self, fileSystem, filePath: str, encoding: str = 'utf-8') -> None:
+        self._fileSystem = fileSystem
+        self._filePath = filePath
+        self._encoding = encoding
+        self._buffer = BytesIO()
+
+    def write(self, contents: str) -> None:
+        if self._buffer is None:
+            raise ValueError('File stream for <' + self._filePath + '> is already closed')
+        self._buffer.write(encode_text_file_contents(contents, self._encoding))
+
+    def close(self) -> bool:
+        if self._buffer is None:
+            return False
+
+        fileContents = self._buffer.getvalue()
+        self._buffer.close()
+        self._buffer = None
+
+        return self._fileSystem.writeBytesIfChanged(self._filePath, fileContents)
+
+    def discard(self) -> None:
+        if self._buffer is not None:
+            self._buffer.close()
+            self._buffer = None
+
+    def getFilePath(self) -> str:
+        return self._filePath
@@ -0,0 +1,16 @@
+﻿import hashlib
+
+def hash_string(contents: str) -> str:
+    return hash_bytes((contents or '').encode('utf-8'))
+
+def hash_bytes(contents: bytes) -> str:
+    return hashlib.sha256(contents).hexdigest()
+
+def hash_file(filePath: str) -> str:
+    filePointer = open(filePath, 'rb')
+    fileContents = filePointer.read()
+    filePointer.close()
+    return hash_bytes(fileContents)
+
+def hash_parts(parts: list[str]) -> str:
+    return hash_string('\n'.join(parts))
@@ -0,0 +1,50 @@
+﻿import os
+import stat
+import filecmp
+
+def encode_text_file_contents(fileContents: str, encoding: str = 'utf-8') -> bytes:
+    if os.linesep != '\n':
+        fileContents = fileContents.replace('\n', os.linesep)
+    return fileContents.encode(encoding)
+
+def file_contents_equal(filePath: str, fileContents: bytes) -> bool:
+    try:
+        if os.path.getsize(filePath) != len(fileContents):
+            return False
+
+        filePointer = open(filePath, 'rb')
+        existingFileContents = filePointer.read()
+        filePointer.close()
+    except OSError:
+        return False
+
+    return existingFileContents == fileContents
+
+def files_equal(filePath: str, otherFilePath: str) -> bool:
+    try:
+        return filecmp.cmp(filePath, otherFilePath, shallow = False)
+    except OSError:
+        return False
+
+def get_temp_file_path(filePath: str) -> str:
+    return '%s.%d.tmp' % (filePath, os.getpid())
+
+def replace_file(tempFilePath: str, filePath: str) -> None:
+    if os.path.exists(filePath):
+        os.chmod(tempFilePath, stat.S_IMODE(os.stat(filePath).st_mode))
+
+    os.replace(tempFilePath, filePath)
+
+def write_file_atomically(filePath: str, fileContents: bytes) -> None:
+    tempFilePath = get_temp_file_path(filePath)
+    fileDescriptor = os.open(tempFilePath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+
+    try:
+        filePointer = os.fdopen(fileDescriptor, 'wb')
+        filePointer.write(fileContents)
+        filePointer.close()
+        replace_file(tempFilePath, filePath)
+    except BaseException:
+        if os.path.exists(tempFilePath):
+            os.remove(tempFilePath)
+        raise
@@ -0,0 +1,157 @@
+﻿import os
+import mmap
+import codecs
+from threading import Lock
+from .content_hash import hash_bytes
+from ..filesystem.file_system import FileSystem
+from ..filesystem.local_file_system import LocalFileSystem
+
+SOURCE_FILE_ENCODING = 'utf_8_sig'
+DEFAULT_MMAP_THRESHOLD = 1024 * 1024
+
+class SourceBuffer:
+    _contents: str = None
+    _contentsHash: str = None
+    _lines: list[str] = None
+
+    def __init__(self, contents: str, contentsHash: str) -> None:
+        self._contents = contents
+        self._contentsHash = contentsHash
+
+    def getContents(self) -> str:
+        return self._contents
+
+    def getContentsHash(self) -> str:
+        return self._contentsHash
+
+    def getLines(self) -> list[str]:
+        if self._lines is None:
+            self._lines = self._splitLines(self._contents)
+        return self._lines
+
+    def getFirstLine(self) -> str:
+        lines = self.getLines()
+        if len(lines) > 0:
+            return lines[0]
+        else:
+            return None
+
+    def _splitLines(self, contents: str) -> list[str]:
+        rawLines = contents.split('\n')
+        lines = [rawLine + '\n' for rawLine in rawLines[0:-1]]
+
+        if len(rawLines[-1]) > 0:
+            lines.append(rawLines[-1])
+
+        return lines
+
+class SourceBufferCache:
+    _buffers: dict[str, SourceBuffer] = None
+    _mmapThreshold: int = DEFAULT_MMAP_THRESHOLD
+    _fileSystem: FileSystem = None
+    _lock: Lock = None
+
+    def __init__(self, mmapThreshold: int = DEFAULT_MMAP_THRESHOLD, fileSystem: FileSystem = None) -> None:
+        self._buffers = {}
+        self._mmapThreshold = mmapThreshold
+        self._fileSystem = fileSystem or LocalFileSystem()
+        self._lock = Lock()
+
+    def getFileSystem(self) -> FileSystem:
+        return self._fileSystem
+
+    def exists(self, filePath: str) -> bool:
+        absoluteFilePath = os.path.abspath(filePath)
+
+        with self._lock:
+            if absoluteFilePath in self._buffers:
+                return True
+
+        return self._fileSystem is not None and self._fileSystem.exists(absoluteFilePath)
+
+    def getBuffer(self, filePath: str) -> SourceBuffer:
+        absoluteFilePath = os.path.abspath(filePath)
+
+        with self._lock:
+            sourceBuffer = self._buffers.get(absoluteFilePath, None)
+            if sourceBuffer is None:
+                sourceBuffer = self._readBuffer(absoluteFilePath)
+                self._buffers[absoluteFilePath] = sourceBuffer
+
+        return sourceBuffer
+
+    def _readBuffer(self, absoluteFilePath: str) -> SourceBuffer:
+        if self._fileSystem is None:
+            raise FileNotFoundError('Source <' + absoluteFilePath + '> was not provided and no file system is available to read it from')
+
+        if not self._fileSystem.isLocal():
+            return self._createBuffer(self._fileSystem.readBytes(absoluteFilePath))
+
+        filePointer = open(absoluteFilePath, 'rb')
+        try:
+            fileSize = os.fstat(filePointer.fileno()).st_size
+            if self._mmapThreshold is not None and fileSize > 0 and fileSize >= self._mmapThreshold:
+                sourceBuffer = self._readBufferMapped(filePointer)
+            else:
+                sourceBuffer = self._createBuffer(filePointer.read())
+        finally:
+            filePointer.close()
+
+        return sourceBuffer
+
+    def _readBufferMapped(self, filePointer) -> SourceBuffer:
+        mappedFile = mmap.mmap(filePointer.fileno(), 0, access = mmap.ACCESS_READ)
+        try:
+            mappedFileView = memoryview(mappedFile)
+            try:
+                sourceBuffer = self._createBuffer(mappedFileView)
+            finally:
+                mappedFileView.release()
+        finally:
+            mappedFile.close()
+
+        return sourceBuffer
+
+    def _createBuffer(self, rawContents) -> SourceBuffer:
+        contentsHash = hash_bytes(rawContents)
+        contents = codecs.decode(rawContents, SOURCE_FILE_ENCODING)
+        contents = contents.replace('\r\n', '\n').replace('\r', '\n')
+        return SourceBuffer(contents, contentsHash)
+
+    def prime(self, filePath: str, sourceBuffer: SourceBuffer) -> None:
+        absoluteFilePath = os.path.abspath(filePath)
+        with self._lock:
+            self._buffers[absoluteFilePath] = sourceBuffer
+
+    def getContents(self, filePath: str) -> str:
+        return self.getBuffer(filePath).getContents()
+
+    def getContentsHash(self, filePath: str) -> str:
+        return self.getBuffer(filePath).getContentsHash()
+
+    def getLines(self, filePath: str) -> list[str]:
+        return self.getBuffer(filePath).getLines()
+
+    def getFirstLine(self, filePath: str) -> str:
+        return self.getBuffer(filePath).getFirstLine()
+
+    def invalidate(self, filePath: str) -> None:
+        absoluteFilePath = os.path.abspath(filePath)
+        with self._lock:
+            self._buffers.pop(absoluteFilePath, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buffers = {}
+
+    def __getstate__(self) -> dict:
+        return { 
+            '_mmapThreshold': self._mmapThreshold, 
+            '_fileSystem': self._fileSystem if self._fileSystem is not None and self._fileSystem.isLocal() else None 
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        self._buffers = {}
+        self._mmapThreshold = state.get('_mmapThreshold', DEFAULT_MMAP_THRESHOLD)
+        self._fileSystem = state.get('_fileSystem', None)
+        self._lock = Lock()
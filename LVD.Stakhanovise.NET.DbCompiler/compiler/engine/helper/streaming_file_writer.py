@@ -0,0 +1,54 @@
+﻿import os
+from .file_writer import encode_text_file_contents
+from .file_writer import files_equal
+from .file_writer import get_temp_file_path
+from .file_writer import replace_file
+from ..filesystem.file_system import FileWriter
+
+class StreamingFileWriter(FileWriter):
+    _filePath: str = None
+    _tempFilePath: str = None
+    _encoding: str = None
+    _filePointer = None
+
+    def __init__(self, filePath: str, encoding: str = 'utf-8') -> None:
+        self._filePath = filePath
+        self._tempFilePath = get_temp_file_path(filePath)
+        self._encoding = encoding
+        self._filePointer = open(self._tempFilePath, 'wb')
+
+    def write(self, contents: str) -> None:
+        if self._filePointer is None:
+            raise ValueError('File stream for <' + self._filePath + '> is already closed')
+        self._filePointer.write(encode_text_file_contents(contents, self._encoding))
+
+    def close(self) -> bool:
+        if self._filePointer is None:
+            return False
+
+        self._filePointer.close()
+        self._filePointer = None
+
+        try:
+            if files_equal(self._tempFilePath, self._filePath):
+                os.remove(self._tempFilePath)
+                return False
+
+            replace_file(self._tempFilePath, self._filePath)
+            return True
+        except BaseException:
+            self._removeTempFile()
+            raise
+
+    def discard(self) -> None:
+        if self._filePointer is not None:
+            self._filePointer.close()
+            self._filePointer = None
+        self._removeTempFile()
+
+    def _removeTempFile(self) -> None:
+        if os.path.exists(self._tempFilePath):
+            os.remove(self._tempFilePath)
+
+    def getFilePath(self) -> str:
+        return self._filePath
@@ -1,4 +1,5 @@
-﻿from io import StringIO
+﻿import sys
+from io import StringIO
 
 def sprintf(stringFormat: str, *args) -> str:
     sprintfBuffer = StringIO()
@@ -16,4 +17,10 @@ def str_to_bool(sourceString: str) -> bool:
     return "TRUE" == sourceString.upper()
 
 def bool_to_yesno(boolVal: bool) -> str:
-    return "Yes" if boolVal else "No"
\ No newline at end of file
+    return "Yes" if boolVal else "No"
+
+def intern_str(sourceString: str) -> str:
+    if sourceString is None:
+        return None
+
+    return sys.intern(sourceString)
\ No newline at end of file
@@ -1,32 +1,59 @@
 ﻿import os
+from io import BytesIO
 from xml.etree.ElementTree import parse
 from xml.etree.ElementTree import indent
 from xml.etree.ElementTree import ElementTree
 from xml.etree.ElementTree import Element
+from ..filesystem.file_system import FileSystem
+from ..filesystem.local_file_system import LocalFileSystem
 
 class VsProject:
     _filePath: str = None
     _projectTree: ElementTree = None
     _projectRoot: Element = None
+    _itemGroupsByLabel: dict[str, Element] = None
+    _fileItemsByItemGroupLabel: dict[str, dict[str, list[Element]]] = None
+    _modified: bool = False
+    _fileSystem: FileSystem = None
 
-    def __init__(self, filePath: str) -> None:
+    def __init__(self, filePath: str, fileSystem: FileSystem = None) -> None:
         self._filePath = filePath
+        self._fileSystem = fileSystem or LocalFileSystem()
 
     def open(self) -> None:
         if self._projectTree is None:
-            self._projectTree = parse(self._filePath)
+            self._projectTree = parse(BytesIO(self._fileSystem.readBytes(self._filePath)))
             self._projectRoot = self._projectTree.getroot()
+            self._itemGroupsByLabel = self._indexItemGroups()
+            self._fileItemsByItemGroupLabel = {}
+            self._modified = False
+
+    def _indexItemGroups(self) -> dict[str, Element]:
+        itemGroupsByLabel = {}
+        for itemGroupElement in self._findAllItemGroups():
+            label = itemGroupElement.attrib.get('Label', '')
+            itemGroupsByLabel.setdefault(label, itemGroupElement)
+        return itemGroupsByLabel
 
     def write(self) -> None:
         if self._projectTree is not None:
             indent(self._projectRoot, space = '\t', level = 0)
-            self._projectTree.write(self._filePath, 'utf-8')
+            self._writeProjectTree()
 
     def close(self) -> None:
         if self._projectTree is not None:
-            self._projectTree.write(self._filePath, 'utf-8')
+            if self._modified:
+                self._writeProjectTree()
             self._projectTree = None
             self._projectRoot = None
+            self._itemGroupsByLabel = None
+            self._fileItemsByItemGroupLabel = None
+            self._modified = False
+
+    def _writeProjectTree(self) -> bool:
+        projectBuffer = BytesIO()
+        self._projectTree.write(projectBuffer, 'utf-8')
+        return self._fileSystem.writeBytesIfChanged(self._filePath, projectBuffer.getvalue())
 
     def isOpen(self) -> bool:
         return self._projectRoot is not None
@@ -42,41 +69,61 @@ class VsProject:
             itemGroupElement = Element('ItemGroup')
             itemGroupElement.attrib['Label'] = itemGroup
             self._projectRoot.append(itemGroupElement)
+            self._itemGroupsByLabel[itemGroup] = itemGroupElement
+            self._modified = True
+
+        fileItemsIndex = self._getFileItemsIndex(itemGroup, itemGroupElement)
 
         for filePath in filePaths:
             filePath = self._prepareFilePath(filePath)
-            self._removeFileItemInGroup(itemGroupElement, filePath)
-            self._addFileItemInGroup(itemGroupElement, filePath, buildAction, options)
+            fileItem = self._replaceFileItemInGroup(itemGroupElement, fileItemsIndex, filePath, buildAction, options)
+            fileItemsIndex[filePath.lower()] = [fileItem]
 
-    def _findItemGroupByLabel(self, itemGroup: str) -> Element:
-        foundElement = None
-        itemGroupElements = self._findAllItemGroups()
+        self._modified = True
 
-        for itemGroupElement in itemGroupElements:
-            label = itemGroupElement.attrib.get('Label', '')
-            if label == itemGroup:
-                foundElement = itemGroupElement
-                break
+    def _findItemGroupByLabel(self, itemGroup: str) -> Element:
+        return self._itemGroupsByLabel.get(itemGroup, None)
 
-        return foundElement
+    def _getFileItemsIndex(self, itemGroup: str, itemGroupElement: Element) -> dict[str, list[Element]]:
+        fileItemsIndex = self._fileItemsByItemGroupLabel.get(itemGroup, None)
+        if fileItemsIndex is None:
+            fileItemsIndex = self._indexFileItemsInGroup(itemGroupElement)
+            self._fileItemsByItemGroupLabel[itemGroup] = fileItemsIndex
+        return fileItemsIndex
 
-    def _removeFileItemInGroup(self, itemGroupElement: Element, filePath: str) -> None:
-        removeElements = []
+    def _indexFileItemsInGroup(self, itemGroupElement: Element) -> dict[str, list[Element]]:
+        fileItemsIndex: dict[str, list[Element]] = {}
         for element in itemGroupElement.findall('*'):
             includeOrRemove = element.attrib.get('Include', None)
             if includeOrRemove is None:
                 includeOrRemove = element.attrib.get('Remove', None)
 
-            if includeOrRemove is not None and includeOrRemove.lower() == filePath.lower():
-                removeElements.append(element)
+            if includeOrRemove is not None:
+                fileItemsIndex.setdefault(includeOrRemove.lower(), []).append(element)
 
-        for removeElement in removeElements:
+        return fileItemsIndex
+
+    def _replaceFileItemInGroup(self, itemGroupElement: Element, fileItemsIndex: dict[str, list[Element]], filePath: str, buildAction: str, options: dict[str, str]) -> Element:
+        existingElements = fileItemsIndex.pop(filePath.lower(), None) or []
+        if len(existingElements) == 0:
+            return self._addFileItemInGroup(itemGroupElement, filePath, buildAction, options)
+
+        for removeElement in existingElements[1:]:
             itemGroupElement.remove(removeElement)
 
-        removeElements = []
+        fileItem = existingElements[0]
+        fileItem.clear()
+        self._fillFileItem(fileItem, filePath, buildAction, options)
+        return fileItem
 
-    def _addFileItemInGroup(self, itemGroupElement: Element, filePath: str, buildAction: str, options: dict[str, str]) -> None:
+    def _addFileItemInGroup(self, itemGroupElement: Element, filePath: str, buildAction: str, options: dict[str, str]) -> Element:
         fileItem = Element(buildAction)
+        self._fillFileItem(fileItem, filePath, buildAction, options)
+        itemGroupElement.append(fileItem)
+        return fileItem
+
+    def _fillFileItem(self, fileItem: Element, filePath: str, buildAction: str, options: dict[str, str]) -> None:
+        fileItem.tag = buildAction
         fileItem.attrib['Include'] = filePath
         
         copyOutput = options.get('copy_output', None)
@@ -85,8 +132,6 @@ class VsProject:
             copyOutputElement.text = copyOutput
             fileItem.append(copyOutputElement)
 
-        itemGroupElement.append(fileItem)
-
     def _prepareFilePath(self, filePath: str) -> str:
         return filePath.replace('/', os.path.sep)
 
@@ -99,4 +144,7 @@ class VsProject:
 
         itemGroupElement = self._findItemGroupByLabel(itemGroup)
         if itemGroupElement is not None:
-            self._projectRoot.remove(itemGroupElement)
\ No newline at end of file
+            self._projectRoot.remove(itemGroupElement)
+            self._itemGroupsByLabel = self._indexItemGroups()
+            self._fileItemsByItemGroupLabel.pop(itemGroup, None)
+            self._modified = True
\ No newline at end of file
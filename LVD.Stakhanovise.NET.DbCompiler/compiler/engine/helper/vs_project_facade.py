@@ -1,19 +1,64 @@
 ﻿import os
+from threading import Lock
 from .string import sprintf
 from .path_resolver import PathResolver
 from .vs_project import VsProject
+from ..filesystem.file_system import FileSystem
+from ..filesystem.local_file_system import LocalFileSystem
 
 class VsProjectFacade:
     _pathResolver: PathResolver = None
+    _sessionProjects: dict[str, VsProject] = None
+    _sessionLock: Lock = None
+    _fileSystem: FileSystem = None
 
-    def __init__(self, solutionRoot: str) -> None:
+    def __init__(self, solutionRoot: str, fileSystem: FileSystem = None) -> None:
         self._pathResolver = PathResolver(solutionRoot)
+        self._sessionLock = Lock()
+        self._fileSystem = fileSystem or LocalFileSystem()
+
+    def getFileSystem(self) -> FileSystem:
+        return self._fileSystem
+
+    def beginSession(self) -> None:
+        with self._sessionLock:
+            if self._sessionProjects is None:
+                self._sessionProjects = {}
+
+    def endSession(self) -> None:
+        with self._sessionLock:
+            sessionProjects = self._sessionProjects
+            self._sessionProjects = None
+
+        if sessionProjects is not None:
+            for project in sessionProjects.values():
+                project.close()
+
+    def isInSession(self) -> bool:
+        return self._sessionProjects is not None
 
     def openProject(self, projectName: str) -> VsProject:
+        with self._sessionLock:
+            if self._sessionProjects is None:
+                return self._openProject(projectName)
+
+            project = self._sessionProjects.get(projectName, None)
+            if project is None:
+                project = self._openProject(projectName)
+                if project is not None:
+                    self._sessionProjects[projectName] = project
+
+            return project
+
+    def releaseProject(self, project: VsProject) -> None:
+        if not self.isInSession():
+            project.close()
+
+    def _openProject(self, projectName: str) -> VsProject:
         filePath = self._determineAbsoluteProjectManifestFilePath(projectName)
         
-        if os.path.exists(filePath):
-            project = VsProject(filePath)
+        if self._fileSystem.exists(filePath):
+            project = VsProject(filePath, self._fileSystem)
             project.open()
             return project
         else:
@@ -2,17 +2,21 @@
 from .path_resolver import PathResolver
 from .vs_project_facade import VsProjectFacade
 from .vs_project import VsProject
+from .file_writer import encode_text_file_contents
+from ..filesystem.file_system import FileWriter
 from ..model.build_actions import BUID_ACTION_COMPILE
 
 class VsProjectFileSaver:
     _projectFacade: VsProjectFacade = None
     _projectName: str = None
     _savedFiles: list[str] = None
+    _savedFilePaths: list[str] = None
 
     def __init__(self, projectFacade: VsProjectFacade, projectName: str) -> None:
         self._projectFacade = projectFacade
         self._projectName = projectName
         self._savedFiles = []
+        self._savedFilePaths = []
 
     def saveFile(self, fileName: str, fileContents: str) -> None:
         filePath = self._determineFilePath(fileName)
@@ -21,26 +25,39 @@ class VsProjectFileSaver:
         self._writeFileContents(filePath, fileContents)
 
         self._savedFiles.append(fileName)
+        self._savedFilePaths.append(filePath)
+
+    def openFile(self, fileName: str) -> FileWriter:
+        filePath = self._determineFilePath(fileName)
+
+        self._ensureParentDirectoryExists(filePath)
+        fileWriter = self._projectFacade.getFileSystem().openWriter(filePath)
+
+        self._savedFiles.append(fileName)
+        self._savedFilePaths.append(filePath)
+        return fileWriter
+
+    def getSavedFilePaths(self) -> list[str]:
+        return list(self._savedFilePaths)
 
     def _determineFilePath(self, fileName: str) -> str:
         return self._projectFacade.determineAbsoluteProjectFilePath(self._projectName, fileName)
 
     def _ensureParentDirectoryExists(self, filePath: str) -> None:
         dirPath = os.path.dirname(filePath)
-        if not os.path.isdir(dirPath):
-            os.mkdir(dirPath)
+        fileSystem = self._projectFacade.getFileSystem()
+        if not fileSystem.isDirectory(dirPath):
+            fileSystem.makeDirectories(dirPath)
 
     def _writeFileContents(self, filePath: str, fileContents: str) -> None:
-        filePointer = open(filePath, 'w', encoding='utf-8')
-        filePointer.write(fileContents)
-        filePointer.close()
+        self._projectFacade.getFileSystem().writeBytesIfChanged(filePath, encode_text_file_contents(fileContents))
 
     def commit(self, itemGroup: str, buildAction: str, options: dict[str, str] = None) -> None:
         if len(self._savedFiles) > 0 and buildAction != BUID_ACTION_COMPILE:
             options = options or {}
             project = self._openProject()
             project.includeFilesToItemGroup(itemGroup, self._savedFiles, buildAction, options)
-            project.close()
+            self._projectFacade.releaseProject(project)
 
     def _openProject(self) -> VsProject:
         project = self._projectFacade.openProject(self._projectName)
@@ -1,12 +1,19 @@
 ﻿from ..helper.string import sprintf
+from ..helper.string import str_to_bool
+from .compiler_variant_info import CompilerVariantInfo
+
+ARG_VARIANTS = 'variants'
+ARG_VARIANT = 'variant'
 
 class CompilerOutputInfo:
     _name: str = None
     _arguments: dict[str, str] = None
+    _variant: CompilerVariantInfo = None
 
-    def __init__(self, name: str, arguments: dict[str, str]):
+    def __init__(self, name: str, arguments: dict[str, str], variant: CompilerVariantInfo = None):
         self._name = name
         self._arguments = arguments or {}
+        self._variant = variant
 
     def getName(self) -> str:
         return self._name
@@ -14,5 +21,25 @@ class CompilerOutputInfo:
     def getArguments(self) -> dict[str, str]:
         return self._arguments
 
+    def getVariant(self) -> CompilerVariantInfo:
+        return self._variant
+
+    def isVariantOutput(self) -> bool:
+        return str_to_bool(self._arguments.get(ARG_VARIANTS, 'false'))
+
+    def createForVariant(self, variant: CompilerVariantInfo):
+        variantArguments = { argumentName: variant.expandString(argumentValue) 
+            for argumentName, argumentValue in self._arguments.items() 
+                if argumentName != ARG_VARIANTS }
+
+        variantArguments[ARG_VARIANT] = variant.getName()
+        return CompilerOutputInfo(self._name, variantArguments, variant)
+
+    def getSignature(self) -> str:
+        argumentParts = []
+        for argumentName in sorted(self._arguments.keys()):
+            argumentParts.append(sprintf('%s=%s' % (argumentName, self._arguments[argumentName])))
+        return sprintf('%s(%s)' % (self._name, '; '.join(argumentParts)))
+
     def __str__(self) -> str:
         return sprintf("{name: %s, arguments: %s}" % (self._name, self._arguments))
\ No newline at end of file
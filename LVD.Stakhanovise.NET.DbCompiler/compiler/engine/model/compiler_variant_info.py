@@ -0,0 +1,43 @@
+﻿from ..helper.string import sprintf
+
+PLACEHOLDER_VARIANT_NAME = '$variant$'
+
+class CompilerVariantInfo:
+    _name: str = None
+    _mappingFileName: str = None
+    _prefix: str = None
+
+    def __init__(self, name: str, mappingFileName: str = None, prefix: str = None):
+        self._name = name
+        self._mappingFileName = mappingFileName
+        self._prefix = prefix
+
+    @staticmethod
+    def createFromArguments(name: str, arguments: dict[str, str]):
+        arguments = arguments or {}
+        return CompilerVariantInfo(name, 
+            arguments.get('map', None), 
+            arguments.get('prefix', None))
+
+    def getName(self) -> str:
+        return self._name
+
+    def getMappingFileName(self) -> str:
+        return self._mappingFileName
+
+    def hasMappingFileName(self) -> bool:
+        return bool(self._mappingFileName)
+
+    def getPrefix(self) -> str:
+        return self._prefix
+
+    def expandString(self, targetString: str) -> str:
+        if not targetString:
+            return targetString
+        return targetString.replace(PLACEHOLDER_VARIANT_NAME, self._name)
+
+    def getSignature(self) -> str:
+        return sprintf('%s(map=%s; prefix=%s)' % (self._name, self._mappingFileName or '', self._prefix or ''))
+
+    def __str__(self) -> str:
+        return sprintf("{name: %s, mappingFileName: %s, prefix: %s}" % (self._name, self._mappingFileName, self._prefix))
@@ -5,6 +5,7 @@ from .db_sequence import DbSequence
 from .db_function import DbFunction
 from .db_table import DbTable
 from .compiler_output_info import CompilerOutputInfo
+from .db_dependency_graph import DbDependencyGraph
 
 class Db:
     _makefile: MakefileInfo = None
@@ -12,6 +13,7 @@ class Db:
     _sequences: list[DbSequence] = None
     _tables: list[DbTable] = None
     _functions: list[DbFunction] = None
+    _dependencyGraph: DbDependencyGraph = None
 
     def __init__(self, makefile: MakefileInfo, mapping: DbMapping, objects: list[DbObject]) -> None:
         self._makefile = makefile
@@ -30,6 +32,14 @@ class Db:
             elif DbSequence.getObjectType() == objType:
                 self._sequences.append(obj)
 
+        self._dependencyGraph = None
+
+    @staticmethod
+    def getObjectTypeOrder() -> list[str]:
+        return [DbSequence.getObjectType(), 
+            DbTable.getObjectType(), 
+            DbFunction.getObjectType()]
+
     def getMakefileInfo(self) -> MakefileInfo:
         return self._makefile
 
@@ -46,4 +56,14 @@ class Db:
         return self._functions
 
     def getMapping(self) -> DbMapping:
-        return self._mapping
\ No newline at end of file
+        return self._mapping
+
+    def getDependencyGraph(self) -> DbDependencyGraph:
+        if self._dependencyGraph is None:
+            self._dependencyGraph = DbDependencyGraph(self._sequences 
+                + self._tables 
+                + self._functions)
+        return self._dependencyGraph
+
+    def getObjectsInDependencyOrder(self) -> list[DbObject]:
+        return self.getDependencyGraph().getOrderedObjects()
\ No newline at end of file
@@ -1,18 +1,22 @@
 ﻿from ..helper.string import str_to_bool
 from ..helper.string import sprintf
+from ..helper.string import intern_str
+from .db_mapping import DbMapping
 
 class DbColumn:
-    _name: str = None
-    _type: str = None
-    _notNull: bool = False
-    _defaultValue: str = None
-    _description: str = None
+    __slots__ = ('_name', '_type', '_notNull', '_defaultValue', '_description')
+
+    _name: str
+    _type: str
+    _notNull: bool
+    _defaultValue: str
+    _description: str
 
     def __init__(self, name: str, type: str, notNull: bool = False, defaultValue: str = None, description: str = None):
-        self._name = name
-        self._type = type
+        self._name = intern_str(name)
+        self._type = intern_str(type)
         self._notNull = notNull == True
-        self._defaultValue = defaultValue
+        self._defaultValue = intern_str(defaultValue)
         self._description = description
 
     @staticmethod
@@ -49,5 +53,16 @@ class DbColumn:
     def hasDescription(self):
         return (self.getDescritption() is not None)
 
+    def expandSymbols(self, mapping: DbMapping) -> 'DbColumn':
+        expandedDefaultValue = mapping.expandString(self._defaultValue)
+        if expandedDefaultValue == self._defaultValue:
+            return self
+
+        return DbColumn(self._name, 
+            self._type, 
+            self._notNull, 
+            expandedDefaultValue, 
+            self._description)
+
     def __str__(self) -> str:
         return sprintf('{name: %s, type: %s, notNull: %s}' % (self._name, self._type, self._notNull))
\ No newline at end of file
@@ -12,6 +12,18 @@
         self.password = args.get('password', 'postgres')
         self.dbName = args.get('database', '')
 
+    def withServer(self, host: str, port: int):
+        return DbConnectionInfo({ 
+            'host': host, 
+            'port': port, 
+            'user': self.user, 
+            'password': self.password, 
+            'database': self.dbName 
+        })
+
+    def toUri(self) -> str:
+        return 'postgresql://' + self.user + '@' + self.host + ':' + str(self.port) + '/' + self.dbName
+
     @staticmethod
     def parse(connectionString: str):
         if connectionString is None or len(connectionString) == 0:
@@ -1,17 +1,21 @@
 ﻿from ..helper.string import sprintf
+from ..helper.string import intern_str
+from .db_mapping import DbMapping
 
 TYPE_UNIQUE = "unq"
 TYPE_PRIMARY_KEY = "pk"
 
 class DbConstraint:
-    _name: str = None
-    _columnNames: list[str] = None
-    _type: str = None
+    __slots__ = ('_name', '_columnNames', '_type')
+
+    _name: str
+    _columnNames: list[str]
+    _type: str
 
     def __init__(self, name: str, columnNames: list[str], type: str):
-        self._name = name
-        self._type = type
-        self._columnNames = columnNames or []
+        self._name = intern_str(name)
+        self._type = intern_str(type)
+        self._columnNames = [intern_str(columnName) for columnName in (columnNames or [])]
 
     @staticmethod
     def getAllValidConstraintTypes() -> list[str]:
@@ -26,6 +30,13 @@ class DbConstraint:
     def getName(self) -> str:
         return self._name
 
+    def expandSymbols(self, mapping: DbMapping) -> 'DbConstraint':
+        expandedName = mapping.expandString(self._name)
+        if expandedName == self._name:
+            return self
+
+        return DbConstraint(expandedName, self._columnNames, self._type)
+
     def getType(self) -> str:
         return self._type
 
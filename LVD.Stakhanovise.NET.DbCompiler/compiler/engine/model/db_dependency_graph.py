@@ -0,0 +1,172 @@
+﻿import re
+import heapq
+
+from .db_object import DbObject
+from .db_table import DbTable
+from .db_function import DbFunction
+
+IDENTIFIER_REGEX = re.compile('[A-Za-z_][A-Za-z0-9_]*')
+
+class DbDependencyGraph:
+    _objects: list[DbObject] = None
+    _dependencies: list[list[int]] = None
+    _dependents: list[list[int]] = None
+    _order: list[int] = None
+    _cycles: list[list[int]] = None
+
+    def __init__(self, objects: list[DbObject]) -> None:
+        self._objects = list(objects)
+        self._buildEdges()
+        self._sortTopologically()
+
+    def _buildEdges(self) -> None:
+        objectIndexesByName: dict[str, list[int]] = {}
+        for index, obj in enumerate(self._objects):
+            objectIndexesByName.setdefault(obj.getName().lower(), []).append(index)
+
+        self._dependencies = [[] for obj in self._objects]
+        self._dependents = [[] for obj in self._objects]
+
+        for index, obj in enumerate(self._objects):
+            referencedIndexes: set[int] = set()
+
+            for identifier in self._readReferencedIdentifiers(obj):
+                for referencedIndex in objectIndexesByName.get(identifier, []):
+                    if referencedIndex != index:
+                        referencedIndexes.add(referencedIndex)
+
+            for referencedIndex in sorted(referencedIndexes):
+                self._dependencies[index].append(referencedIndex)
+                self._dependents[referencedIndex].append(index)
+
+    def _readReferencedIdentifiers(self, obj: DbObject) -> set[str]:
+        identifiers: set[str] = set()
+        for referencingText in self._getReferencingTexts(obj):
+            if referencingText:
+                identifiers.update(identifier.lower() for identifier in IDENTIFIER_REGEX.findall(referencingText))
+        return identifiers
+
+    def _getReferencingTexts(self, obj: DbObject) -> list[str]:
+        if isinstance(obj, DbTable):
+            return self._getTableReferencingTexts(obj)
+        elif isinstance(obj, DbFunction):
+            return self._getFunctionReferencingTexts(obj)
+        else:
+            return []
+
+    def _getTableReferencingTexts(self, dbTable: DbTable) -> list[str]:
+        referencingTexts = []
+
+        for dbColumn in dbTable.getColumns():
+            referencingTexts.append(dbColumn.getType())
+            referencingTexts.append(dbColumn.getDefaultValue())
+
+        for dbIndex in dbTable.getIndexes():
+            referencingTexts.extend(dbIndex.getColumnNames())
+
+        return referencingTexts
+
+    def _getFunctionReferencingTexts(self, dbFunction: DbFunction) -> list[str]:
+        referencingTexts = []
+
+        for dbFunctionParam in dbFunction.getParams():
+            referencingTexts.append(dbFunctionParam.getType())
+            referencingTexts.append(dbFunctionParam.getDefaultValue())
+
+        returnInfo = dbFunction.getReturnInfo()
+        if returnInfo is not None:
+            referencingTexts.append(returnInfo.getType())
+            referencingTexts.extend((returnInfo.getColumns() or {}).values())
+
+        referencingTexts.append(dbFunction.getBody())
+        return referencingTexts
+
+    def _sortTopologically(self) -> None:
+        remainingDependencyCounts = [len(dependencies) for dependencies in self._dependencies]
+        readyIndexes = [index for index, count in enumerate(remainingDependencyCounts) if count == 0]
+        heapq.heapify(readyIndexes)
+
+        emitted = [False] * len(self._objects)
+        self._order = []
+        self._cycles = []
+        cyclicIndexes: set[int] = None
+
+        while len(self._order) < len(self._objects):
+            if len(readyIndexes) > 0:
+                index = heapq.heappop(readyIndexes)
+            else:
+                if cyclicIndexes is None:
+                    self._cycles = self._findCycles()
+                    cyclicIndexes = set(index for cycle in self._cycles for index in cycle)
+                index = min(index for index in cyclicIndexes if not emitted[index])
+
+            if emitted[index]:
+                continue
+
+            emitted[index] = True
+            self._order.append(index)
+
+            for dependentIndex in self._dependents[index]:
+                remainingDependencyCounts[dependentIndex] -= 1
+                if remainingDependencyCounts[dependentIndex] == 0 and not emitted[dependentIndex]:
+                    heapq.heappush(readyIndexes, dependentIndex)
+
+    def _findCycles(self) -> list[list[int]]:
+        visitOrders = [-1] * len(self._objects)
+        lowLinks = [0] * len(self._objects)
+        onStack = [False] * len(self._objects)
+        visitStack: list[int] = []
+        cycles: list[list[int]] = []
+        nextVisitOrder = 0
+
+        for rootIndex in range(len(self._objects)):
+            if visitOrders[rootIndex] >= 0:
+                continue
+
+            pendingVisits = [(rootIndex, 0)]
+            while len(pendingVisits) > 0:
+                index, dependencyPosition = pendingVisits.pop()
+                dependencies = self._dependencies[index]
+
+                if dependencyPosition == 0:
+                    visitOrders[index] = nextVisitOrder
+                    lowLinks[index] = nextVisitOrder
+                    nextVisitOrder += 1
+                    visitStack.append(index)
+                    onStack[index] = True
+                else:
+                    lowLinks[index] = min(lowLinks[index], lowLinks[dependencies[dependencyPosition - 1]])
+
+                while dependencyPosition < len(dependencies):
+                    dependencyIndex = dependencies[dependencyPosition]
+                    dependencyPosition += 1
+
+                    if visitOrders[dependencyIndex] < 0:
+                        pendingVisits.append((index, dependencyPosition))
+                        pendingVisits.append((dependencyIndex, 0))
+                        break
+                    elif onStack[dependencyIndex]:
+                        lowLinks[index] = min(lowLinks[index], visitOrders[dependencyIndex])
+                else:
+                    if lowLinks[index] == visitOrders[index]:
+                        cycle: list[int] = []
+                        while True:
+                            cycleIndex = visitStack.pop()
+                            onStack[cycleIndex] = False
+                            cycle.append(cycleIndex)
+                            if cycleIndex == index:
+                                break
+
+                        if len(cycle) > 1:
+                            cycles.append(sorted(cycle))
+
+        return sorted(cycles)
+
+    def getOrderedObjects(self) -> list[DbObject]:
+        return [self._objects[index] for index in self._order]
+
+    def hasCycles(self) -> bool:
+        return len(self._cycles) > 0
+
+    def getCycles(self) -> list[list[DbObject]]:
+        return [[self._objects[index] for index in cycle] for cycle in self._cycles]
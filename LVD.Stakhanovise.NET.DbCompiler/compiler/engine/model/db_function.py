@@ -1,17 +1,22 @@
 ﻿from ..helper.string import sprintf
 from .db_object import DbObject
+from .db_mapping import DbMapping
 from .db_object_prop import DbObjectProp
 from .db_function_param import DbFunctionParam
 from .db_function_return import DbFunctionReturn
 
 class DbFunction(DbObject):
-    _params: list[DbFunctionParam] = None
-    _returnInfo: DbFunctionReturn = None
-    _body: str = None
+    __slots__ = ('_params', '_returnInfo', '_body')
+
+    _params: list[DbFunctionParam]
+    _returnInfo: DbFunctionReturn
+    _body: str
 
     def __init__(self, name, props: list[DbObjectProp] = []):
         super().__init__(name, __class__.getObjectType(), props)
         self._params = []
+        self._returnInfo = None
+        self._body = None
     
     def setParams(self, params: list[DbFunctionParam]) -> None:
         self._params = params or []
@@ -40,6 +45,17 @@ class DbFunction(DbObject):
     def getSeparator(self) -> str:
         return self.getPropertyValue('separator', '$$')
 
+    def expandSymbols(self, mapping: DbMapping) -> 'DbFunction':
+        expandedName = mapping.expandString(self._name)
+        expandedBody = mapping.expandString(self._body)
+
+        if expandedName == self._name and expandedBody == self._body:
+            return self
+
+        expandedFunction = self._copyWithName(expandedName)
+        expandedFunction.setBody(expandedBody)
+        return expandedFunction
+
     @staticmethod
     def getObjectType() -> str:
         return "FUNC"
@@ -1,17 +1,20 @@
 ﻿from ..helper.string import sprintf
+from ..helper.string import intern_str
 
 class DbFunctionParam:
-    _name: str = None
-    _direction: str = "in"
-    _type: str = None
-    _defaultValue: str = None
-    _description: str = None
+    __slots__ = ('_name', '_direction', '_type', '_defaultValue', '_description')
+
+    _name: str
+    _direction: str
+    _type: str
+    _defaultValue: str
+    _description: str
 
     def __init__(self, name: str, type: str, direction: str = "in", defaultValue: str = None, description: str = None):
-        self._name = name
-        self._type = type
-        self._direction = direction
-        self._defaultValue = defaultValue
+        self._name = intern_str(name)
+        self._type = intern_str(type)
+        self._direction = intern_str(direction)
+        self._defaultValue = intern_str(defaultValue)
         self._description = description
 
     @staticmethod
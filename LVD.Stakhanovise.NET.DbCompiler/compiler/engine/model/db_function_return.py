@@ -1,15 +1,21 @@
 ﻿from ..helper.string import sprintf
+from ..helper.string import intern_str
 
 TYPE_TABLE = "table"
 
 class DbFunctionReturn:
-    _returnType: str = None
-    _columns: dict[str, str] = None
+    __slots__ = ('_returnType', '_columns', '_columnNames')
+
+    _returnType: str
+    _columns: dict[str, str]
+    _columnNames: list[str]
 
     def __init__(self, returnType: str, columns: dict[str, str] = None):
-        self._returnType = returnType
+        self._returnType = intern_str(returnType)
+        self._columns = None
         if __class__.isTableReturnType(returnType):
-            self._columns = columns or {}
+            self._columns = { intern_str(columnName): intern_str(columnType) for columnName, columnType in (columns or {}).items() }
+        self._columnNames = list((self._columns or {}).keys())
 
     @staticmethod
     def isTableReturnType(returnType: str) -> bool:
@@ -25,7 +31,7 @@ class DbFunctionReturn:
         return self._columns
 
     def getColumnNames(self) -> list[str]:
-        return list((self._columns or {}).keys())
+        return self._columnNames
 
     def getColumnType(self, columnName: str) -> str:
         if self._columns is not None:
@@ -1,17 +1,23 @@
 ﻿from ..helper.string import sprintf
+from ..helper.string import intern_str
+from .db_mapping import DbMapping
 
 TYPE_BTREE = "btree"
 SORT_ORDER_ASC = "ASC"
 
 class DbIndex:
-    _name:str = None
-    _indexType:str = None
-    _columns:dict[str, str] = None
+    __slots__ = ('_name', '_indexType', '_columns', '_columnNames')
+
+    _name:str
+    _indexType:str
+    _columns:dict[str, str]
+    _columnNames:list[str]
 
     def __init__(self, name: str, columns: dict[str, str], indexType: str = TYPE_BTREE):
-        self._name = name
-        self._columns = columns or {}
-        self._indexType = indexType
+        self._name = intern_str(name)
+        self._columns = { intern_str(columnName): intern_str(sortOrder) for columnName, sortOrder in (columns or {}).items() }
+        self._columnNames = list(self._columns.keys())
+        self._indexType = intern_str(indexType)
 
     def getName(self) -> str:
         return self._name
@@ -23,11 +29,18 @@ class DbIndex:
         return self._columns
 
     def getColumnNames(self) -> list[str]:
-        return list(self.getColumns().keys())
+        return self._columnNames
 
     def getColumnSortOrder(self, columnName: str) -> str:
         columns = self.getColumns()
         return (columns.get(columnName, None) or SORT_ORDER_ASC)
 
+    def expandSymbols(self, mapping: DbMapping) -> 'DbIndex':
+        expandedName = mapping.expandString(self._name)
+        if expandedName == self._name:
+            return self
+
+        return DbIndex(expandedName, self._columns, self._indexType)
+
     def __str__(self) -> str:
         return sprintf("{name = %s, indexType = %s, columns = %s}" % (self._name, self._indexType, self._columns))
\ No newline at end of file
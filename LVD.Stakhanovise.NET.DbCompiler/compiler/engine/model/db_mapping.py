@@ -1,4 +1,4 @@
-﻿from ..helper.string import sprintf
+﻿import re
 
 QUEUE_TABLE_NAME_TOKEN = "queue_table_name"
 RESULTS_QUEUE_TABLE_NAME_TOKEN = "results_queue_table_name"
@@ -7,6 +7,10 @@ METRICS_TABLE_NAME_TOKEN = "metrics_table_name"
 NEW_TASK_NOTIFICATION_CHANNEL_NAME_TOKEN = "new_task_notification_channel_name"
 DEQUEUE_FUNCTION_NAME_TOKEN = "dequeue_function_name"
 
+TOKEN_NAME_REGEX = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+TOKEN_DELIMITER = '$'
+EXPANSION_CACHE_MAX_SIZE = 8192
+
 class DbMapping:
     _queueTableName: str = None
     _resultsQueueTableName: str = None
@@ -15,15 +19,75 @@ class DbMapping:
     _newTaskNotificationChannelNameToken: str = None
     _dequeueFunctionName: str = None
     _symbols: dict[str, str] = None
+    _expansionSymbols: dict[str, str] = None
+    _expansionRegex: re.Pattern = None
+    _expandedStrings: dict[str, str] = None
 
     def __init__(self, symbols: dict[str, str]):
+        symbols = symbols or {}
         self._queueTableName = symbols.get(QUEUE_TABLE_NAME_TOKEN, "sk_tasks_queue_t")
         self._resultsQueueTableName = symbols.get(RESULTS_QUEUE_TABLE_NAME_TOKEN, "sk_task_results_t")
         self._executionTimeStatsTableName = symbols.get(EXECUTION_TIME_STATS_TABLE_NAME_TOKEN, "sk_task_execution_time_stats_t")
         self._metricTableName = symbols.get(METRICS_TABLE_NAME_TOKEN, "sk_metrics_t")
         self._newTaskNotificationChannelNameToken = symbols.get(NEW_TASK_NOTIFICATION_CHANNEL_NAME_TOKEN, "sk_task_queue_item_added")
         self._dequeueFunctionName = symbols.get(DEQUEUE_FUNCTION_NAME_TOKEN, "sk_try_dequeue_task")
-        self._symbols = symbols or {}
+        self._symbols = symbols
+        self._expansionSymbols = self._buildExpansionSymbols(symbols)
+        self._expansionRegex = self._compileExpansionRegex(self._expansionSymbols)
+        self._expansionSymbols = self._resolveExpansionSymbols(self._expansionSymbols)
+        self._applyResolvedBuiltInSymbols()
+        self._expandedStrings = {}
+
+    def _buildExpansionSymbols(self, symbols: dict[str, str]) -> dict[str, str]:
+        expansionSymbols = dict(symbols)
+        expansionSymbols[QUEUE_TABLE_NAME_TOKEN] = self._queueTableName
+        expansionSymbols[RESULTS_QUEUE_TABLE_NAME_TOKEN] = self._resultsQueueTableName
+        expansionSymbols[EXECUTION_TIME_STATS_TABLE_NAME_TOKEN] = self._executionTimeStatsTableName
+        expansionSymbols[METRICS_TABLE_NAME_TOKEN] = self._metricTableName
+        expansionSymbols[NEW_TASK_NOTIFICATION_CHANNEL_NAME_TOKEN] = self._newTaskNotificationChannelNameToken
+        expansionSymbols[DEQUEUE_FUNCTION_NAME_TOKEN] = self._dequeueFunctionName
+        return expansionSymbols
+
+    def _compileExpansionRegex(self, expansionSymbols: dict[str, str]) -> re.Pattern:
+        tokenNames = sorted(expansionSymbols.keys(), key = len, reverse = True)
+        tokenNamesPattern = '|'.join(map(re.escape, tokenNames))
+        return re.compile(re.escape(TOKEN_DELIMITER) + '(' + tokenNamesPattern + ')' + re.escape(TOKEN_DELIMITER))
+
+    def _resolveExpansionSymbols(self, expansionSymbols: dict[str, str]) -> dict[str, str]:
+        resolvedSymbols = {}
+        for tokenName in expansionSymbols.keys():
+            self._resolveExpansionSymbol(tokenName, expansionSymbols, resolvedSymbols, [])
+        return resolvedSymbols
+
+    def _resolveExpansionSymbol(self, tokenName: str, expansionSymbols: dict[str, str], resolvedSymbols: dict[str, str], resolvingTokenNames: list[str]) -> str:
+        resolvedValue = resolvedSymbols.get(tokenName, None)
+        if resolvedValue is not None:
+            return resolvedValue
+
+        if tokenName in resolvingTokenNames:
+            tokenCycle = resolvingTokenNames[resolvingTokenNames.index(tokenName):] + [tokenName]
+            raise ValueError('Mapping token <' + tokenName + '> refers to itself through <' + ' -> '.join(tokenCycle) + '>')
+
+        resolvingTokenNames.append(tokenName)
+        resolvedValue = expansionSymbols[tokenName]
+        if TOKEN_DELIMITER in resolvedValue:
+            resolvedValue = self._expansionRegex.sub(lambda tokenMatch: self._resolveExpansionSymbol(tokenMatch.group(1), 
+                    expansionSymbols, 
+                    resolvedSymbols, 
+                    resolvingTokenNames), 
+                resolvedValue)
+        resolvingTokenNames.pop()
+
+        resolvedSymbols[tokenName] = resolvedValue
+        return resolvedValue
+
+    def _applyResolvedBuiltInSymbols(self) -> None:
+        self._queueTableName = self._expansionSymbols[QUEUE_TABLE_NAME_TOKEN]
+        self._resultsQueueTableName = self._expansionSymbols[RESULTS_QUEUE_TABLE_NAME_TOKEN]
+        self._executionTimeStatsTableName = self._expansionSymbols[EXECUTION_TIME_STATS_TABLE_NAME_TOKEN]
+        self._metricTableName = self._expansionSymbols[METRICS_TABLE_NAME_TOKEN]
+        self._newTaskNotificationChannelNameToken = self._expansionSymbols[NEW_TASK_NOTIFICATION_CHANNEL_NAME_TOKEN]
+        self._dequeueFunctionName = self._expansionSymbols[DEQUEUE_FUNCTION_NAME_TOKEN]
 
     @staticmethod
     def createFromInput(symbols: dict[str, str]):
@@ -40,29 +104,36 @@ class DbMapping:
 
     @staticmethod
     def isValidTokenName(tokenName: str) -> bool:
-        validTokenNames = __class__.getAllValidTokenNames()
-        return (tokenName in validTokenNames)
-
-    def _replaceTokenByName(self, targetString: str, tokenName: str) -> str:
-        token = self._createSearchToken(tokenName)
-        value = self._resolveSymbol(tokenName)
-        return targetString.replace(token, value)
+        return TOKEN_NAME_REGEX.match(tokenName or '') is not None
 
-    def _createSearchToken(self, tokenName: str) -> str:
-        return sprintf("$%s$" % (tokenName))
-
-    def _resolveSymbol(self, tokenName: str) -> str:
-        return self._symbols.get(tokenName)
+    def _replaceTokenMatch(self, tokenMatch: re.Match) -> str:
+        return self._expansionSymbols[tokenMatch.group(1)]
 
     def expandString(self, targetString: str) -> str:
-        finalString = targetString
-        replaceTokenNames = __class__.getAllValidTokenNames()
-        
-        for tokenName in replaceTokenNames:
-            finalString = self._replaceTokenByName(finalString, tokenName)
+        if not targetString or TOKEN_DELIMITER not in targetString:
+            return targetString
+
+        finalString = self._expandedStrings.get(targetString, None)
+        if finalString is None:
+            finalString = self._expansionRegex.sub(self._replaceTokenMatch, targetString)
+            if len(self._expandedStrings) < EXPANSION_CACHE_MAX_SIZE:
+                self._expandedStrings[targetString] = finalString
 
         return finalString
 
+    def getSymbols(self) -> dict[str, str]:
+        return self._symbols
+
+    def withPrefix(self, prefix: str) -> 'DbMapping':
+        if not prefix:
+            return self
+
+        prefixedSymbols = dict(self._symbols)
+        for tokenName in __class__.getAllValidTokenNames():
+            prefixedSymbols[tokenName] = prefix + self._expansionSymbols[tokenName]
+
+        return DbMapping(prefixedSymbols)
+
     def getQueueTableName(self) -> str:
         return self._queueTableName
 
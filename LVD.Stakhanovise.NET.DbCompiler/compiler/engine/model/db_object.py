@@ -1,40 +1,56 @@
-﻿from typing import Callable
+﻿from copy import copy
+from typing import Callable
+from .db_mapping import DbMapping
 from .db_object_prop import DbObjectProp
+from ..helper.string import intern_str
 
 KEY_PROP_TITLE = "title"
 KEY_PROP_DESCRIPTION = "description"
 
 class DbObject:
-    _name: str = None
-    _type: str = None
-    _properties: dict[str, DbObjectProp] = None
+    __slots__ = ('_name', '_type', '_properties', '_nonMetaProperties', '_sourceFile')
+
+    _name: str
+    _type: str
+    _properties: dict[str, DbObjectProp]
+    _nonMetaProperties: dict[str, DbObjectProp]
+    _sourceFile: str
 
     def __init__(self, name: str, type: str, props: list[DbObjectProp] = []):
-        self._name = name
-        self._type = type
+        self._name = intern_str(name)
+        self._type = intern_str(type)
         self._properties = {}
+        self._nonMetaProperties = None
+        self._sourceFile = None
 
         for prop in props:
             self.addProperty(prop)
 
     def addProperty(self, prop:DbObjectProp) -> None:
         self._properties[prop.name] = prop
+        self._nonMetaProperties = None
 
     def clearProperties(self) -> None:
         self._properties = {}
+        self._nonMetaProperties = None
 
     def getProperties(self, applyFilter: Callable[[str, DbObjectProp], bool] = None) -> dict[str, DbObjectProp]:
+        if applyFilter is None:
+            return self._properties
+
         properties: dict[str, DbObjectProp] = {}
 
         for propKey in self._properties.keys():
             prop = self._properties[propKey]
-            if applyFilter is None or applyFilter(propKey, prop):
+            if applyFilter(propKey, prop):
                 properties[propKey] = prop
 
         return properties
 
     def getNonMetaProperties(self) -> dict[str, DbObjectProp]:
-        return self.getProperties(lambda key, prop: key != KEY_PROP_TITLE and key != KEY_PROP_DESCRIPTION)
+        if self._nonMetaProperties is None:
+            self._nonMetaProperties = self.getProperties(lambda key, prop: key != KEY_PROP_TITLE and key != KEY_PROP_DESCRIPTION)
+        return self._nonMetaProperties
 
     def getPropertyValue(self, key: str, defaultValue: str = None) -> str:
         prop = self._properties.get(key, None)
@@ -49,8 +65,26 @@ class DbObject:
     def getType(self) -> str:
         return self._type
 
+    def setSourceFile(self, sourceFile: str) -> None:
+        self._sourceFile = sourceFile
+
+    def getSourceFile(self) -> str:
+        return self._sourceFile
+
     def getMetaTitle(self) -> str:
         return self.getPropertyValue(KEY_PROP_TITLE)
 
     def getMetaDescription(self) -> str:
-        return self.getPropertyValue(KEY_PROP_DESCRIPTION)
\ No newline at end of file
+        return self.getPropertyValue(KEY_PROP_DESCRIPTION)
+
+    def expandSymbols(self, mapping: DbMapping) -> 'DbObject':
+        expandedName = mapping.expandString(self._name)
+        if expandedName == self._name:
+            return self
+
+        return self._copyWithName(expandedName)
+
+    def _copyWithName(self, name: str) -> 'DbObject':
+        expandedObject = copy(self)
+        expandedObject._name = intern_str(name)
+        return expandedObject
\ No newline at end of file
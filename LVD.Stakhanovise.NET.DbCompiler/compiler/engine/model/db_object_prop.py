@@ -1,12 +1,15 @@
 ﻿from ..helper.string import sprintf
+from ..helper.string import intern_str
 
 class DbObjectProp:
-    name: str = None
-    value: str = None
+    __slots__ = ('name', 'value')
+
+    name: str
+    value: str
 
     def __init__(self, name: str, value: str):
-       self.name = name
-       self.value = value
+       self.name = intern_str(name)
+       self.value = intern_str(value)
 
     def __str__(self) -> str:
         return sprintf("{name = %s, value = %s}" % (self.name, self.value))
\ No newline at end of file
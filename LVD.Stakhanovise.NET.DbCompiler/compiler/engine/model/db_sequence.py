@@ -10,6 +10,8 @@ KEY_PROP_CACHE = "cache"
 KEY_PROP_CYCLE = 'cycle'
 
 class DbSequence(DbObject):
+    __slots__ = ()
+
     def __init__(self, name, props: list[DbObjectProp] = []):
         super().__init__(name, __class__.getObjectType(), props)
 
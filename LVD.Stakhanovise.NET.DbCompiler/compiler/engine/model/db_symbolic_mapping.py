@@ -0,0 +1,11 @@
+﻿from .db_mapping import DbMapping
+
+class DbSymbolicMapping(DbMapping):
+    def __init__(self):
+        super().__init__({})
+
+    def expandString(self, targetString: str) -> str:
+        return targetString
+
+    def __str__(self) -> str:
+        return '{symbolic}'
@@ -5,12 +5,21 @@ from .db_object import DbObject
 from .db_column import DbColumn
 from .db_constraint import DbConstraint
 from .db_index import DbIndex
+from .db_table_partitioning import DbTablePartitioning
+from .db_table_partition import DbTablePartition
+from .db_mapping import DbMapping
 
 class DbTable(DbObject):
-    _columns: list[DbColumn] = None
-    _primary: DbConstraint = None
-    _uniqueKeys: list[DbConstraint] = None
-    _indexes: list[DbIndex] = None
+    __slots__ = ('_columns', '_primary', '_uniqueKeys', '_indexes', '_columnIndexes', '_uniqueKeyColumnNames', '_partitioning', '_partitions')
+
+    _columns: list[DbColumn]
+    _primary: DbConstraint
+    _uniqueKeys: list[DbConstraint]
+    _indexes: list[DbIndex]
+    _columnIndexes: list[int]
+    _uniqueKeyColumnNames: frozenset[str]
+    _partitioning: DbTablePartitioning
+    _partitions: list[DbTablePartition]
 
     def __init__(self, name, props: list[DbObjectProp] = []):
         super().__init__(name, __class__.getObjectType(), props)
@@ -19,12 +28,18 @@ class DbTable(DbObject):
         self._primary = None
         self._uniqueKeys = []
         self._indexes = []
+        self._columnIndexes = None
+        self._uniqueKeyColumnNames = None
+        self._partitioning = None
+        self._partitions = []
 
     def addColumn(self, column: DbColumn):
         self._columns.append(column)
+        self._columnIndexes = None
 
     def setColumns(self, columns: list[DbColumn]):
         self._columns = columns or []
+        self._columnIndexes = None
 
     def getColumns(self) -> list[DbColumn]:
         return self._columns
@@ -36,7 +51,9 @@ class DbTable(DbObject):
         return self.getColumnCount() > 0
 
     def getColumnIndexes(self) -> list[int]:
-        return list(range(0, self.getColumnCount()))
+        if self._columnIndexes is None:
+            self._columnIndexes = list(range(0, self.getColumnCount()))
+        return self._columnIndexes
 
     def getColumnAtIndex(self, index: int) -> DbColumn:
         return self._columns[index]
@@ -52,9 +69,11 @@ class DbTable(DbObject):
 
     def addUniqueKey(self, uniqueKey: DbConstraint):
         self._uniqueKeys.append(uniqueKey)
+        self._uniqueKeyColumnNames = None
 
     def setUniqueKeys(self, uniqueKeys: list[DbConstraint]):
         self._uniqueKeys = uniqueKeys or []
+        self._uniqueKeyColumnNames = None
 
     def getUniqueKeys(self) -> list[DbConstraint]:
         return self._uniqueKeys
@@ -74,6 +93,27 @@ class DbTable(DbObject):
     def hasIndexes(self) -> bool:
         return len(self.getIndexes())
 
+    def setPartitioning(self, partitioning: DbTablePartitioning):
+        self._partitioning = partitioning
+
+    def getPartitioning(self) -> DbTablePartitioning:
+        return self._partitioning
+
+    def isPartitioned(self) -> bool:
+        return (self.getPartitioning() is not None)
+
+    def addPartition(self, partition: DbTablePartition):
+        self._partitions.append(partition)
+
+    def setPartitions(self, partitions: list[DbTablePartition]):
+        self._partitions = partitions or []
+
+    def getPartitions(self) -> list[DbTablePartition]:
+        return self._partitions
+
+    def hasPartitions(self) -> bool:
+        return len(self.getPartitions()) > 0
+
     def isColumnPartOfPrimaryKey(self, columnName: str) -> bool:
         inPrimaryKey = False
 
@@ -84,19 +124,53 @@ class DbTable(DbObject):
         return inPrimaryKey
 
     def isColumnPartOfAnyUniqueKey(self, columnName: str) -> bool:
-        inUniqueKey = False
-        
-        if self.hasUniqueKeys():
-            for uniqueKey in self.getUniqueKeys():
-                if uniqueKey.hasColumn(columnName):
-                    inUniqueKey = True
-                    break
-
-        return inUniqueKey
+        if self._uniqueKeyColumnNames is None:
+            self._uniqueKeyColumnNames = frozenset(columnName 
+                for uniqueKey in self.getUniqueKeys() 
+                for columnName in (uniqueKey.getColumnNames() or []))
+
+        return columnName in self._uniqueKeyColumnNames
+
+    def expandSymbols(self, mapping: DbMapping) -> 'DbTable':
+        expandedName = mapping.expandString(self._name)
+        expandedColumns = [column.expandSymbols(mapping) for column in self._columns]
+        expandedPrimaryKey = self._primary.expandSymbols(mapping) if self._primary is not None else None
+        expandedUniqueKeys = [uniqueKey.expandSymbols(mapping) for uniqueKey in self._uniqueKeys]
+        expandedIndexes = [index.expandSymbols(mapping) for index in self._indexes]
+        expandedPartitions = [partition.expandSymbols(mapping) for partition in self._partitions]
+
+        if (expandedName == self._name 
+                and expandedPrimaryKey is self._primary
+                and self._isSameItems(expandedColumns, self._columns) 
+                and self._isSameItems(expandedUniqueKeys, self._uniqueKeys) 
+                and self._isSameItems(expandedIndexes, self._indexes)
+                and self._isSameItems(expandedPartitions, self._partitions)):
+            return self
+
+        expandedTable = self._copyWithName(expandedName)
+        expandedTable.setColumns(expandedColumns)
+        expandedTable.setPrimaryKey(expandedPrimaryKey)
+        expandedTable.setUniqueKeys(expandedUniqueKeys)
+        expandedTable.setIndexes(expandedIndexes)
+        expandedTable.setPartitioning(self._partitioning)
+        expandedTable.setPartitions(expandedPartitions)
+        return expandedTable
+
+    def __setstate__(self, state) -> None:
+        self._partitioning = None
+        self._partitions = []
+
+        dictState, slotsState = state if isinstance(state, tuple) else (state, None)
+        for stateItems in (dictState, slotsState):
+            for stateKey, stateValue in (stateItems or {}).items():
+                setattr(self, stateKey, stateValue)
+
+    def _isSameItems(self, expandedItems: list, items: list) -> bool:
+        return all(expandedItem is item for expandedItem, item in zip(expandedItems, items))
 
     @staticmethod
     def getObjectType() -> str:
         return "TBL"
 
     def __str__(self) -> str:
-        return sprintf('{name = %s, props = %s, columns = %s, indexes = %s, uniques = %s}' % (self._name, self._properties, self._columns, self._indexes, self._uniqueKeys))
\ No newline at end of file
+        return sprintf('{name = %s, props = %s, columns = %s, indexes = %s, uniques = %s, partitioning = %s, partitions = %s}' % (self._name, self._properties, self._columns, self._indexes, self._uniqueKeys, self._partitioning, self._partitions))
\ No newline at end of file
@@ -0,0 +1,109 @@
+﻿from ..helper.string import str_to_bool
+from ..helper.string import sprintf
+from ..helper.string import intern_str
+from .db_mapping import DbMapping
+
+class DbTablePartition:
+    __slots__ = ('_name', '_fromValues', '_toValues', '_inValues', '_modulus', '_remainder', '_default', '_description')
+
+    _name: str
+    _fromValues: str
+    _toValues: str
+    _inValues: str
+    _modulus: str
+    _remainder: str
+    _default: bool
+    _description: str
+
+    def __init__(self, name: str, 
+            fromValues: str = None, 
+            toValues: str = None, 
+            inValues: str = None, 
+            modulus: str = None, 
+            remainder: str = None, 
+            default: bool = False, 
+            description: str = None):
+        self._name = intern_str(name)
+        self._fromValues = fromValues
+        self._toValues = toValues
+        self._inValues = inValues
+        self._modulus = modulus
+        self._remainder = remainder
+        self._default = default == True
+        self._description = description
+
+    @staticmethod
+    def createFromNameAndArgs(name: str, args: dict[str, str]):
+        partitionDefault = str_to_bool(args.get("default", "false"))
+
+        return DbTablePartition(name, 
+            args.get("from", None), 
+            args.get("to", None), 
+            args.get("in", None), 
+            args.get("modulus", None), 
+            args.get("remainder", None), 
+            partitionDefault, 
+            args.get("description", None))
+
+    def getName(self) -> str:
+        return self._name
+
+    def getFromValues(self) -> str:
+        return self._fromValues
+
+    def getToValues(self) -> str:
+        return self._toValues
+
+    def getInValues(self) -> str:
+        return self._inValues
+
+    def getModulus(self) -> str:
+        return self._modulus
+
+    def getRemainder(self) -> str:
+        return self._remainder
+
+    def isDefault(self) -> bool:
+        return self._default
+
+    def isRangePartition(self) -> bool:
+        return self._fromValues is not None or self._toValues is not None
+
+    def isListPartition(self) -> bool:
+        return self._inValues is not None
+
+    def isHashPartition(self) -> bool:
+        return self._modulus is not None or self._remainder is not None
+
+    def getDescription(self) -> str:
+        return self._description
+
+    def hasDescription(self) -> bool:
+        return (self.getDescription() is not None)
+
+    def getBoundSpec(self) -> str:
+        if self.isDefault():
+            return 'DEFAULT'
+        elif self.isListPartition():
+            return sprintf('FOR VALUES IN (%s)' % (self._inValues))
+        elif self.isHashPartition():
+            return sprintf('FOR VALUES WITH (MODULUS %s, REMAINDER %s)' % (self._modulus, self._remainder))
+        else:
+            return sprintf('FOR VALUES FROM (%s) TO (%s)' % (self._fromValues, self._toValues))
+
+    def expandSymbols(self, mapping: DbMapping) -> 'DbTablePartition':
+        expandedName = mapping.expandString(self._name)
+        if expandedName == self._name:
+            return self
+
+        return DbTablePartition(expandedName, 
+            self._fromValues, 
+            self._toValues, 
+            self._inValues, 
+            self._modulus, 
+            self._remainder, 
+            self._default, 
+            self._description)
+
+    def __str__(self) -> str:
+        return sprintf('{name = %s, bounds = %s}' % (self._name, self.getBoundSpec()))
@@ -0,0 +1,51 @@
+﻿from ..helper.string import sprintf
+from ..helper.string import intern_str
+
+METHOD_RANGE = "range"
+METHOD_LIST = "list"
+METHOD_HASH = "hash"
+
+class DbTablePartitioning:
+    __slots__ = ('_method', '_columnNames')
+
+    _method: str
+    _columnNames: list[str]
+
+    def __init__(self, method: str, columnNames: list[str]):
+        self._method = intern_str(method)
+        self._columnNames = [intern_str(columnName) for columnName in (columnNames or [])]
+
+    @staticmethod
+    def getAllValidMethods() -> list[str]:
+        return [METHOD_RANGE, 
+                METHOD_LIST, 
+                METHOD_HASH]
+
+    @staticmethod
+    def isValidMethod(method: str) -> bool:
+        validMethods = __class__.getAllValidMethods()
+        return (method in validMethods)
+
+    def getMethod(self) -> str:
+        return self._method
+
+    def getColumnNames(self) -> list[str]:
+        return self._columnNames
+
+    def hasColumn(self, columnName: str) -> bool:
+        return columnName in self._columnNames
+
+    def isRangePartitioning(self) -> bool:
+        return self.getMethod() == METHOD_RANGE
+
+    def isListPartitioning(self) -> bool:
+        return self.getMethod() == METHOD_LIST
+
+    def isHashPartitioning(self) -> bool:
+        return self.getMethod() == METHOD_HASH
+
+    def getPartitionBySpec(self) -> str:
+        return sprintf('%s (%s)' % (self._method.upper(), ', '.join(self._columnNames)))
+
+    def __str__(self) -> str:
+        return sprintf('{method = %s, columnNames = %s}' % (self._method, self._columnNames))
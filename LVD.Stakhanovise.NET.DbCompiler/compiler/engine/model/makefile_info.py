@@ -1,14 +1,21 @@
 ﻿from ..helper.string import sprintf
 from .compiler_output_info import CompilerOutputInfo
+from .compiler_variant_info import CompilerVariantInfo
 
 class MakefileInfo:
     _mappingFileName: str = None
     _definitionFilesGlob: str = None
     _outputs: list[CompilerOutputInfo] = None
+    _jobs: int = None
+    _concurrentOutputs: bool = None
+    _streaming: bool = None
+    _variants: list[CompilerVariantInfo] = None
+    _validate: bool = None
 
     def setMappingFileName(self, mappingFileName: str):
         self._mappingFileName = mappingFileName
         self._outputs = []
+        self._variants = []
 
     def getMappingFileName(self) -> str:
         return self._mappingFileName
@@ -19,11 +26,43 @@ class MakefileInfo:
     def getDefinitionFilesGlob(self) -> str:
         return self._definitionFilesGlob
 
+    def setJobs(self, jobs: int):
+        self._jobs = jobs
+
+    def getJobs(self) -> int:
+        return self._jobs
+
+    def setConcurrentOutputs(self, concurrentOutputs: bool):
+        self._concurrentOutputs = concurrentOutputs
+
+    def getConcurrentOutputs(self) -> bool:
+        return self._concurrentOutputs
+
+    def setStreaming(self, streaming: bool):
+        self._streaming = streaming
+
+    def getStreaming(self) -> bool:
+        return self._streaming
+
+    def setValidate(self, validate: bool):
+        self._validate = validate
+
+    def getValidate(self) -> bool:
+        return self._validate
+
     def addOutput(self, output: CompilerOutputInfo) -> None:
         self._outputs.append(output)
 
     def getOutputs(self) -> list[CompilerOutputInfo]:
         return self._outputs
 
+    def addVariant(self, variant: CompilerVariantInfo) -> None:
+        if self._variants is None:
+            self._variants = []
+        self._variants.append(variant)
+
+    def getVariants(self) -> list[CompilerVariantInfo]:
+        return self._variants or []
+
     def __str__(self) -> str:
-        return sprintf("{mappingFileName: %s, definitionFilesGlob: %s, outputs: %s}" % (self._mappingFileName, self._definitionFilesGlob, self._outputs))
\ No newline at end of file
+        return sprintf("{mappingFileName: %s, definitionFilesGlob: %s, jobs: %s, concurrentOutputs: %s, streaming: %s, validate: %s, outputs: %s, variants: %s}" % (self._mappingFileName, self._definitionFilesGlob, self._jobs, self._concurrentOutputs, self._streaming, self._validate, self._outputs, self._variants))
\ No newline at end of file
@@ -10,6 +10,7 @@ from ...model.db_table import DbTable
 from ...model.db_index import DbIndex
 from ...model.db_column import DbColumn
 from ...model.db_constraint import DbConstraint
+from ...model.db_table_partition import DbTablePartition
 
 from .db_object_writer import DbObjectWriter
 
@@ -37,6 +38,9 @@ class DbTableWriter(DbObjectWriter[DbTable]):
         if self._showIndexes:
             self._writeIndexes(dbTable.getIndexes())
 
+        if dbTable.isPartitioned():
+            self._writePartitioning(dbTable)
+
     def _writeTableColumns(self, columns: list[DbColumn]) -> None:
         self._writeObjectSectionTitle("Columns:")
 
@@ -119,6 +123,31 @@ class DbTableWriter(DbObjectWriter[DbTable]):
 
         return indexesTable.get_string()
 
+    def _writePartitioning(self, dbTable: DbTable) -> None:
+        self._writeObjectSectionTitle('Partitioning:')
+        self._console.print(dbTable.getPartitioning().getPartitionBySpec())
+
+        partitions = dbTable.getPartitions()
+        if len(partitions) > 0:
+            partitionsDescription = self._getTablePartitionsDescription(partitions)
+            self._console.print(partitionsDescription)
+        else:
+            partitionsMissing = self._getObjectMissingMessage('partitions', False)
+            self._console.print(partitionsMissing)
+
+        self._writeSectionSpacer()
+
+    def _getTablePartitionsDescription(self, partitions: list[DbTablePartition]) -> str:
+        partitionsTable = PrettyTable()
+        partitionsTable.field_names = ['Name', 'Description', 'Bounds']
+
+        for partition in partitions:
+            partitionsTable.add_row([partition.getName(), 
+                partition.getDescription() or '[No description]', 
+                partition.getBoundSpec()])
+
+        return partitionsTable.get_string()
+
     def _getTableIndexCoumnDescription(self, index: DbIndex) -> str:
         columnParts: list[str] = []
         
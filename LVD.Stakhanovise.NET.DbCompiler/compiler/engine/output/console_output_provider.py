@@ -19,6 +19,12 @@ class ConsoleOutputProvider(OutputProvider):
         self._options = options or ConsoleOutputProviderOptions()
         self._console = Console()
 
+    def getConcurrencyGroup(self) -> str:
+        return 'console'
+
+    def supportsObjectSelection(self) -> bool:
+        return True
+
     def writeMapping(self, dbMapping: DbMapping) -> None:
         pass
 
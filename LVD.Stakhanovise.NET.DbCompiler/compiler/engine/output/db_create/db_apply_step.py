@@ -0,0 +1,79 @@
+﻿class DbApplyStep:
+    _kind: str = None
+    _subject: str = None
+    _objectNames: list[str] = None
+    _startTime: float = 0
+    _wallTime: float = 0
+    _rowCount: int = None
+    _lockWaitTime: float = 0
+    _lockWaits: list[str] = None
+    _flags: list[str] = None
+    _error: str = None
+
+    def __init__(self, kind: str, 
+            subject: str, 
+            objectNames: list[str], 
+            startTime: float, 
+            wallTime: float, 
+            rowCount: int, 
+            lockWaitTime: float, 
+            lockWaits: list[str], 
+            flags: list[str], 
+            error: str = None) -> None:
+        self._kind = kind
+        self._subject = subject
+        self._objectNames = objectNames or []
+        self._startTime = startTime
+        self._wallTime = wallTime
+        self._rowCount = rowCount
+        self._lockWaitTime = lockWaitTime
+        self._lockWaits = lockWaits or []
+        self._flags = flags or []
+        self._error = error
+
+    def getKind(self) -> str:
+        return self._kind
+
+    def getSubject(self) -> str:
+        return self._subject
+
+    def getObjectNames(self) -> list[str]:
+        return self._objectNames
+
+    def getStartTime(self) -> float:
+        return self._startTime
+
+    def getWallTime(self) -> float:
+        return self._wallTime
+
+    def getRowCount(self) -> int:
+        return self._rowCount
+
+    def getLockWaitTime(self) -> float:
+        return self._lockWaitTime
+
+    def getLockWaits(self) -> list[str]:
+        return self._lockWaits
+
+    def getFlags(self) -> list[str]:
+        return self._flags
+
+    def isFlagged(self) -> bool:
+        return len(self._flags) > 0
+
+    def getError(self) -> str:
+        return self._error
+
+    def toDict(self) -> dict:
+        return {
+            'kind': self._kind,
+            'subject': self._subject,
+            'objects': self._objectNames,
+            'start': self._startTime,
+            'wall_time': self._wallTime,
+            'rows': self._rowCount,
+            'lock_wait_time': self._lockWaitTime,
+            'lock_waits': self._lockWaits,
+            'flags': self._flags,
+            'error': self._error
+        }
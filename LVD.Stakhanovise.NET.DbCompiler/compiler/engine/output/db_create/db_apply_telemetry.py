@@ -0,0 +1,212 @@
+﻿import json
+import re
+import time
+from threading import Lock
+
+from .db_apply_step import DbApplyStep
+from .db_lock_wait_sampler import DbLockWaitSampler
+
+FLAG_INDEX_BUILD = 'index build'
+FLAG_TABLE_REWRITE = 'table rewrite'
+
+SLOWEST_STEPS_COUNT = 10
+SUBJECT_MAX_WIDTH = 70
+
+STATEMENT_FLAG_PATTERNS = {
+    FLAG_INDEX_BUILD: re.compile(r'\bCREATE\s+(UNIQUE\s+)?INDEX\b|\bADD\s+CONSTRAINT\s+\w+\s+(PRIMARY\s+KEY|UNIQUE)\b', re.IGNORECASE),
+    FLAG_TABLE_REWRITE: re.compile(r'\bALTER\s+COLUMN\s+\w+\s+(SET\s+DATA\s+)?TYPE\b', re.IGNORECASE)
+}
+
+class DbApplyTelemetry:
+    _slowThreshold: float = 0
+    _steps: list[DbApplyStep] = None
+    _samplers: dict[str, DbLockWaitSampler] = None
+    _samplerErrors: list[str] = None
+    _telemetryStart: float = 0
+    _lock: Lock = None
+
+    def __init__(self, slowThresholdMs: int) -> None:
+        self._slowThreshold = slowThresholdMs / 1000.0
+        self._steps = []
+        self._samplers = {}
+        self._samplerErrors = []
+        self._telemetryStart = time.perf_counter()
+        self._lock = Lock()
+
+    def execute(self, conn, dsn: dict[str, str], kind: str, subject: str, sql: str, objectNames: list[str] = None) -> None:
+        sampler = self._getSampler(dsn)
+        pid = conn.get_backend_pid()
+        sampler.watch(pid)
+
+        rowCount = None
+        error = None
+        startTime = time.perf_counter()
+
+        try:
+            cursor = conn.cursor()
+            cursor.execute(sql)
+            rowCount = cursor.rowcount
+            cursor.close()
+        except Exception as exc:
+            error = str(exc).strip()
+            raise
+        finally:
+            wallTime = time.perf_counter() - startTime
+            lockWaits = sampler.release(pid)
+            self._addStep(DbApplyStep(kind, 
+                subject, 
+                objectNames, 
+                startTime - self._telemetryStart, 
+                wallTime, 
+                rowCount, 
+                lockWaits['wait_time'], 
+                lockWaits['waits'], 
+                self._getFlags(sql, wallTime), 
+                error))
+
+    def _getSampler(self, dsn: dict[str, str]) -> DbLockWaitSampler:
+        samplerKey = str(dsn.get('database'))
+        with self._lock:
+            sampler = self._samplers.get(samplerKey, None)
+            if sampler is None:
+                sampler = DbLockWaitSampler(dsn)
+                sampler.start()
+                self._samplers[samplerKey] = sampler
+            return sampler
+
+    def _getFlags(self, sql: str, wallTime: float) -> list[str]:
+        if wallTime < self._slowThreshold:
+            return []
+
+        return [ flag for flag, flagPattern in STATEMENT_FLAG_PATTERNS.items() 
+            if flagPattern.search(sql) is not None ]
+
+    def _addStep(self, step: DbApplyStep) -> None:
+        with self._lock:
+            self._steps.append(step)
+
+    def getSteps(self) -> list[DbApplyStep]:
+        return self._steps
+
+    def getSamplerErrors(self) -> list[str]:
+        return self._samplerErrors
+
+    def stopSamplers(self) -> None:
+        with self._lock:
+            samplers = list(self._samplers.items())
+            self._samplers = {}
+
+        for samplerKey, sampler in samplers:
+            sampler.stop()
+            if sampler.getError() is not None:
+                self._samplerErrors.append('Lock wait sampling for database <' + samplerKey + '> stopped early: ' + sampler.getError())
+
+    def finish(self) -> None:
+        self.stopSamplers()
+
+    def toDict(self) -> dict:
+        return {
+            'unit': { 'time': 'seconds' },
+            'slow_threshold': self._slowThreshold,
+            'kinds': self._summarizeKinds(),
+            'sampler_errors': self._samplerErrors,
+            'steps': [step.toDict() for step in self._steps]
+        }
+
+    def renderJson(self) -> str:
+        return json.dumps(self.toDict(), indent = 2)
+
+    def renderSummary(self) -> str:
+        from prettytable import PrettyTable
+
+        summaryTable = PrettyTable()
+        summaryTable.field_names = ['Kind', 'Count', 'Wall (ms)', 'Lock wait (ms)', 'Errors']
+        summaryTable.align = 'r'
+        summaryTable.align['Kind'] = 'l'
+
+        for kind, kindSummary in self._summarizeKinds().items():
+            summaryTable.add_row([kind, 
+                kindSummary['count'], 
+                self._formatTime(kindSummary['wall_time']), 
+                self._formatTime(kindSummary['lock_wait_time']), 
+                kindSummary['errors']])
+
+        slowestSteps = sorted(self._steps, key = lambda step: step.getWallTime(), reverse = True)[:SLOWEST_STEPS_COUNT]
+        stepsTable = self._createStepsTable()
+        for step in slowestSteps:
+            self._addStepRow(stepsTable, step)
+
+        summary = summaryTable.get_string() + '\n\nSlowest statements:\n' + stepsTable.get_string()
+
+        attentionSteps = [step for step in self._steps 
+            if step.isFlagged() or step.getLockWaitTime() > 0 or step.getError() is not None]
+
+        if len(attentionSteps) > 0:
+            attentionTable = self._createStepsTable(withDetails = True)
+            for step in attentionSteps:
+                self._addStepRow(attentionTable, step, withDetails = True)
+            summary += '\n\nStatements needing attention (slow index builds or table rewrites, lock waits, errors):\n' + attentionTable.get_string()
+
+        if len(self._samplerErrors) > 0:
+            summary += '\n\n' + '\n'.join(self._samplerErrors)
+
+        return summary
+
+    def _createStepsTable(self, withDetails: bool = False):
+        from prettytable import PrettyTable
+
+        stepsTable = PrettyTable()
+        stepsTable.field_names = ['Kind', 'Subject', 'Wall (ms)', 'Rows', 'Lock wait (ms)'] + (['Details'] if withDetails else [])
+        stepsTable.align = 'r'
+        stepsTable.align['Kind'] = 'l'
+        stepsTable.align['Subject'] = 'l'
+        stepsTable.max_width['Subject'] = SUBJECT_MAX_WIDTH
+
+        if withDetails:
+            stepsTable.align['Details'] = 'l'
+            stepsTable.max_width['Details'] = SUBJECT_MAX_WIDTH
+
+        return stepsTable
+
+    def _addStepRow(self, stepsTable, step: DbApplyStep, withDetails: bool = False) -> None:
+        stepRow = [step.getKind(), 
+            step.getSubject(), 
+            self._formatTime(step.getWallTime()), 
+            step.getRowCount() if step.getRowCount() is not None and step.getRowCount() >= 0 else '-', 
+            self._formatTime(step.getLockWaitTime())]
+
+        if withDetails:
+            stepRow.append(self._describeStep(step))
+
+        stepsTable.add_row(stepRow)
+
+    def _describeStep(self, step: DbApplyStep) -> str:
+        details = list(step.getFlags()) + list(step.getLockWaits())
+        if step.getError() is not None:
+            details.append('error: ' + step.getError())
+        return '; '.join(details)
+
+    def _summarizeKinds(self) -> dict[str, dict]:
+        kindSummaries: dict[str, dict] = {}
+
+        for step in self._steps:
+            kindSummary = kindSummaries.get(step.getKind(), None)
+            if kindSummary is None:
+                kindSummary = {
+                    'count': 0,
+                    'wall_time': 0,
+                    'lock_wait_time': 0,
+                    'errors': 0
+                }
+                kindSummaries[step.getKind()] = kindSummary
+
+            kindSummary['count'] += 1
+            kindSummary['wall_time'] += step.getWallTime()
+            kindSummary['lock_wait_time'] += step.getLockWaitTime()
+            if step.getError() is not None:
+                kindSummary['errors'] += 1
+
+        return kindSummaries
+
+    def _formatTime(self, seconds: float) -> str:
+        return '%.3f' % (seconds * 1000.0)
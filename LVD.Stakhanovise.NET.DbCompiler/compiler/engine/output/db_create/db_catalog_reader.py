@@ -0,0 +1,108 @@
+﻿from .db_catalog_snapshot import DbCatalogSnapshot
+
+SCHEMA_NAME = 'public'
+
+SQL_READ_COLUMNS = """SELECT c.relname, 
+        a.attname, 
+        format_type(a.atttypid, a.atttypmod), 
+        a.attnotnull, 
+        pg_get_expr(d.adbin, d.adrelid)
+    FROM pg_catalog.pg_class c
+    JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+    JOIN pg_catalog.pg_attribute a ON a.attrelid = c.oid AND a.attnum > 0 AND NOT a.attisdropped
+    LEFT JOIN pg_catalog.pg_attrdef d ON d.adrelid = c.oid AND d.adnum = a.attnum
+    WHERE n.nspname = %s AND c.relkind IN ('r', 'p')
+    ORDER BY c.relname, a.attnum"""
+
+SQL_READ_CONSTRAINTS = """SELECT t.relname, 
+        c.conname, 
+        c.contype, 
+        ARRAY(SELECT a.attname::text
+            FROM unnest(c.conkey) WITH ORDINALITY AS k(attnum, n)
+            JOIN pg_catalog.pg_attribute a ON a.attrelid = c.conrelid AND a.attnum = k.attnum
+            ORDER BY k.n)
+    FROM pg_catalog.pg_constraint c
+    JOIN pg_catalog.pg_class t ON t.oid = c.conrelid
+    JOIN pg_catalog.pg_namespace n ON n.oid = t.relnamespace
+    WHERE n.nspname = %s AND c.contype IN ('p', 'u')"""
+
+SQL_READ_INDEXES = """SELECT t.relname, 
+        i.relname, 
+        am.amname, 
+        a.attname, 
+        CASE WHEN (ix.indoption[k.n - 1] & 1) = 1 THEN 'DESC' ELSE 'ASC' END
+    FROM pg_catalog.pg_index ix
+    JOIN pg_catalog.pg_class i ON i.oid = ix.indexrelid
+    JOIN pg_catalog.pg_class t ON t.oid = ix.indrelid
+    JOIN pg_catalog.pg_namespace n ON n.oid = t.relnamespace
+    JOIN pg_catalog.pg_am am ON am.oid = i.relam
+    CROSS JOIN LATERAL unnest(ix.indkey) WITH ORDINALITY AS k(attnum, n)
+    LEFT JOIN pg_catalog.pg_attribute a ON a.attrelid = t.oid AND a.attnum = k.attnum
+    WHERE n.nspname = %s 
+        AND NOT EXISTS (SELECT 1 FROM pg_catalog.pg_constraint c WHERE c.conindid = ix.indexrelid)
+    ORDER BY t.relname, i.relname, k.n"""
+
+SQL_READ_SEQUENCES = """SELECT sequencename, 
+        start_value, 
+        increment_by, 
+        min_value, 
+        max_value, 
+        cache_size, 
+        cycle
+    FROM pg_catalog.pg_sequences
+    WHERE schemaname = %s"""
+
+SQL_READ_FUNCTIONS = """SELECT p.proname, 
+        pg_get_function_identity_arguments(p.oid), 
+        pg_get_function_result(p.oid), 
+        l.lanname, 
+        p.prosrc
+    FROM pg_catalog.pg_proc p
+    JOIN pg_catalog.pg_namespace n ON n.oid = p.pronamespace
+    JOIN pg_catalog.pg_language l ON l.oid = p.prolang
+    WHERE n.nspname = %s AND p.prokind = 'f'"""
+
+class DbCatalogReader:
+    _conn = None
+
+    def __init__(self, conn) -> None:
+        self._conn = conn
+
+    def read(self) -> DbCatalogSnapshot:
+        snapshot = DbCatalogSnapshot()
+
+        for row in self._query(SQL_READ_COLUMNS):
+            snapshot.addTableColumn(row[0], row[1], row[2], row[3], row[4])
+
+        for row in self._query(SQL_READ_CONSTRAINTS):
+            snapshot.addTableConstraint(row[0], row[1], row[2], row[3])
+
+        for row in self._query(SQL_READ_INDEXES):
+            snapshot.addTableIndexColumn(row[0], row[1], row[2], row[3], row[4])
+
+        for row in self._query(SQL_READ_SEQUENCES):
+            snapshot.addSequence(row[0], {
+                'start': str(row[1]),
+                'increment': str(row[2]),
+                'min_value': str(row[3]),
+                'max_value': str(row[4]),
+                'cache': str(row[5]),
+                'cycle': row[6]
+            })
+
+        for row in self._query(SQL_READ_FUNCTIONS):
+            snapshot.addFunction(row[0], {
+                'identity': row[1],
+                'result': row[2],
+                'language': row[3],
+                'body': row[4]
+            })
+
+        return snapshot
+
+    def _query(self, sql: str) -> list[tuple]:
+        cursor = self._conn.cursor()
+        cursor.execute(sql, (SCHEMA_NAME, ))
+        rows = cursor.fetchall()
+        cursor.close()
+        return rows
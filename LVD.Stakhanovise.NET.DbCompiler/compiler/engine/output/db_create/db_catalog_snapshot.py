@@ -0,0 +1,69 @@
+﻿class DbCatalogSnapshot:
+    _tables: dict[str, dict[str, dict]] = None
+    _sequences: dict[str, dict[str, str]] = None
+    _functions: dict[str, list[dict[str, str]]] = None
+
+    def __init__(self) -> None:
+        self._tables = {}
+        self._sequences = {}
+        self._functions = {}
+
+    def _getOrCreateTable(self, tableName: str) -> dict[str, dict]:
+        table = self._tables.get(tableName, None)
+        if table is None:
+            table = { 'columns': {}, 'constraints': {}, 'indexes': {} }
+            self._tables[tableName] = table
+        return table
+
+    def addTableColumn(self, tableName: str, columnName: str, columnType: str, notNull: bool, defaultValue: str) -> None:
+        table = self._getOrCreateTable(tableName)
+        table['columns'][columnName] = {
+            'type': columnType,
+            'not_null': notNull,
+            'default': defaultValue
+        }
+
+    def addTableConstraint(self, tableName: str, constraintName: str, constraintType: str, columnNames: list[str]) -> None:
+        table = self._getOrCreateTable(tableName)
+        table['constraints'][constraintName] = {
+            'type': constraintType,
+            'columns': columnNames
+        }
+
+    def addTableIndexColumn(self, tableName: str, indexName: str, indexType: str, columnName: str, sortOrder: str) -> None:
+        table = self._getOrCreateTable(tableName)
+        index = table['indexes'].get(indexName, None)
+        if index is None:
+            index = { 'type': indexType, 'columns': [] }
+            table['indexes'][indexName] = index
+        index['columns'].append((columnName, sortOrder))
+
+    def addSequence(self, sequenceName: str, sequenceInfo: dict[str, str]) -> None:
+        self._sequences[sequenceName] = sequenceInfo
+
+    def addFunction(self, functionName: str, functionInfo: dict[str, str]) -> None:
+        self._functions.setdefault(functionName, []).append(functionInfo)
+
+    def hasTable(self, tableName: str) -> bool:
+        return tableName in self._tables
+
+    def getTableColumn(self, tableName: str, columnName: str) -> dict:
+        return self._tables[tableName]['columns'].get(columnName, None)
+
+    def getTableConstraint(self, tableName: str, constraintName: str) -> dict:
+        return self._tables[tableName]['constraints'].get(constraintName, None)
+
+    def getTablePrimaryKeyName(self, tableName: str) -> str:
+        for constraintName, constraint in self._tables[tableName]['constraints'].items():
+            if constraint['type'] == 'p':
+                return constraintName
+        return None
+
+    def getTableIndex(self, tableName: str, indexName: str) -> dict:
+        return self._tables[tableName]['indexes'].get(indexName, None)
+
+    def getSequence(self, sequenceName: str) -> dict[str, str]:
+        return self._sequences.get(sequenceName, None)
+
+    def getFunctions(self, functionName: str) -> list[dict[str, str]]:
+        return self._functions.get(functionName, [])
@@ -0,0 +1,94 @@
+﻿from threading import Event
+from threading import Lock
+from threading import Thread
+
+from psycopg2 import connect
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+
+LOCK_WAIT_SAMPLE_INTERVAL = 0.05
+
+SQL_SAMPLE_LOCK_WAITS = """SELECT a.pid, 
+        (SELECT string_agg(l.locktype || COALESCE(' on ' || l.relation::regclass::text, '') || ' (' || l.mode || ')', ', ')
+            FROM pg_catalog.pg_locks l
+            WHERE l.pid = a.pid AND NOT l.granted), 
+        (SELECT string_agg(b.pid::text || ': ' || left(b.query, 80), '; ')
+            FROM pg_catalog.pg_stat_activity b
+            WHERE b.pid = ANY(pg_blocking_pids(a.pid)))
+    FROM pg_catalog.pg_stat_activity a
+    WHERE a.pid = ANY(%s) AND a.wait_event_type = 'Lock'"""
+
+class DbLockWaitSampler:
+    _dsn: dict[str, str] = None
+    _conn = None
+    _thread: Thread = None
+    _stopEvent: Event = None
+    _lock: Lock = None
+    _watchedPids: dict[int, dict] = None
+    _error: str = None
+
+    def __init__(self, dsn: dict[str, str]) -> None:
+        self._dsn = dsn
+        self._stopEvent = Event()
+        self._lock = Lock()
+        self._watchedPids = {}
+
+    def start(self) -> None:
+        self._conn = connect(**self._dsn)
+        self._conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        self._thread = Thread(target = self._sampleLockWaits, daemon = True)
+        self._thread.start()
+
+    def watch(self, pid: int) -> None:
+        with self._lock:
+            self._watchedPids[pid] = { 'wait_time': 0, 'waits': [] }
+
+    def release(self, pid: int) -> dict:
+        with self._lock:
+            return self._watchedPids.pop(pid, None) or { 'wait_time': 0, 'waits': [] }
+
+    def _sampleLockWaits(self) -> None:
+        while not self._stopEvent.wait(LOCK_WAIT_SAMPLE_INTERVAL):
+            with self._lock:
+                pids = list(self._watchedPids.keys())
+
+            if len(pids) == 0:
+                continue
+
+            try:
+                cursor = self._conn.cursor()
+                cursor.execute(SQL_SAMPLE_LOCK_WAITS, (pids, ))
+                rows = cursor.fetchall()
+                cursor.close()
+            except Exception as exc:
+                self._error = str(exc).strip()
+                return
+
+            for row in rows:
+                self._recordLockWait(row[0], row[1], row[2])
+
+    def _recordLockWait(self, pid: int, waitingFor: str, blockedBy: str) -> None:
+        lockWait = 'waiting for ' + (waitingFor or 'lock')
+        if blockedBy is not None:
+            lockWait += ', blocked by ' + blockedBy
+
+        with self._lock:
+            watchedPid = self._watchedPids.get(pid, None)
+            if watchedPid is None:
+                return
+
+            watchedPid['wait_time'] += LOCK_WAIT_SAMPLE_INTERVAL
+            if lockWait not in watchedPid['waits']:
+                watchedPid['waits'].append(lockWait)
+
+    def getError(self) -> str:
+        return self._error
+
+    def stop(self) -> None:
+        self._stopEvent.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,236 @@
+﻿import re
+
+from ...helper.string_builder import StringBuilder
+from ...model.db_object import DbObject
+from ...model.db_column import DbColumn
+from ...model.db_constraint import DbConstraint
+from ...model.db_index import DbIndex
+from ...model.db_function import DbFunction
+from ...model.db_sequence import DbSequence
+from ...model.db_table import DbTable
+
+from ..sql_script.sql_db_table_writer import SqlDbTableWriter
+from ..sql_script.sql_db_sequence_writer import SqlDbSequenceWriter
+from ..sql_script.sql_db_function_writer import SqlDbFunctionWriter
+
+from .db_catalog_snapshot import DbCatalogSnapshot
+
+CATALOG_CONSTRAINT_TYPE_PRIMARY_KEY = 'p'
+CATALOG_CONSTRAINT_TYPE_UNIQUE = 'u'
+
+TYPE_NAME_ALIASES = {
+    'int': 'integer',
+    'int2': 'smallint',
+    'int4': 'integer',
+    'int8': 'bigint',
+    'bool': 'boolean',
+    'char': 'character',
+    'varchar': 'character varying',
+    'timestamptz': 'timestamp with time zone',
+    'float4': 'real',
+    'float8': 'double precision',
+    'decimal': 'numeric'
+}
+
+class DbMigrationPlanner:
+    _snapshot: DbCatalogSnapshot = None
+    _deferredStatements: list[str] = None
+
+    def __init__(self, snapshot: DbCatalogSnapshot) -> None:
+        self._snapshot = snapshot
+        self._deferredStatements = []
+
+    def getDeferredStatements(self) -> list[str]:
+        return self._deferredStatements
+
+    def planObject(self, dbObject: DbObject, sqlStringBuilder: StringBuilder) -> None:
+        objectType = dbObject.getType()
+        if DbTable.getObjectType() == objectType:
+            self.planTable(dbObject, sqlStringBuilder)
+        elif DbFunction.getObjectType() == objectType:
+            self.planFunction(dbObject, sqlStringBuilder)
+        elif DbSequence.getObjectType() == objectType:
+            self.planSequence(dbObject, sqlStringBuilder)
+
+    def planTable(self, dbTable: DbTable, sqlStringBuilder: StringBuilder) -> None:
+        writer = SqlDbTableWriter(sqlStringBuilder)
+        if not self._snapshot.hasTable(dbTable.getName()):
+            writer.write(dbTable)
+            return
+
+        for dbColumn in dbTable.getColumns():
+            self._planColumn(dbTable, dbColumn, writer, sqlStringBuilder)
+
+        if dbTable.hasPrimaryKey():
+            self._planPrimaryKey(dbTable, writer, sqlStringBuilder)
+
+        for dbUniqueKey in dbTable.getUniqueKeys():
+            if not self._isSameConstraint(dbTable, dbUniqueKey, CATALOG_CONSTRAINT_TYPE_UNIQUE):
+                self._appendLockWarning(sqlStringBuilder, 'building unique key ' + dbUniqueKey.getName() + ' scans public.' + dbTable.getName() + ' while holding an ACCESS EXCLUSIVE lock')
+                writer.writeUniqueKey(dbTable, dbUniqueKey, False)
+
+        for dbIndex in dbTable.getIndexes():
+            self._planIndex(dbTable, dbIndex, writer, sqlStringBuilder)
+
+        for dbPartition in dbTable.getPartitions():
+            if not self._snapshot.hasTable(dbPartition.getName()):
+                writer.writePartition(dbTable, dbPartition)
+
+    def _planColumn(self, dbTable: DbTable, dbColumn: DbColumn, writer: SqlDbTableWriter, sqlStringBuilder: StringBuilder) -> None:
+        tableName = dbTable.getName()
+        columnName = dbColumn.getName()
+        alterTableSql = 'ALTER TABLE public.' + tableName
+
+        existingColumn = self._snapshot.getTableColumn(tableName, columnName)
+        if existingColumn is None:
+            sqlStringBuilder.appendLine(alterTableSql + ' ADD COLUMN ' + writer.buildColumnSqlString(dbColumn) + ';')
+            return
+
+        alterColumnSql = alterTableSql + ' ALTER COLUMN ' + columnName
+        columnType = dbColumn.getType()
+        if self._normalizeSignature(existingColumn['type']) != self._normalizeSignature(columnType):
+            self._appendLockWarning(sqlStringBuilder, 'changing the type of ' + tableName + '.' + columnName + ' may rewrite public.' + tableName + ' while holding an ACCESS EXCLUSIVE lock')
+            sqlStringBuilder.appendLine(alterColumnSql + ' TYPE ' + columnType + ' USING ' + columnName + '::' + columnType + ';')
+
+        if dbColumn.hasDefaultValue():
+            if self._normalizeExpression(existingColumn['default']) != self._normalizeExpression(dbColumn.getDefaultValue()):
+                sqlStringBuilder.appendLine(alterColumnSql + ' SET DEFAULT ' + dbColumn.getDefaultValue() + ';')
+        elif existingColumn['default'] is not None:
+            sqlStringBuilder.appendLine(alterColumnSql + ' DROP DEFAULT;')
+
+        notNull = dbColumn.isNotNull() or dbTable.isColumnPartOfPrimaryKey(columnName)
+        if notNull != existingColumn['not_null']:
+            if notNull:
+                self._appendLockWarning(sqlStringBuilder, 'setting ' + tableName + '.' + columnName + ' NOT NULL scans public.' + tableName + ' while holding an ACCESS EXCLUSIVE lock')
+            sqlStringBuilder.appendLine(alterColumnSql + (' SET NOT NULL;' if notNull else ' DROP NOT NULL;'))
+
+    def _planPrimaryKey(self, dbTable: DbTable, writer: SqlDbTableWriter, sqlStringBuilder: StringBuilder) -> None:
+        dbPrimaryKey = dbTable.getPrimaryKey()
+        if self._isSameConstraint(dbTable, dbPrimaryKey, CATALOG_CONSTRAINT_TYPE_PRIMARY_KEY):
+            return
+
+        existingPrimaryKeyName = self._snapshot.getTablePrimaryKeyName(dbTable.getName())
+        if existingPrimaryKeyName is not None and existingPrimaryKeyName != dbPrimaryKey.getName():
+            self._appendLockWarning(sqlStringBuilder, 'dropping primary key ' + existingPrimaryKeyName + ' of public.' + dbTable.getName() + ' fails while foreign keys reference it; drop or repoint them first')
+            sqlStringBuilder.appendLine('ALTER TABLE public.' + dbTable.getName() + ' DROP CONSTRAINT IF EXISTS ' + existingPrimaryKeyName + ';')
+
+        self._appendLockWarning(sqlStringBuilder, 'building primary key ' + dbPrimaryKey.getName() + ' scans public.' + dbTable.getName() + ' while holding an ACCESS EXCLUSIVE lock')
+        writer.writePrimaryKey(dbTable, False)
+
+    def _isSameConstraint(self, dbTable: DbTable, dbConstraint: DbConstraint, catalogConstraintType: str) -> bool:
+        existingConstraint = self._snapshot.getTableConstraint(dbTable.getName(), dbConstraint.getName())
+        return (existingConstraint is not None 
+            and existingConstraint['type'] == catalogConstraintType 
+            and list(existingConstraint['columns']) == dbConstraint.getColumnNames())
+
+    def _planIndex(self, dbTable: DbTable, dbIndex: DbIndex, writer: SqlDbTableWriter, sqlStringBuilder: StringBuilder) -> None:
+        existingIndex = self._snapshot.getTableIndex(dbTable.getName(), dbIndex.getName())
+        indexColumns = [(columnName, dbIndex.getColumnSortOrder(columnName).upper()) 
+            for columnName in dbIndex.getColumnNames()]
+
+        if existingIndex is not None:
+            if existingIndex['type'] == dbIndex.getIndexType().lower() and existingIndex['columns'] == indexColumns:
+                return
+
+        if dbTable.isPartitioned():
+            self._appendLockWarning(sqlStringBuilder, 'indexes of partitioned tables cannot be built concurrently; building ' + dbIndex.getName() + ' blocks writes to public.' + dbTable.getName())
+            if existingIndex is not None:
+                sqlStringBuilder.appendLine('DROP INDEX IF EXISTS public.' + dbIndex.getName() + ';')
+            writer.writeIndex(dbTable, dbIndex)
+            return
+
+        if existingIndex is not None:
+            self._deferredStatements.append('DROP INDEX CONCURRENTLY IF EXISTS public.' + dbIndex.getName() + ';')
+
+        indexStringBuilder = StringBuilder()
+        SqlDbTableWriter(indexStringBuilder).writeIndex(dbTable, dbIndex, True)
+        self._deferredStatements.append(indexStringBuilder.toString().strip())
+        indexStringBuilder.close()
+
+    def _appendLockWarning(self, sqlStringBuilder: StringBuilder, message: str) -> None:
+        sqlStringBuilder.appendLine('-- WARNING: ' + message)
+
+    def planSequence(self, dbSequence: DbSequence, sqlStringBuilder: StringBuilder) -> None:
+        existingSequence = self._snapshot.getSequence(dbSequence.getName())
+        if existingSequence is None:
+            writer = SqlDbSequenceWriter(sqlStringBuilder)
+            writer.write(dbSequence)
+            return
+
+        sequenceClauses = []
+        self._addSequenceClause(sequenceClauses, 'START WITH', dbSequence.getStartValue(), existingSequence['start'])
+        self._addSequenceClause(sequenceClauses, 'INCREMENT BY', dbSequence.getIncrementValue(), existingSequence['increment'])
+        self._addSequenceClause(sequenceClauses, 'MINVALUE', dbSequence.getMinValue(), existingSequence['min_value'])
+        self._addSequenceClause(sequenceClauses, 'MAXVALUE', dbSequence.getMaxValue(), existingSequence['max_value'])
+        self._addSequenceClause(sequenceClauses, 'CACHE', dbSequence.getCacheAmount(), existingSequence['cache'])
+
+        if dbSequence.shouldCycle() != existingSequence['cycle']:
+            sequenceClauses.append('CYCLE' if dbSequence.shouldCycle() else 'NO CYCLE')
+
+        if len(sequenceClauses) == 0:
+            return
+
+        sqlStringBuilder.appendLine('ALTER SEQUENCE public.' + dbSequence.getName())
+        for sequenceClause in sequenceClauses[:-1]:
+            sqlStringBuilder.appendLineIndented(sequenceClause)
+        sqlStringBuilder.appendLineIndented(sequenceClauses[-1] + ';')
+        sqlStringBuilder.appendEmptyLine()
+
+    def _addSequenceClause(self, sequenceClauses: list[str], clause: str, value: str, existingValue: str) -> None:
+        if value is not None and value.strip() != existingValue:
+            sequenceClauses.append(clause + ' ' + value.strip())
+
+    def planFunction(self, dbFunction: DbFunction, sqlStringBuilder: StringBuilder) -> None:
+        functionName = dbFunction.getName()
+        functionIdentity = self._getFunctionIdentity(dbFunction)
+        writer = SqlDbFunctionWriter(sqlStringBuilder)
+
+        matchingFunction = None
+        for existingFunction in self._snapshot.getFunctions(functionName):
+            if self._normalizeSignature(existingFunction['identity']) == functionIdentity:
+                matchingFunction = existingFunction
+            else:
+                sqlStringBuilder.appendLine('DROP FUNCTION IF EXISTS public.' + functionName + '(' + existingFunction['identity'] + ');')
+
+        if matchingFunction is not None:
+            functionResult = self._normalizeSignature(writer.buildReturnSqlString(dbFunction))
+            if self._normalizeSignature(matchingFunction['result']) != functionResult:
+                sqlStringBuilder.appendLine('DROP FUNCTION IF EXISTS public.' + functionName + '(' + matchingFunction['identity'] + ');')
+            elif self._isSameFunctionDefinition(dbFunction, matchingFunction):
+                return
+
+        writer.write(dbFunction)
+        sqlStringBuilder.appendEmptyLine()
+
+    def _getFunctionIdentity(self, dbFunction: DbFunction) -> str:
+        identityParts = []
+        for dbFunctionParam in dbFunction.getParams():
+            paramDirection = dbFunctionParam.getDirection()
+            if paramDirection == 'out':
+                continue
+
+            identityPart = dbFunctionParam.getName() + ' ' + dbFunctionParam.getType()
+            if paramDirection == 'inout':
+                identityPart = 'inout ' + identityPart
+            identityParts.append(identityPart)
+
+        return self._normalizeSignature(', '.join(identityParts))
+
+    def _isSameFunctionDefinition(self, dbFunction: DbFunction, existingFunction: dict[str, str]) -> bool:
+        language = dbFunction.getLanguage()
+        if language is not None and language.lower() != existingFunction['language']:
+            return False
+        return (dbFunction.getBody() or '').strip() == (existingFunction['body'] or '').strip()
+
+    def _normalizeSignature(self, signature: str) -> str:
+        signature = re.sub(r'\s+', ' ', signature.strip().lower())
+        signature = re.sub(r'\b(' + '|'.join(TYPE_NAME_ALIASES.keys()) + r')\b', 
+            lambda match: TYPE_NAME_ALIASES[match.group(1)], 
+            signature)
+        signature = re.sub(r'\btimestamp\b(?! with)', 'timestamp without time zone', signature)
+        return re.sub(r'\s*([,()\[\]])\s*', r'\1', signature)
+
+    def _normalizeExpression(self, expression: str) -> str:
+        if expression is None:
+            return None
+        return re.sub(r'\s+', '', expression.lower()).replace('public.', '')
@@ -0,0 +1,165 @@
+﻿import atexit
+import glob
+import os
+import re
+import shlex
+import shutil
+import socket
+import subprocess
+import tempfile
+
+EPHEMERAL_CLUSTER_HOST = '127.0.0.1'
+EPHEMERAL_CLUSTER_DIRECTORY_PREFIX = 'sk_pg_'
+DEFAULT_EPHEMERAL_CLUSTER_BASE_DIRECTORY = '/dev/shm'
+
+EPHEMERAL_CLUSTER_SETTINGS = {
+    'fsync': 'off',
+    'synchronous_commit': 'off',
+    'full_page_writes': 'off',
+    'listen_addresses': EPHEMERAL_CLUSTER_HOST
+}
+
+class EphemeralPostgresCluster:
+    _runningClusters: dict[str, 'EphemeralPostgresCluster'] = {}
+
+    _user: str = None
+    _baseDirectory: str = None
+    _binDirectory: str = None
+    _dataDirectory: str = None
+    _port: int = None
+    _keepRunning: bool = False
+
+    def __init__(self, user: str, baseDirectory: str = None, binDirectory: str = None, keepRunning: bool = False) -> None:
+        self._user = user
+        self._baseDirectory = baseDirectory or self._getDefaultBaseDirectory()
+        self._binDirectory = binDirectory
+        self._keepRunning = keepRunning
+
+    @staticmethod
+    def getOrStart(user: str, baseDirectory: str = None, binDirectory: str = None, keepRunning: bool = False) -> 'EphemeralPostgresCluster':
+        cluster = EphemeralPostgresCluster(user, baseDirectory, binDirectory, keepRunning)
+        clusterKey = cluster.getKey()
+
+        runningCluster = __class__._runningClusters.get(clusterKey, None)
+        if runningCluster is None:
+            cluster.start()
+            __class__._runningClusters[clusterKey] = cluster
+            runningCluster = cluster
+
+        return runningCluster
+
+    def _getDefaultBaseDirectory(self) -> str:
+        if os.path.isdir(DEFAULT_EPHEMERAL_CLUSTER_BASE_DIRECTORY):
+            return DEFAULT_EPHEMERAL_CLUSTER_BASE_DIRECTORY
+        else:
+            return tempfile.gettempdir()
+
+    def getKey(self) -> str:
+        return self._user + '@' + os.path.abspath(self._baseDirectory)
+
+    def getHost(self) -> str:
+        return EPHEMERAL_CLUSTER_HOST
+
+    def getPort(self) -> int:
+        return self._port
+
+    def getDataDirectory(self) -> str:
+        return self._dataDirectory
+
+    def isRunning(self) -> bool:
+        return self._dataDirectory is not None
+
+    def start(self) -> None:
+        if self.isRunning():
+            return
+
+        self._dataDirectory = tempfile.mkdtemp(prefix = EPHEMERAL_CLUSTER_DIRECTORY_PREFIX, 
+            dir = self._baseDirectory)
+        self._port = self._findFreePort()
+
+        try:
+            self._runTool('initdb', [ '-D', self._dataDirectory, 
+                '-U', self._user, 
+                '-A', 'trust', 
+                '-E', 'UTF8', 
+                '--no-sync' ])
+
+            self._runTool('pg_ctl', [ '-D', self._dataDirectory, 
+                '-l', os.path.join(self._dataDirectory, 'postgres.log'), 
+                '-o', self._getServerOptions(), 
+                '-w', 
+                'start' ])
+        except BaseException:
+            self._removeDataDirectory()
+            raise
+
+        if not self._keepRunning:
+            atexit.register(self.stop)
+
+    def _findFreePort(self) -> int:
+        portSocket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            portSocket.bind((EPHEMERAL_CLUSTER_HOST, 0))
+            return portSocket.getsockname()[1]
+        finally:
+            portSocket.close()
+
+    def _getServerOptions(self) -> str:
+        serverOptions = [ '-p ' + str(self._port), 
+            '-k ' + shlex.quote(self._dataDirectory) ]
+
+        for settingName, settingValue in EPHEMERAL_CLUSTER_SETTINGS.items():
+            serverOptions.append('-c ' + settingName + '=' + settingValue)
+
+        return ' '.join(serverOptions)
+
+    def _runTool(self, toolName: str, toolArgs: list[str]) -> None:
+        toolPath = self._findTool(toolName)
+        toolResult = subprocess.run([ toolPath ] + toolArgs, 
+            stdout = subprocess.PIPE, 
+            stderr = subprocess.STDOUT, 
+            text = True)
+
+        if toolResult.returncode != 0:
+            raise ValueError('Command <' + toolName + '> failed with exit code <' + str(toolResult.returncode) + '>: ' + toolResult.stdout.strip())
+
+    def _findTool(self, toolName: str) -> str:
+        if self._binDirectory is not None:
+            toolPath = os.path.join(self._binDirectory, toolName)
+            if os.path.isfile(toolPath):
+                return toolPath
+        else:
+            toolPath = shutil.which(toolName)
+            if toolPath is not None:
+                return toolPath
+
+            candidateToolPaths = sorted(glob.glob('/usr/lib/postgresql/*/bin/' + toolName), 
+                key = __class__._getToolVersionKey, 
+                reverse = True)
+            if len(candidateToolPaths) > 0:
+                return candidateToolPaths[0]
+
+        raise ValueError('PostgreSQL tool <' + toolName + '> not found; install the PostgreSQL server binaries or set pg_bin_dir')
+
+    @staticmethod
+    def _getToolVersionKey(toolPath: str) -> tuple[int, ...]:
+        versionDirectory = os.path.basename(os.path.dirname(os.path.dirname(toolPath)))
+        return tuple(int(versionPart) for versionPart in re.findall(r'\d+', versionDirectory))
+
+    def stop(self) -> None:
+        if not self.isRunning():
+            return
+
+        try:
+            self._runTool('pg_ctl', [ '-D', self._dataDirectory, 
+                '-m', 'immediate', 
+                '-w', 
+                'stop' ])
+        finally:
+            self._removeDataDirectory()
+            __class__._runningClusters.pop(self.getKey(), None)
+
+    def _removeDataDirectory(self) -> None:
+        shutil.rmtree(self._dataDirectory, ignore_errors = True)
+        self._dataDirectory = None
+        self._port = None
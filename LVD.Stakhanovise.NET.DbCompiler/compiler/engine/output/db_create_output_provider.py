@@ -1,25 +1,224 @@
-﻿from psycopg2 import connect
+﻿import shlex
+
+from concurrent.futures import ThreadPoolExecutor
+
+from psycopg2 import connect
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
 
+from ..helper.string import sprintf
 from ..helper.string_builder import StringBuilder
 from ..model.db_connection_info import DbConnectionInfo
+from ..model.db_object import DbObject
+from ..model.db_function import DbFunction
+from ..model.db_sequence import DbSequence
+from ..model.db_table import DbTable
 
 from .sql_script_output_provider_base import SqlScriptOutputProviderBase
 from .db_create_output_provider_options import DbCreateOutputProviderOptions
+from .db_create.db_catalog_reader import DbCatalogReader
+from .db_create.db_catalog_snapshot import DbCatalogSnapshot
+from .db_create.db_migration_planner import DbMigrationPlanner
+from .db_create.ephemeral_postgres_cluster import EphemeralPostgresCluster
+from .db_create.db_apply_telemetry import DbApplyTelemetry
+
+APPLY_STEP_DATABASE = 'database'
+APPLY_STEP_CLONE = 'clone'
+APPLY_STEP_OBJECTS = 'objects'
+APPLY_STEP_DEFERRED = 'deferred'
 
 class DbCreateOutputProvider(SqlScriptOutputProviderBase):
     _options: DbCreateOutputProviderOptions = None
+    _streamConnection = None
+    _batchBuffer: StringBuilder = None
+    _batchObjectCount: int = 0
+    _batchObjectNames: list[str] = None
+    _appliedObjectCount: int = 0
+    _migrationObjects: list[DbObject] = None
+    _migrationPlanner: DbMigrationPlanner = None
+    _connectionInfo: DbConnectionInfo = None
+    _telemetry: DbApplyTelemetry = None
 
     def __init__(self, options: DbCreateOutputProviderOptions) -> None:
         super().__init__()
         self._options = options
         self._buffers = {}
+        self._migrationObjects = []
+
+    def getConcurrencyGroup(self) -> str:
+        if self._options.useEphemeralCluster():
+            return 'db_create:ephemeral'
 
-    def commit(self) -> None:
         connectionInfo = self._options.getConnectionInfo()
-        self._ensureDbExists(connectionInfo)
-        self._createDbObjectsFromBuffers(connectionInfo)
-        self._buffers = {}
+        return sprintf('db_create:%s:%s' % (connectionInfo.host, connectionInfo.port))
+
+    def _getConnectionInfo(self) -> DbConnectionInfo:
+        if self._connectionInfo is None:
+            connectionInfo = self._options.getConnectionInfo()
+            if self._options.useEphemeralCluster():
+                connectionInfo = self._startEphemeralCluster(connectionInfo)
+            self._connectionInfo = connectionInfo
+
+        return self._connectionInfo
+
+    def _startEphemeralCluster(self, connectionInfo: DbConnectionInfo) -> DbConnectionInfo:
+        cluster = EphemeralPostgresCluster.getOrStart(connectionInfo.user, 
+            self._options.getEphemeralClusterDirectory(), 
+            self._options.getPgBinDirectory(), 
+            self._options.shouldKeepEphemeralCluster())
+
+        connectionInfo = connectionInfo.withServer(cluster.getHost(), cluster.getPort())
+        self._writeNotice('Ephemeral PostgreSQL cluster running in <' + cluster.getDataDirectory() + '>, database available at <' + connectionInfo.toUri() + '>')
+
+        if self._options.shouldKeepEphemeralCluster():
+            self._writeNotice('Stop it using: pg_ctl -D ' + shlex.quote(cluster.getDataDirectory()) + ' -m immediate stop')
+
+        dsnFile = self._options.getDsnFile()
+        if dsnFile is not None:
+            dsnFilePointer = open(dsnFile, 'w', encoding = 'utf-8')
+            dsnFilePointer.write(connectionInfo.toUri())
+            dsnFilePointer.close()
+
+        return connectionInfo
+
+    def beginStream(self) -> None:
+        super().beginStream()
+        self._beginTelemetry()
+        connectionInfo = self._getConnectionInfo()
+        if self._options.shouldMigrateDatabaseIfExists():
+            self._streamConnection = self._connectForMigration(connectionInfo)
+            self._migrationPlanner = self._createMigrationPlanner(self._streamConnection)
+        else:
+            self._ensureDbExists(connectionInfo)
+            self._streamConnection = self._connectToServer(connectionInfo)
+        self._beginApply()
+
+    def writeTable(self, dbTable: DbTable) -> None:
+        if self._options.shouldMigrateDatabaseIfExists():
+            self._writeMigrationObject(dbTable)
+        else:
+            super().writeTable(dbTable)
+
+    def writeSequence(self, dbSequence: DbSequence) -> None:
+        if self._options.shouldMigrateDatabaseIfExists():
+            self._writeMigrationObject(dbSequence)
+        else:
+            super().writeSequence(dbSequence)
+
+    def writeFunction(self, dbFunction: DbFunction) -> None:
+        if self._options.shouldMigrateDatabaseIfExists():
+            self._writeMigrationObject(dbFunction)
+        else:
+            super().writeFunction(dbFunction)
+
+    def _writeMigrationObject(self, dbObject: DbObject) -> None:
+        if self.isStreaming():
+            self._planMigration(dbObject)
+            self._objectWritten(dbObject.getName())
+        else:
+            self._migrationObjects.append(dbObject)
+
+    def _planMigration(self, dbObject: DbObject) -> None:
+        objectBuffer = self._getObjectBuffer(dbObject.getName())
+        self._migrationPlanner.planObject(dbObject, objectBuffer)
+
+    def _flushObjectBuffer(self, objectName: str, objectContents: str) -> None:
+        self._appendToBatch(self._streamConnection, objectName, objectContents)
+
+    def abortStream(self) -> None:
+        super().abortStream()
+        self._resetBatch()
+        self._closeStreamConnection()
+        self._finishTelemetry()
+
+    def _beginTelemetry(self) -> None:
+        if self._options.isTelemetryEnabled() and self._telemetry is None:
+            self._telemetry = DbApplyTelemetry(self._options.getSlowThreshold())
+
+    def _finishTelemetry(self) -> None:
+        if self._telemetry is None:
+            return
+
+        telemetry = self._telemetry
+        self._telemetry = None
+        telemetry.finish()
+
+        if len(telemetry.getSteps()) == 0:
+            return
+
+        print(telemetry.renderSummary())
+
+        telemetryFile = self._options.getTelemetryFile()
+        if telemetryFile is not None:
+            telemetryFilePointer = open(telemetryFile, 'w', encoding = 'utf-8')
+            telemetryFilePointer.write(telemetry.renderJson())
+            telemetryFilePointer.close()
+
+    def _executeSql(self, conn, dsn: dict[str, str], stepKind: str, stepSubject: str, sql: str, objectNames: list[str] = None) -> None:
+        if self._telemetry is not None:
+            self._telemetry.execute(conn, dsn, stepKind, stepSubject, sql, objectNames)
+        else:
+            cursor = conn.cursor()
+            cursor.execute(sql)
+            cursor.close()
+
+    def _closeStreamConnection(self) -> None:
+        if self._streamConnection is not None:
+            self._streamConnection.close()
+            self._streamConnection = None
+
+    def commit(self) -> None:
+        if self.isStreaming():
+            try:
+                try:
+                    self._completeApply(self._streamConnection)
+                finally:
+                    self._closeStreamConnection()
+                    self._streaming = False
+                self._createClones(self._getConnectionInfo())
+            finally:
+                self._finishTelemetry()
+            return
+
+        self._beginTelemetry()
+        try:
+            connectionInfo = self._getConnectionInfo()
+            if self._options.shouldMigrateDatabaseIfExists():
+                self._migrateDbObjects(connectionInfo)
+            else:
+                self._ensureDbExists(connectionInfo)
+                self._createDbObjectsFromBuffers(connectionInfo)
+            self._buffers = {}
+            self._createClones(connectionInfo)
+        finally:
+            self._finishTelemetry()
+
+    def _createClones(self, connectionInfo: DbConnectionInfo) -> None:
+        if self._options.isPlanOnly():
+            return
+
+        cloneNames = self._options.getCloneNames()
+        if len(cloneNames) == 0:
+            return
+
+        if self._telemetry is not None:
+            self._telemetry.stopSamplers()
+
+        with ThreadPoolExecutor(max_workers = self._options.getCloneJobs()) as executor:
+            futures = [executor.submit(self._createClone, connectionInfo, cloneName) 
+                for cloneName in cloneNames]
+
+            for future in futures:
+                future.result()
+
+    def _createClone(self, connectionInfo: DbConnectionInfo, cloneName: str) -> None:
+        conn = None
+        try:
+            conn = self._connectToServerWithoutDb(connectionInfo)
+            self._dropDatabase(conn, cloneName, APPLY_STEP_CLONE)
+            self._createDatabaseFromTemplate(conn, cloneName, connectionInfo.dbName)
+        finally:
+            if conn is not None:
+                conn.close()
 
     def _ensureDbExists(self, connectionInfo: DbConnectionInfo):
         conn = None
@@ -37,6 +236,15 @@ class DbCreateOutputProvider(SqlScriptOutputProviderBase):
             if conn is not None:
                 conn.close()
 
+    def _databaseExistsOnServer(self, connectionInfo: DbConnectionInfo) -> bool:
+        conn = None
+        try:
+            conn = self._connectToServerWithoutDb(connectionInfo)
+            return self._databaseExists(conn, connectionInfo.dbName)
+        finally:
+            if conn is not None:
+                conn.close()
+
     def _connectToServerWithoutDb(self, connectionInfo: DbConnectionInfo):
         dsn = self._getConnectionDsnWithoutDb(connectionInfo)
         conn = connect(**dsn)
@@ -64,37 +272,171 @@ class DbCreateOutputProvider(SqlScriptOutputProviderBase):
 
         return dbExists
 
-    def _dropDatabase(self, conn, dbName: str) -> None:
-        cursor = conn.cursor()
-        cursor.execute('DROP DATABASE IF EXISTS ' + dbName)
-        cursor.close()
+    def _dropDatabase(self, conn, dbName: str, stepKind: str = APPLY_STEP_DATABASE) -> None:
+        self._executeSql(conn, 
+            self._getConnectionDsnWithoutDb(self._getConnectionInfo()), 
+            stepKind, 
+            'DROP DATABASE ' + dbName, 
+            'DROP DATABASE IF EXISTS ' + dbName)
 
     def _createDatabase(self, conn, dbName: str) -> None:
-        cursor = conn.cursor()
-        cursor.execute('CREATE DATABASE ' + dbName)
-        cursor.close()
+        self._executeSql(conn, 
+            self._getConnectionDsnWithoutDb(self._getConnectionInfo()), 
+            APPLY_STEP_DATABASE, 
+            'CREATE DATABASE ' + dbName, 
+            'CREATE DATABASE ' + dbName)
+
+    def _createDatabaseFromTemplate(self, conn, dbName: str, templateDbName: str) -> None:
+        self._executeSql(conn, 
+            self._getConnectionDsnWithoutDb(self._getConnectionInfo()), 
+            APPLY_STEP_CLONE, 
+            'CREATE DATABASE ' + dbName + ' TEMPLATE ' + templateDbName, 
+            'CREATE DATABASE ' + dbName + ' TEMPLATE ' + templateDbName)
 
     def _createDbObjectsFromBuffers(self, connectionInfo: DbConnectionInfo) -> None: 
         conn = None
         try:
             conn = self._connectToServer(connectionInfo)
-            for objectName in self._buffers.keys():
-                objectBuffer = self._buffers[objectName]
-                executeSql = objectBuffer.toString()
+            self._applyBuffers(conn)
+        finally:
+            if conn is not None:
+                conn.close()
+
+    def _migrateDbObjects(self, connectionInfo: DbConnectionInfo) -> None:
+        conn = None
+        try:
+            conn = self._connectForMigration(connectionInfo)
+            self._migrationPlanner = self._createMigrationPlanner(conn)
 
-                cursor = conn.cursor()
-                cursor.execute(executeSql)
-                cursor.close()
+            for dbObject in self._migrationObjects:
+                self._planMigration(dbObject)
 
-                objectBuffer.close()
+            self._applyBuffers(conn)
         finally:
+            self._migrationObjects = []
             if conn is not None:
                 conn.close()
 
+    def _connectForMigration(self, connectionInfo: DbConnectionInfo):
+        if not self._options.isPlanOnly():
+            self._ensureDbExists(connectionInfo)
+            return self._connectToServer(connectionInfo)
+
+        if self._databaseExistsOnServer(connectionInfo):
+            return self._connectToServer(connectionInfo)
+
+        return None
+
+    def _createMigrationPlanner(self, conn) -> DbMigrationPlanner:
+        if conn is not None:
+            catalogReader = DbCatalogReader(conn)
+            catalogSnapshot = catalogReader.read()
+        else:
+            catalogSnapshot = DbCatalogSnapshot()
+        return DbMigrationPlanner(catalogSnapshot)
+
+    def _applyBuffers(self, conn) -> None:
+        try:
+            self._beginApply()
+
+            for objectName, objectBuffer in self._buffers.items():
+                self._appendToBatch(conn, objectName, objectBuffer.toString())
+                objectBuffer.close()
+
+            self._completeApply(conn)
+        finally:
+            self._resetBatch()
+
+    def _beginApply(self) -> None:
+        self._resetBatch()
+        self._appliedObjectCount = 0
+        if self._options.isPlanOnly():
+            self._writeNotice('Migration plan for database <' + self._getConnectionInfo().dbName + '>')
+
+    def _writeNotice(self, message: str) -> None:
+        print('-- ' + message)
+
+    def _appendToBatch(self, conn, objectName: str, objectContents: str) -> None:
+        if len(objectContents) == 0:
+            return
+
+        self._batchBuffer.append(objectContents)
+        self._batchObjectNames.append(objectName)
+        self._batchObjectCount += 1
+        self._appliedObjectCount += 1
+
+        batchSize = self._options.getBatchSize()
+        if batchSize > 0 and self._batchObjectCount >= batchSize:
+            self._flushBatch(conn)
+
+    def _flushBatch(self, conn) -> None:
+        if self._batchObjectCount == 0:
+            return
+
+        if self._options.isPlanOnly():
+            print(self._batchBuffer.toString(), end = '')
+        else:
+            self._executeSql(conn, 
+                self._getConnectionDsn(self._getConnectionInfo()), 
+                APPLY_STEP_OBJECTS, 
+                ', '.join(self._batchObjectNames), 
+                self._batchBuffer.toString(), 
+                self._batchObjectNames)
+
+        self._resetBatch()
+
+    def _resetBatch(self) -> None:
+        if self._batchBuffer is not None:
+            self._batchBuffer.close()
+
+        self._batchBuffer = StringBuilder()
+        self._batchObjectNames = []
+        self._batchObjectCount = 0
+
+    def _completeApply(self, conn) -> None:
+        self._flushBatch(conn)
+        if self._options.isPlanOnly():
+            self._writeDeferredStatements()
+            if self._appliedObjectCount == 0:
+                self._writeNotice('No changes')
+        else:
+            if self._options.shouldApplyInTransaction():
+                conn.commit()
+            self._applyDeferredStatements(conn)
+
+    def _getDeferredStatements(self) -> list[str]:
+        if self._migrationPlanner is None or not self._options.shouldMigrateDatabaseIfExists():
+            return []
+        return self._migrationPlanner.getDeferredStatements()
+
+    def _writeDeferredStatements(self) -> None:
+        deferredStatements = self._getDeferredStatements()
+        if len(deferredStatements) == 0:
+            return
+
+        self._writeNotice('Run outside of a transaction, one statement at a time')
+        for deferredStatement in deferredStatements:
+            print(deferredStatement)
+            self._appliedObjectCount += 1
+
+    def _applyDeferredStatements(self, conn) -> None:
+        deferredStatements = self._getDeferredStatements()
+        if len(deferredStatements) == 0:
+            return
+
+        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        for deferredStatement in deferredStatements:
+            self._executeSql(conn, 
+                self._getConnectionDsn(self._getConnectionInfo()), 
+                APPLY_STEP_DEFERRED, 
+                deferredStatement, 
+                deferredStatement)
+
     def _connectToServer(self, connectionInfo: DbConnectionInfo):
         dsn = self._getConnectionDsn(connectionInfo)
         conn = connect(**dsn)
-        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        if not self._options.shouldApplyInTransaction():
+            conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
         return conn
 
     def _getConnectionDsn(self, connectionInfo: DbConnectionInfo) -> dict[str, str]:
@@ -1,4 +1,17 @@
-﻿from ..model.db_connection_info import DbConnectionInfo
+﻿from ..helper.string import str_to_bool
+from ..model.db_connection_info import DbConnectionInfo
+
+IF_EXISTS_DROP = 'drop'
+IF_EXISTS_KEEP = 'keep'
+IF_EXISTS_MIGRATE = 'migrate'
+
+APPLY_MODE_OBJECT = 'object'
+APPLY_MODE_TRANSACTION = 'transaction'
+
+DEFAULT_TRANSACTION_BATCH_SIZE = 50
+DEFAULT_SLOW_THRESHOLD_MS = 1000
+
+PLACEHOLDER_CLONE_NUMBER = '$clone$'
 
 class DbCreateOutputProviderOptions:
     _arguments: dict[str, str] = None
@@ -13,7 +26,89 @@ class DbCreateOutputProviderOptions:
         return self._arguments.get('connection_string')
 
     def getIfExists(self) -> str:
-        return self._arguments.get('if_exists', 'drop')
+        ifExists = self._arguments.get('if_exists', IF_EXISTS_DROP)
+        if ifExists not in [ IF_EXISTS_DROP, IF_EXISTS_KEEP, IF_EXISTS_MIGRATE ]:
+            raise ValueError('Invalid if_exists value <' + ifExists + '>: expected <' + IF_EXISTS_DROP + '>, <' + IF_EXISTS_KEEP + '> or <' + IF_EXISTS_MIGRATE + '>')
+        return ifExists
 
     def shouldDropDatabaseIfExists(self) -> bool:
-        return self.getIfExists() == 'drop'
\ No newline at end of file
+        return self.getIfExists() == IF_EXISTS_DROP
+
+    def shouldMigrateDatabaseIfExists(self) -> bool:
+        return self.getIfExists() == IF_EXISTS_MIGRATE
+
+    def getCloneCount(self) -> int:
+        return self._readNonNegativeInteger('clones', 0)
+
+    def getCloneNamePattern(self) -> str:
+        cloneNamePattern = self._arguments.get('clone_name')
+        if cloneNamePattern is None:
+            cloneNamePattern = self.getConnectionInfo().dbName + '_' + PLACEHOLDER_CLONE_NUMBER
+        return cloneNamePattern
+
+    def getCloneNames(self) -> list[str]:
+        cloneCount = self.getCloneCount()
+        cloneNamePattern = self.getCloneNamePattern()
+
+        if cloneCount > 1 and PLACEHOLDER_CLONE_NUMBER not in cloneNamePattern:
+            raise ValueError('Invalid clone_name value <' + cloneNamePattern + '>: the <' + PLACEHOLDER_CLONE_NUMBER + '> placeholder is required when creating more than one clone')
+
+        return [ cloneNamePattern.replace(PLACEHOLDER_CLONE_NUMBER, str(cloneNumber)) 
+            for cloneNumber in range(1, cloneCount + 1) ]
+
+    def getCloneJobs(self) -> int:
+        return max(self._readNonNegativeInteger('clone_jobs', self.getCloneCount()), 1)
+
+    def _readNonNegativeInteger(self, argumentName: str, defaultValue: int) -> int:
+        value = self._arguments.get(argumentName)
+        if value is None:
+            return defaultValue
+
+        if not value.isdigit():
+            raise ValueError('Invalid ' + argumentName + ' value <' + value + '>: a non-negative integer is expected')
+
+        return int(value)
+
+    def useEphemeralCluster(self) -> bool:
+        return str_to_bool(self._arguments.get('ephemeral', 'false'))
+
+    def getEphemeralClusterDirectory(self) -> str:
+        return self._arguments.get('ephemeral_dir')
+
+    def shouldKeepEphemeralCluster(self) -> bool:
+        return str_to_bool(self._arguments.get('ephemeral_keep', 'false'))
+
+    def getPgBinDirectory(self) -> str:
+        return self._arguments.get('pg_bin_dir')
+
+    def getDsnFile(self) -> str:
+        return self._arguments.get('dsn_file')
+
+    def isTelemetryEnabled(self) -> bool:
+        return (str_to_bool(self._arguments.get('telemetry', 'false')) 
+            or self.getTelemetryFile() is not None)
+
+    def getTelemetryFile(self) -> str:
+        return self._arguments.get('telemetry_file')
+
+    def getSlowThreshold(self) -> int:
+        return self._readNonNegativeInteger('slow_threshold_ms', DEFAULT_SLOW_THRESHOLD_MS)
+
+    def isPlanOnly(self) -> bool:
+        return (self.shouldMigrateDatabaseIfExists() 
+            and str_to_bool(self._arguments.get('plan_only', 'false')))
+
+    def getApplyMode(self) -> str:
+        applyMode = self._arguments.get('apply_mode', APPLY_MODE_OBJECT)
+        if applyMode not in [ APPLY_MODE_OBJECT, APPLY_MODE_TRANSACTION ]:
+            raise ValueError('Invalid apply_mode value <' + applyMode + '>: expected <' + APPLY_MODE_OBJECT + '> or <' + APPLY_MODE_TRANSACTION + '>')
+        return applyMode
+
+    def shouldApplyInTransaction(self) -> bool:
+        return self.getApplyMode() == APPLY_MODE_TRANSACTION
+
+    def getBatchSize(self) -> int:
+        if not self.shouldApplyInTransaction():
+            return 1
+
+        return self._readNonNegativeInteger('batch_size', DEFAULT_TRANSACTION_BATCH_SIZE)
\ No newline at end of file
@@ -8,6 +8,9 @@ from ...model.db_mapping import DbMapping
 
 from ..mapping_code_output_provider_options import MappingCodeOutputProviderOptions
 
+LICENSE_HEADER_TEMPLATE_FILE = 'templates/license_header.cstemplate'
+MAPPING_CLASS_TEMPLATE_FILE = 'templates/queued_task_mapping.cstemplate'
+
 class MappingClassWriter:
     _classBuffer: StringBuilder = None
     _options: MappingCodeOutputProviderOptions
@@ -46,11 +49,11 @@ class MappingClassWriter:
         return template.substitute(templateVars)
 
     def _getLicenseHeaderTemplate(self) -> Template:
-        contents = self._compilerAssetProvider.getSourceFileContents('templates/license_header.cstemplate')
+        contents = self._compilerAssetProvider.getSourceFileContents(LICENSE_HEADER_TEMPLATE_FILE)
         return Template(contents)
 
     def _getMappingClassSourceCodeTemplate(self) -> Template:
-        contents = self._compilerAssetProvider.getSourceFileContents('templates/queued_task_mapping.cstemplate')
+        contents = self._compilerAssetProvider.getSourceFileContents(MAPPING_CLASS_TEMPLATE_FILE)
         return Template(contents)
 
     def _getMappingClassName(self) -> str:
@@ -13,12 +13,14 @@ from ..model.db_mapping import DbMapping
 from .output_provider import OutputProvider
 from .mapping_code_output_provider_options import MappingCodeOutputProviderOptions
 from .mapping_code.mapping_class_writer import MappingClassWriter
+from .mapping_code.mapping_class_writer import LICENSE_HEADER_TEMPLATE_FILE, MAPPING_CLASS_TEMPLATE_FILE
 
 class MappingCodeOutputProvider(OutputProvider):
     _buffer: StringBuilder = None
     _options: MappingCodeOutputProviderOptions
     _vsProjectFacade: VsProjectFacade = None
     _compilerAssetProvider: CompilerAssetProvider = None
+    _outputFiles: list[str] = None
 
     def __init__(self, options: MappingCodeOutputProviderOptions, 
             vsProjectFacade: VsProjectFacade, 
@@ -28,6 +30,23 @@ class MappingCodeOutputProvider(OutputProvider):
         self._vsProjectFacade = vsProjectFacade
         self._compilerAssetProvider = compilerAssetProvider
         self._buffer = StringBuilder()
+        self._outputFiles = []
+
+    def isCacheable(self) -> bool:
+        return True
+
+    def getSourceAssetDependencies(self) -> list[str]:
+        return [LICENSE_HEADER_TEMPLATE_FILE, 
+            MAPPING_CLASS_TEMPLATE_FILE]
+
+    def usesDefinitionObjects(self) -> bool:
+        return False
+
+    def getOutputFiles(self) -> list[str]:
+        return self._outputFiles
+
+    def getConcurrencyGroup(self) -> str:
+        return 'project:' + self._getTargetProjectName()
 
     def writeMapping(self, dbMapping: DbMapping) -> None:
         writer = MappingClassWriter(self._buffer, self._options, self._compilerAssetProvider)
@@ -52,6 +71,7 @@ class MappingCodeOutputProvider(OutputProvider):
         fileSaver.commit(self._getItemGroupLabel(), 
             self._getBuildAction())
 
+        self._outputFiles = fileSaver.getSavedFilePaths()
         self._reset()
 
     def _getVsProjectFileSaver(self) -> VsProjectFileSaver:
@@ -2,6 +2,7 @@
 from ...helper.string_builder import StringBuilder
 from ...model.db_column import DbColumn
 from ...model.db_table import DbTable
+from ...model.db_table_partition import DbTablePartition
 from .markdown_db_object_writer import MarkdownDbObjectWriter
 
 class MarkdownDbTableWriter(MarkdownDbObjectWriter[DbTable]): 
@@ -12,6 +13,9 @@ class MarkdownDbTableWriter(MarkdownDbObjectWriter[DbTable]):
         self._writeObjectHeader(dbTable, defaultTitlePrefix = 'Table')
         self._writeDbTableColumns(dbTable)
 
+        if dbTable.isPartitioned():
+            self._writeDbTablePartitioning(dbTable)
+
     def _writeDbTableColumns(self, dbTable: DbTable) -> None:
         if dbTable.hasColumns():
             columns = ['Column', 'Type', 'Notes']
@@ -34,6 +38,38 @@ class MarkdownDbTableWriter(MarkdownDbObjectWriter[DbTable]):
 
         return rows
 
+    def _writeDbTablePartitioning(self, dbTable: DbTable) -> None:
+        partitioningSpec = dbTable.getPartitioning().getPartitionBySpec()
+        self._writeLines(sprintf('Partitioned by `%s`.' % (partitioningSpec)))
+        self._writeSpacer()
+
+        if dbTable.hasPartitions():
+            columns = ['Partition', 'Bounds', 'Notes']
+            rows = self._getDbTablePartitionsRows(dbTable)
+
+            self._writeMarkdownTable(columns, rows)
+            self._writeSpacer()
+
+    def _getDbTablePartitionsRows(self, dbTable: DbTable) -> list[list[str]]:
+        rows = []
+
+        for partition in dbTable.getPartitions():
+            partNameString = sprintf('`%s`' % (partition.getName()))
+            partBoundsString = sprintf('`%s`' % (partition.getBoundSpec()))
+            partNotesString = self._getDbTablePartitionNotesString(partition)
+
+            rows.append([partNameString, 
+                partBoundsString, 
+                partNotesString])
+
+        return rows
+
+    def _getDbTablePartitionNotesString(self, partition: DbTablePartition) -> str:
+        if partition.hasDescription():
+            return partition.getDescription()
+        else:
+            return '-'
+
     def _getDbTableColumnNotesString(self, dbTable: DbTable, column: DbColumn) -> str:
         notes = []
 
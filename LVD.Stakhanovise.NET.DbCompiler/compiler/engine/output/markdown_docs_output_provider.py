@@ -4,6 +4,7 @@ from ..compiler_asset_provider import CompilerAssetProvider
 from ..helper.string_builder import StringBuilder
 from ..helper.vs_project_facade import VsProjectFacade
 from ..helper.vs_project_file_saver import VsProjectFileSaver
+from ..filesystem.file_system import FileWriter
 
 from ..model.db_function import DbFunction
 from ..model.db_sequence import DbSequence
@@ -24,6 +25,9 @@ class MarkdownDocsOutputProvider(OutputProvider):
     _options: MarkdownDocsOutputProviderOptions = None
     _vsProjectFacade: VsProjectFacade = None
     _compilerAssetProvider: CompilerAssetProvider = None
+    _outputFiles: list[str] = None
+    _streamFileSaver: VsProjectFileSaver = None
+    _streamFileWriter: FileWriter = None
 
     def __init__(self, options: MarkdownDocsOutputProviderOptions, 
             vsProjectFacade: VsProjectFacade, 
@@ -33,6 +37,20 @@ class MarkdownDocsOutputProvider(OutputProvider):
         self._buffer = StringBuilder()
         self._vsProjectFacade = vsProjectFacade
         self._compilerAssetProvider = compilerAssetProvider
+        self._outputFiles = []
+
+    def isCacheable(self) -> bool:
+        return True
+
+    def getSourceAssetDependencies(self) -> list[str]:
+        return [self._getRelativeHeaderFilePath(), 
+            self._getRelativeFooterFilePath()]
+
+    def getOutputFiles(self) -> list[str]:
+        return self._outputFiles
+
+    def getConcurrencyGroup(self) -> str:
+        return 'project:' + self._getTargetProjectName()
 
     def writeMapping(self, dbMapping: DbMapping) -> None:
         pass
@@ -40,39 +58,71 @@ class MarkdownDocsOutputProvider(OutputProvider):
     def writeTable(self, dbTable: DbTable) -> None:
         writer = MarkdownDbTableWriter(self._buffer)
         writer.write(dbTable)
+        self._flushStreamBuffer()
 
     def writeSequence(self, dbSequence: DbSequence) -> None:
         writer = MarkdownDbSequenceWriter(self._buffer)
         writer.write(dbSequence)
+        self._flushStreamBuffer()
 
     def writeFunction(self, dbFunction: DbFunction) -> None:
         writer = MarkdownDbFunctionWriter(self._buffer)
         writer.write(dbFunction)
+        self._flushStreamBuffer()
+
+    def beginStream(self) -> None:
+        self._streamFileSaver = self._getVsProjectFileSaver()
+        self._streamFileWriter = self._streamFileSaver.openFile(self._getRelativeOutputFilePath())
+        self._streamFileWriter.write(self._getFormattedContentsHeader())
+
+    def _flushStreamBuffer(self) -> None:
+        if self._streamFileWriter is not None:
+            self._streamFileWriter.write(self._buffer.toString())
+            self._reset()
+
+    def abortStream(self) -> None:
+        if self._streamFileWriter is not None:
+            self._streamFileWriter.discard()
+
+        self._streamFileWriter = None
+        self._streamFileSaver = None
+        self._reset()
 
     def commit(self) -> None:
-        fileSaver = self._getVsProjectFileSaver()
-        relativeFilePath = self._getRelativeOutputFilePath()
-        fileContents = self._getFileContents()
+        if self._streamFileWriter is not None:
+            fileSaver = self._streamFileSaver
+            self._streamFileWriter.write(self._getFormattedContentsFooter())
+            self._streamFileWriter.close()
+            self._streamFileWriter = None
+            self._streamFileSaver = None
+        else:
+            fileSaver = self._getVsProjectFileSaver()
+            relativeFilePath = self._getRelativeOutputFilePath()
+            fileContents = self._getFileContents()
+            fileSaver.saveFile(relativeFilePath, fileContents)
 
-        fileSaver.saveFile(relativeFilePath, fileContents)
         fileSaver.commit(self._getOutputFileItemGroupLabel(), 
             self._getOutputFileBuildAction(), 
             self._getOutputFileBuildOptions())
 
+        self._outputFiles = fileSaver.getSavedFilePaths()
         self._reset()
 
     def _getFileContents(self) -> str:
         contents = self._buffer.toString()
-        contentsHeader = self._getContentsHeader() or ''
-        contentsFooter = self._getContentsFooter() or ''
+        return self._getFormattedContentsHeader() + contents + self._getFormattedContentsFooter()
 
+    def _getFormattedContentsHeader(self) -> str:
+        contentsHeader = self._getContentsHeader() or ''
         if len(contentsHeader) > 0:
             contentsHeader = contentsHeader + HEADER_SEPARATOR
+        return contentsHeader
 
+    def _getFormattedContentsFooter(self) -> str:
+        contentsFooter = self._getContentsFooter() or ''
         if len(contentsFooter) > 0:
             contentsFooter = FOOTER_SEPARATOR + contentsFooter
-
-        return contentsHeader + contents + contentsFooter
+        return contentsFooter
 
     def _getContentsHeader(self) -> str:
         headerFilePath = self._getRelativeHeaderFilePath()
@@ -1,24 +1,54 @@
 ﻿from abc import ABC, abstractmethod
 from ..model.db import Db
 from ..model.db_mapping import DbMapping
+from ..model.db_object import DbObject
 from ..model.db_function import DbFunction
 from ..model.db_sequence import DbSequence
 from ..model.db_table import DbTable
 
 class OutputProvider(ABC):
     def export(self, db: Db) -> None:
+        self.writeObjects(db)
+        self.commit()
+
+    def writeObjects(self, db: Db) -> None:
         self.writeMapping(db.getMapping())
 
-        for dbSequence in db.getSequences():
-            self.writeSequence(dbSequence)
-        
-        for dbTable in db.getTables():
-            self.writeTable(dbTable)
+        for dbObject in db.getObjectsInDependencyOrder():
+            self.writeObject(dbObject)
+
+    def beginStream(self) -> None:
+        pass
 
-        for dbFunction in db.getFunctions():
-            self.writeFunction(dbFunction)
+    def writeObject(self, dbObject: DbObject) -> None:
+        objectType = dbObject.getType()
+        if DbTable.getObjectType() == objectType:
+            self.writeTable(dbObject)
+        elif DbFunction.getObjectType() == objectType:
+            self.writeFunction(dbObject)
+        elif DbSequence.getObjectType() == objectType:
+            self.writeSequence(dbObject)
 
-        self.commit()
+    def abortStream(self) -> None:
+        pass
+
+    def isCacheable(self) -> bool:
+        return False
+
+    def getSourceAssetDependencies(self) -> list[str]:
+        return []
+
+    def usesDefinitionObjects(self) -> bool:
+        return True
+
+    def supportsObjectSelection(self) -> bool:
+        return False
+
+    def getOutputFiles(self) -> list[str]:
+        return []
+
+    def getConcurrencyGroup(self) -> str:
+        return None
 
     @abstractmethod
     def writeMapping(self, dbMapping: DbMapping) -> None:
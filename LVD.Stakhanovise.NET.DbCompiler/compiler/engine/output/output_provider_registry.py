@@ -1,39 +1,83 @@
 ﻿from typing import Callable
+from importlib.metadata import entry_points
 
 from ..compiler_asset_provider import CompilerAssetProvider
 from ..helper.vs_project_facade import VsProjectFacade
 from ..model.compiler_output_info import CompilerOutputInfo
 
 from .output_provider import OutputProvider
-from .console_output_provider import ConsoleOutputProvider
-from .console_output_provider_options import ConsoleOutputProviderOptions
 
-from .sql_script_output_provider import SqlScriptOutputProvider
-from .sql_script_output_provider_options import SqlScriptOutputProviderOptions
+OUTPUT_PROVIDERS_ENTRY_POINT_GROUP = 'stakhanovise.dbcompiler.output_providers'
 
-from .db_create_output_provider import DbCreateOutputProvider
-from .db_create_output_provider_options import DbCreateOutputProviderOptions
-
-from .markdown_docs_output_provider import MarkdownDocsOutputProvider
-from .markdown_docs_output_provider_options import MarkdownDocsOutputProviderOptions
-
-from .mapping_code_output_provider import MappingCodeOutputProvider
-from .mapping_code_output_provider_options import MappingCodeOutputProviderOptions
+OutputProviderFactory = Callable[[CompilerOutputInfo], OutputProvider]
+ExternalOutputProviderFactory = Callable[[CompilerOutputInfo, VsProjectFacade, CompilerAssetProvider], OutputProvider]
 
 class OutputProviderRegistry:
-    _providers: dict[str, Callable[[CompilerOutputInfo], OutputProvider]] = None
+    _providers: dict[str, OutputProviderFactory] = None
+    _vsProjectFacade: VsProjectFacade = None
+    _compilerAssetProvider: CompilerAssetProvider = None
 
     def __init__(self, vsProjectFacade: VsProjectFacade, compilerAssetProvider: CompilerAssetProvider) -> None:
+        self._vsProjectFacade = vsProjectFacade
+        self._compilerAssetProvider = compilerAssetProvider
         self._providers = {}
-        self._providers['console'] = (lambda outputInfo: ConsoleOutputProvider(ConsoleOutputProviderOptions(outputInfo.getArguments())))
-        self._providers['sql_script'] = (lambda outputInfo: SqlScriptOutputProvider(SqlScriptOutputProviderOptions(outputInfo.getArguments()), vsProjectFacade))
-        self._providers['db_create'] = (lambda outputInfo: DbCreateOutputProvider(DbCreateOutputProviderOptions(outputInfo.getArguments())))
-        self._providers['markdown_docs'] = (lambda outputInfo: MarkdownDocsOutputProvider(MarkdownDocsOutputProviderOptions(outputInfo.getArguments()), vsProjectFacade, compilerAssetProvider))
-        self._providers['mapping_code'] = (lambda outputInfo: MappingCodeOutputProvider(MappingCodeOutputProviderOptions(outputInfo.getArguments()), vsProjectFacade, compilerAssetProvider))
+        self._providers['console'] = self._createConsoleOutputProvider
+        self._providers['sql_script'] = self._createSqlScriptOutputProvider
+        self._providers['db_create'] = self._createDbCreateOutputProvider
+        self._providers['markdown_docs'] = self._createMarkdownDocsOutputProvider
+        self._providers['mapping_code'] = self._createMappingCodeOutputProvider
+
+    def _createConsoleOutputProvider(self, outputInfo: CompilerOutputInfo) -> OutputProvider:
+        from .console_output_provider import ConsoleOutputProvider
+        from .console_output_provider_options import ConsoleOutputProviderOptions
+        return ConsoleOutputProvider(ConsoleOutputProviderOptions(outputInfo.getArguments()))
+
+    def _createSqlScriptOutputProvider(self, outputInfo: CompilerOutputInfo) -> OutputProvider:
+        from .sql_script_output_provider import SqlScriptOutputProvider
+        from .sql_script_output_provider_options import SqlScriptOutputProviderOptions
+        return SqlScriptOutputProvider(SqlScriptOutputProviderOptions(outputInfo.getArguments()), 
+            self._vsProjectFacade)
+
+    def _createDbCreateOutputProvider(self, outputInfo: CompilerOutputInfo) -> OutputProvider:
+        from .db_create_output_provider import DbCreateOutputProvider
+        from .db_create_output_provider_options import DbCreateOutputProviderOptions
+        return DbCreateOutputProvider(DbCreateOutputProviderOptions(outputInfo.getArguments()))
+
+    def _createMarkdownDocsOutputProvider(self, outputInfo: CompilerOutputInfo) -> OutputProvider:
+        from .markdown_docs_output_provider import MarkdownDocsOutputProvider
+        from .markdown_docs_output_provider_options import MarkdownDocsOutputProviderOptions
+        return MarkdownDocsOutputProvider(MarkdownDocsOutputProviderOptions(outputInfo.getArguments()), 
+            self._vsProjectFacade, 
+            self._compilerAssetProvider)
+
+    def _createMappingCodeOutputProvider(self, outputInfo: CompilerOutputInfo) -> OutputProvider:
+        from .mapping_code_output_provider import MappingCodeOutputProvider
+        from .mapping_code_output_provider_options import MappingCodeOutputProviderOptions
+        return MappingCodeOutputProvider(MappingCodeOutputProviderOptions(outputInfo.getArguments()), 
+            self._vsProjectFacade, 
+            self._compilerAssetProvider)
 
     def createOutputProvider(self, outputInfo: CompilerOutputInfo) -> OutputProvider:
-        factory = self._providers.get(outputInfo.getName(), None)
+        factory = self._getOutputProviderFactory(outputInfo.getName())
         if factory is not None:
             return factory(outputInfo)
         else:
-            return None
\ No newline at end of file
+            return None
+
+    def _getOutputProviderFactory(self, outputName: str) -> OutputProviderFactory:
+        factory = self._providers.get(outputName, None)
+        if factory is None:
+            factory = self._discoverExternalOutputProviderFactory(outputName)
+            if factory is not None:
+                self._providers[outputName] = factory
+        return factory
+
+    def _discoverExternalOutputProviderFactory(self, outputName: str) -> OutputProviderFactory:
+        matchingEntryPoints = entry_points(group = OUTPUT_PROVIDERS_ENTRY_POINT_GROUP, name = outputName)
+        for entryPoint in matchingEntryPoints:
+            externalFactory: ExternalOutputProviderFactory = entryPoint.load()
+            return (lambda outputInfo: externalFactory(outputInfo, 
+                self._vsProjectFacade, 
+                self._compilerAssetProvider))
+
+        return None
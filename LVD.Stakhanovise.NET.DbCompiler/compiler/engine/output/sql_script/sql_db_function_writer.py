@@ -14,7 +14,7 @@ class SqlDbFunctionWriter(SqlDbObjectWriter[DbFunction]):
         separator = dbFunction.getSeparator()
 
         paramsList = self._getDbFunctionParamsSqlString(dbFunction)
-        returnInfo = self._getDbFunctionReturnSqlString(dbFunction)
+        returnInfo = self.buildReturnSqlString(dbFunction)
 
         self._sqlStringBuilder.appendLine('CREATE OR REPLACE FUNCTION public.' + name + ' (' + paramsList + ')')
         self._sqlStringBuilder.appendLineIndented('RETURNS ' + returnInfo)
@@ -33,6 +33,8 @@ class SqlDbFunctionWriter(SqlDbObjectWriter[DbFunction]):
         for dbFunctionParam in dbFunction.getParams():
             if dbFunctionParam.getDirection() == 'out':
                 paramPart = 'OUT'
+            elif dbFunctionParam.getDirection() == 'inout':
+                paramPart = 'INOUT'
             else:
                 paramPart = 'IN'
 
@@ -47,7 +49,7 @@ class SqlDbFunctionWriter(SqlDbObjectWriter[DbFunction]):
 
         return ', '.join(paramsParts)
 
-    def _getDbFunctionReturnSqlString(self, dbFunction: DbFunction) -> str:
+    def buildReturnSqlString(self, dbFunction: DbFunction) -> str:
         returnColumnParts = []
         returnInfo = dbFunction.getReturnInfo()
 
@@ -4,6 +4,7 @@ from ...model.db_table import DbTable
 from ...model.db_column import DbColumn
 from ...model.db_constraint import DbConstraint
 from ...model.db_index import DbIndex
+from ...model.db_table_partition import DbTablePartition
 from .sql_db_object_writer import SqlDbObjectWriter
 
 class SqlDbTableWriter(SqlDbObjectWriter[DbTable]):
@@ -14,7 +15,7 @@ class SqlDbTableWriter(SqlDbObjectWriter[DbTable]):
         self._writeTableDefinitionSqlString(dbTable)
 
         if dbTable.hasPrimaryKey():
-            self._writePrimarykeySqlString(dbTable)
+            self.writePrimaryKey(dbTable)
 
         if dbTable.hasUniqueKeys():
             self._writeUniqueKeysSqlString(dbTable)
@@ -22,6 +23,9 @@ class SqlDbTableWriter(SqlDbObjectWriter[DbTable]):
         if dbTable.hasIndexes():
             self._writeIndexesSqlString(dbTable)
 
+        if dbTable.hasPartitions():
+            self._writePartitionsSqlString(dbTable)
+
         self._sqlStringBuilder.appendEmptyLine()
 
     def _writeTableDefinitionSqlString(self, dbTable: DbTable) -> None:
@@ -29,16 +33,19 @@ class SqlDbTableWriter(SqlDbObjectWriter[DbTable]):
 
         for columnIndex in dbTable.getColumnIndexes():
             dbColumn = dbTable.getColumnAtIndex(columnIndex)
-            columnSqlString = self._buildColumnSqlString(dbColumn)
+            columnSqlString = self.buildColumnSqlString(dbColumn)
             
             if columnIndex < dbTable.getColumnCount() - 1:
                 columnSqlString += ','
 
             self._sqlStringBuilder.appendLineIndented(columnSqlString)
 
-        self._sqlStringBuilder.appendLine(');')
+        if dbTable.isPartitioned():
+            self._sqlStringBuilder.appendLine(') PARTITION BY ' + dbTable.getPartitioning().getPartitionBySpec() + ';')
+        else:
+            self._sqlStringBuilder.appendLine(');')
 
-    def _buildColumnSqlString(self, dbColumn: DbColumn) -> str:
+    def buildColumnSqlString(self, dbColumn: DbColumn) -> str:
         columnStringParts = []
 
         columnStringParts.append(dbColumn.getName())
@@ -52,29 +59,51 @@ class SqlDbTableWriter(SqlDbObjectWriter[DbTable]):
 
         return ' '.join(columnStringParts)
 
-    def _writePrimarykeySqlString(self, dbTable: DbTable) -> None:
+    def writePrimaryKey(self, dbTable: DbTable, cascade: bool = True) -> None:
         dbPrimaryKey = dbTable.getPrimaryKey()
 
         self._sqlStringBuilder.appendEmptyLine()
-        self._sqlStringBuilder.appendLine('ALTER TABLE ' + dbTable.getName() + ' DROP CONSTRAINT  IF EXISTS ' + dbPrimaryKey.getName() + ' CASCADE;')
-        self._sqlStringBuilder.appendLine('ALTER TABLE ONLY public.' + dbTable.getName())
+        self._sqlStringBuilder.appendLine('ALTER TABLE ' + dbTable.getName() + ' DROP CONSTRAINT  IF EXISTS ' + dbPrimaryKey.getName() + (' CASCADE;' if cascade else ';'))
+        self._sqlStringBuilder.appendLine(self._getAlterTableSqlString(dbTable))
         self._sqlStringBuilder.appendLineIndented('ADD CONSTRAINT ' + dbPrimaryKey.getName())
         self._sqlStringBuilder.appendLineIndented('PRIMARY KEY (' + ','.join(dbPrimaryKey.getColumnNames()) + ');')
 
+    def _getAlterTableSqlString(self, dbTable: DbTable) -> str:
+        if dbTable.isPartitioned():
+            return 'ALTER TABLE public.' + dbTable.getName()
+        else:
+            return 'ALTER TABLE ONLY public.' + dbTable.getName()
+
     def _writeUniqueKeysSqlString(self, dbTable: DbTable) -> None:
         for dbUniqueKey in dbTable.getUniqueKeys():
-            self._sqlStringBuilder.appendEmptyLine()
-            self._sqlStringBuilder.appendLine('ALTER TABLE ' + dbTable.getName() + ' DROP CONSTRAINT  IF EXISTS ' + dbUniqueKey.getName() + ' CASCADE;')
-            self._sqlStringBuilder.appendLine('ALTER TABLE ONLY public.' + dbTable.getName())
-            self._sqlStringBuilder.appendLineIndented('ADD CONSTRAINT ' + dbUniqueKey.getName())
-            self._sqlStringBuilder.appendLineIndented('UNIQUE (' + ','.join(dbUniqueKey.getColumnNames()) + ');')
+            self.writeUniqueKey(dbTable, dbUniqueKey)
+
+    def writeUniqueKey(self, dbTable: DbTable, dbUniqueKey: DbConstraint, cascade: bool = True) -> None:
+        self._sqlStringBuilder.appendEmptyLine()
+        self._sqlStringBuilder.appendLine('ALTER TABLE ' + dbTable.getName() + ' DROP CONSTRAINT  IF EXISTS ' + dbUniqueKey.getName() + (' CASCADE;' if cascade else ';'))
+        self._sqlStringBuilder.appendLine(self._getAlterTableSqlString(dbTable))
+        self._sqlStringBuilder.appendLineIndented('ADD CONSTRAINT ' + dbUniqueKey.getName())
+        self._sqlStringBuilder.appendLineIndented('UNIQUE (' + ','.join(dbUniqueKey.getColumnNames()) + ');')
 
     def _writeIndexesSqlString(self, dbTable: DbTable) -> None:
         for dbIndex in dbTable.getIndexes():
-            self._sqlStringBuilder.appendEmptyLine()
-            self._sqlStringBuilder.appendLine('CREATE INDEX IF NOT EXISTS ' + dbIndex.getName())
-            self._sqlStringBuilder.appendLineIndented('ON public.' + dbTable.getName() + ' USING ' + dbIndex.getIndexType())
-            self._sqlStringBuilder.appendLineIndented('(' + self._getIndexSqlColumnsString(dbIndex) + ');')
+            self.writeIndex(dbTable, dbIndex)
+
+    def writeIndex(self, dbTable: DbTable, dbIndex: DbIndex, concurrently: bool = False) -> None:
+        self._sqlStringBuilder.appendEmptyLine()
+        self._sqlStringBuilder.appendLine(('CREATE INDEX CONCURRENTLY IF NOT EXISTS ' if concurrently else 'CREATE INDEX IF NOT EXISTS ') + dbIndex.getName())
+        self._sqlStringBuilder.appendLineIndented('ON public.' + dbTable.getName() + ' USING ' + dbIndex.getIndexType())
+        self._sqlStringBuilder.appendLineIndented('(' + self._getIndexSqlColumnsString(dbIndex) + ');')
+
+    def _writePartitionsSqlString(self, dbTable: DbTable) -> None:
+        for dbPartition in dbTable.getPartitions():
+            self.writePartition(dbTable, dbPartition)
+
+    def writePartition(self, dbTable: DbTable, dbPartition: DbTablePartition) -> None:
+        self._sqlStringBuilder.appendEmptyLine()
+        self._sqlStringBuilder.appendLine('CREATE TABLE IF NOT EXISTS public.' + dbPartition.getName())
+        self._sqlStringBuilder.appendLineIndented('PARTITION OF public.' + dbTable.getName())
+        self._sqlStringBuilder.appendLineIndented(dbPartition.getBoundSpec() + ';')
 
     def _getIndexSqlColumnsString(self, dbIndex: DbIndex) -> str:
         columnNamesParts = []
@@ -1,6 +1,7 @@
 ﻿from ..helper.string_builder import StringBuilder
 from ..helper.vs_project_facade import VsProjectFacade
 from ..helper.vs_project_file_saver import VsProjectFileSaver
+from ..filesystem.file_system import FileWriter
 
 from .sql_script_output_provider_options import SqlScriptOutputProviderOptions
 from .sql_script_output_provider_base import SqlScriptOutputProviderBase
@@ -8,14 +9,78 @@ from .sql_script_output_provider_base import SqlScriptOutputProviderBase
 class SqlScriptOutputProvider(SqlScriptOutputProviderBase):
     _options: SqlScriptOutputProviderOptions = None
     _vsProjectFacade: VsProjectFacade = None
+    _outputFiles: list[str] = None
+    _streamFileSaver: VsProjectFileSaver = None
+    _consolidatedFileWriter: FileWriter = None
 
     def __init__(self, options: SqlScriptOutputProviderOptions, vsProjectFacade: VsProjectFacade) -> None:
         super().__init__()
         self._options = options
         self._vsProjectFacade = vsProjectFacade
         self._buffers = {}
+        self._outputFiles = []
+
+    def isCacheable(self) -> bool:
+        return True
+
+    def getOutputFiles(self) -> list[str]:
+        return self._outputFiles
+
+    def getConcurrencyGroup(self) -> str:
+        return 'project:' + self._options.getTargetProjectName()
+
+    def supportsObjectSelection(self) -> bool:
+        return self._options.generateAsSingle()
+
+    def beginStream(self) -> None:
+        super().beginStream()
+        self._streamFileSaver = self._getVsProjectFileSaver()
+
+        if self._options.generateAsConsolidated():
+            fileName = self._getOutputFileName()
+            relativeFilePath = self._getRelativeFilePath(fileName)
+            self._consolidatedFileWriter = self._streamFileSaver.openFile(relativeFilePath)
+
+    def _flushObjectBuffer(self, objectName: str, objectContents: str) -> None:
+        if self._options.generateAsSingle():
+            fileName = self._expandOutputFileName(objectName)
+            relativeFilePath = self._getRelativeFilePath(fileName)
+            self._streamFileSaver.saveFile(relativeFilePath, objectContents)
+        else:
+            self._consolidatedFileWriter.write(objectContents)
+
+    def abortStream(self) -> None:
+        super().abortStream()
+
+        if self._consolidatedFileWriter is not None:
+            self._consolidatedFileWriter.discard()
+
+        self._consolidatedFileWriter = None
+        self._streamFileSaver = None
 
     def commit(self) -> None:
+        if self.isStreaming():
+            self._commitStream()
+        else:
+            self._commitBuffers()
+
+    def _commitStream(self) -> None:
+        fileSaver = self._streamFileSaver
+
+        if self._consolidatedFileWriter is not None:
+            self._consolidatedFileWriter.close()
+
+        fileSaver.commit(self._getOutputFileItemGroupLabel(), 
+            self._getOutputFileBuildAction(), 
+            self._getOutputFileBuildOptions())
+
+        self._outputFiles = fileSaver.getSavedFilePaths()
+
+        self._consolidatedFileWriter = None
+        self._streamFileSaver = None
+        self._streaming = False
+
+    def _commitBuffers(self) -> None:
         globalBuffer = None 
         fileSaver = self._getVsProjectFileSaver()
 
@@ -46,6 +111,8 @@ class SqlScriptOutputProvider(SqlScriptOutputProviderBase):
         if self._options.generateAsConsolidated():
             globalBuffer.close()
 
+        self._outputFiles = fileSaver.getSavedFilePaths()
+
         self._buffers = {}
 
     def _getVsProjectFileSaver(self) -> VsProjectFileSaver:
@@ -13,11 +13,22 @@ from .sql_script.sql_db_function_writer import SqlDbFunctionWriter
 
 class SqlScriptOutputProviderBase(OutputProvider):
     _buffers: dict[str, StringBuilder] = None
+    _streaming: bool = False
 
     def __init__(self) -> None:
         super().__init__()
         self._buffers = {}
 
+    def beginStream(self) -> None:
+        self._streaming = True
+
+    def abortStream(self) -> None:
+        self._streaming = False
+        self._buffers = {}
+
+    def isStreaming(self) -> bool:
+        return self._streaming
+
     def _getObjectBuffer(self, objectName: str) -> StringBuilder:
         objectBuffer = self._buffers.get(objectName, None)
         if objectBuffer is None:
@@ -33,16 +44,30 @@ class SqlScriptOutputProviderBase(OutputProvider):
         objectBuffer = self._getObjectBuffer(dbTable.getName())
         writer = SqlDbTableWriter(objectBuffer)
         writer.write(dbTable)
+        self._objectWritten(dbTable.getName())
 
     def writeSequence(self, dbSequence: DbSequence) -> None:
         objectBuffer = self._getObjectBuffer(dbSequence.getName())
         writer = SqlDbSequenceWriter(objectBuffer)
         writer.write(dbSequence)
+        self._objectWritten(dbSequence.getName())
 
     def writeFunction(self, dbFunction: DbFunction) -> None:
         objectBuffer = self._getObjectBuffer(dbFunction.getName())
         writer = SqlDbFunctionWriter(objectBuffer)
         writer.write(dbFunction)
+        self._objectWritten(dbFunction.getName())
+
+    def _objectWritten(self, objectName: str) -> None:
+        if not self._streaming:
+            return
+
+        objectBuffer = self._buffers.pop(objectName)
+        self._flushObjectBuffer(objectName, objectBuffer.toString())
+        objectBuffer.close()
+
+    def _flushObjectBuffer(self, objectName: str, objectContents: str) -> None:
+        pass
 
     def commit(self) -> None:
         pass
\ No newline at end of file
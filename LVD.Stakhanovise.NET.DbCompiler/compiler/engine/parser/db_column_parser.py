@@ -5,9 +5,11 @@ from .support.named_spec_with_named_args_parser import NamedSpecWithNamedArgsPar
 
 class DbColumnParser:
     _mapping: DbMapping
+    _columnSpecParser: NamedSpecWithNamedArgsParser = None
 
     def __init__(self, mapping: DbMapping):
         self._mapping = mapping
+        self._columnSpecParser = NamedSpecWithNamedArgsParser()
 
     def parse(self, columnContents: str) -> DbColumn:
         columnContents = columnContents or ''
@@ -23,8 +25,7 @@ class DbColumnParser:
             return None
 
     def _readRawColumnPropsValues(self, columnContents: str) -> NamedSpecWithNamedArgs:
-        parser = NamedSpecWithNamedArgsParser()
-        columnPropsValues = parser.parse(columnContents)
+        columnPropsValues = self._columnSpecParser.parse(columnContents)
         return columnPropsValues
 
     def _expandArgs(self, args: dict[str, str]) -> dict[str, str]:
@@ -7,9 +7,13 @@ from ..model.db_constraint import DbConstraint
 
 class DbConstraintParser:
     _mapping: DbMapping
+    _definitionParser: DefinitionWithPropertiesParser = None
+    _columnsParser: ArgsListParser = None
 
     def __init__(self, mapping: DbMapping):
         self._mapping = mapping
+        self._definitionParser = DefinitionWithPropertiesParser(mapping)
+        self._columnsParser = ArgsListParser(',')
 
     def parse(self, constraintContents: str) -> DbConstraint:
         constraintContents = constraintContents or ''
@@ -33,9 +37,7 @@ class DbConstraintParser:
             return None
 
     def _readRawConstraintDefinition(self, constraintContents: str) -> DefinitionWithProperties:
-       parser = DefinitionWithPropertiesParser(self._mapping)
-       return parser.parse(constraintContents)
+       return self._definitionParser.parse(constraintContents)
 
     def _readConstraintColumns(self, argsContents: str) -> list[str]:
-        parser = ArgsListParser(',')
-        return parser.parse(argsContents)
\ No newline at end of file
+        return self._columnsParser.parse(argsContents)
\ No newline at end of file
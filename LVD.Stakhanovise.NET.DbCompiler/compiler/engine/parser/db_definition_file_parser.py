@@ -0,0 +1,55 @@
+﻿import time
+
+from ..model.db_mapping import DbMapping
+from ..model.db_object import DbObject
+from ..helper.source_buffer_cache import SourceBuffer
+from ..helper.source_buffer_cache import SourceBufferCache
+from .db_object_parser import DbObjectParser
+from .db_object_parser_registry import DbObjectParserRegistry
+from .source_definition_file_type_sniffer import SourceDefinitionFileTypeSniffer
+
+class DbDefinitionFileParser:
+    _mapping: DbMapping = None
+    _parserRegistry: DbObjectParserRegistry = None
+    _sourceDefinitionFileTypeSniffer: SourceDefinitionFileTypeSniffer = None
+    _sourceBufferCache: SourceBufferCache = None
+
+    def __init__(self, mapping: DbMapping, sourceBufferCache: SourceBufferCache = None):
+        self._mapping = mapping
+        self._sourceBufferCache = sourceBufferCache or SourceBufferCache()
+        self._parserRegistry = DbObjectParserRegistry()
+        self._sourceDefinitionFileTypeSniffer = SourceDefinitionFileTypeSniffer(self._sourceBufferCache)
+
+    def parse(self, sourceDefinitionFile: str, sourceDefinitionFilePath: str, sourceBuffer: SourceBuffer = None) -> DbObject:
+        if sourceBuffer is not None:
+            self._sourceBufferCache.prime(sourceDefinitionFilePath, sourceBuffer)
+
+        objectType = self._readDefinitionFileObjectType(sourceDefinitionFilePath)
+        if not objectType:
+            raise ValueError('No object type found in definition file <' + sourceDefinitionFile + '>')
+
+        objectParser = self._getParser(objectType)
+        if not objectParser:
+            raise ValueError('Invalid object type <' + objectType + '> found in definition file <' + sourceDefinitionFile + '>')
+
+        obj = objectParser.parseFromFile(sourceDefinitionFilePath)
+        if not obj:
+            raise ValueError('Failed to parse definition file <' + sourceDefinitionFile + '>')
+
+        obj.setSourceFile(sourceDefinitionFile)
+
+        self._sourceBufferCache.invalidate(sourceDefinitionFilePath)
+        return obj
+
+    def parseWithTimings(self, sourceDefinitionFile: str, sourceDefinitionFilePath: str, sourceBuffer: SourceBuffer = None) -> tuple[DbObject, float, float]:
+        wallStart = time.perf_counter()
+        cpuStart = time.thread_time()
+
+        obj = self.parse(sourceDefinitionFile, sourceDefinitionFilePath, sourceBuffer)
+        return (obj, time.perf_counter() - wallStart, time.thread_time() - cpuStart)
+
+    def _readDefinitionFileObjectType(self, sourceDefinitionFilePath: str) -> str:
+       return self._sourceDefinitionFileTypeSniffer.readType(sourceDefinitionFilePath)
+
+    def _getParser(self, objectType: str) -> DbObjectParser:
+        return self._parserRegistry.createParser(objectType, self._mapping, self._sourceBufferCache)
@@ -3,6 +3,11 @@ from .support.named_spec_with_named_args import NamedSpecWithNamedArgs
 from .support.named_spec_with_named_args_parser import NamedSpecWithNamedArgsParser
 
 class DbFunctionParamParaser:
+    _paramSpecParser: NamedSpecWithNamedArgsParser = None
+
+    def __init__(self):
+        self._paramSpecParser = NamedSpecWithNamedArgsParser()
+
     def parse(self, functionParamContents: str) -> DbFunctionParam:
         functionParamContents = functionParamContents or ''
         if (len(functionParamContents) > 0):
@@ -16,6 +21,5 @@ class DbFunctionParamParaser:
             return None
 
     def _readRawParamPropsValues(self, functionParamContents: str) -> NamedSpecWithNamedArgs:
-        parser = NamedSpecWithNamedArgsParser()
-        paramPropsValues = parser.parse(functionParamContents)
+        paramPropsValues = self._paramSpecParser.parse(functionParamContents)
         return paramPropsValues
\ No newline at end of file
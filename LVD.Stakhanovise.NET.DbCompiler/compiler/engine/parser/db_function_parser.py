@@ -7,6 +7,8 @@ from .db_function_param_parser import DbFunctionParamParaser
 from .db_function_return_parser import DbFunctionReturnParser
 from .db_object_props_list_parser import DbObjectPropsListParser
 from .source_file_reader import SourceFileReader
+from .source_line_tokenizer import SourceLineTokenizer
+from ..helper.source_buffer_cache import SourceBufferCache
 
 MARKER_NAME_LINE = "NAME:"
 MARKER_PROPS_LINE = "PROPS:"
@@ -17,12 +19,27 @@ MARKER_BODY_END_LINE = "BODY;"
 
 class DbFunctionParser:
     _mapping: DbMapping = None
+    _sourceBufferCache: SourceBufferCache = None
+    _propsListParser: DbObjectPropsListParser = None
+    _paramParser: DbFunctionParamParaser = None
+    _returnParser: DbFunctionReturnParser = None
+    _lineTokenizer: SourceLineTokenizer = None
 
-    def __init__(self, mapping: DbMapping):
+    def __init__(self, mapping: DbMapping, sourceBufferCache: SourceBufferCache = None):
         self._mapping = mapping
+        self._sourceBufferCache = sourceBufferCache
+        self._propsListParser = DbObjectPropsListParser()
+        self._paramParser = DbFunctionParamParaser()
+        self._returnParser = DbFunctionReturnParser()
+        self._lineTokenizer = SourceLineTokenizer({
+            MARKER_NAME_LINE: self._readName,
+            MARKER_PROPS_LINE: self._readProps,
+            MARKER_PARAM_LINE: self._readParam,
+            MARKER_RETURN_LINE: self._readReturnInfo
+        }, [ MARKER_BODY_START_LINE, MARKER_BODY_END_LINE ])
 
     def parseFromFile(self, sourceFile:str) -> DbFunction:
-        sourceFileReader = SourceFileReader(MARKER_BODY_START_LINE, MARKER_BODY_END_LINE)
+        sourceFileReader = SourceFileReader(MARKER_BODY_START_LINE, MARKER_BODY_END_LINE, sourceBufferCache = self._sourceBufferCache)
         dbFunctionFileLines = sourceFileReader.readSourceLines(sourceFile)
 
         if __class__.isValidDbFunctionFileMapping(dbFunctionFileLines):
@@ -42,30 +59,28 @@ class DbFunctionParser:
         isReadingBody: bool = False
         bodyParts: list[str] = []
 
-        for sourceFileLine in sourceFileLines:
-            if sourceFileLine.startswith(MARKER_NAME_LINE):
-                name = self._readName(sourceFileLine)
+        for marker, value in self._lineTokenizer.tokenize(sourceFileLines):
+            if marker == MARKER_NAME_LINE:
+                name = value
 
-            elif sourceFileLine.startswith(MARKER_PROPS_LINE):
-                lineProps = self._readProps(sourceFileLine) or []
-                props = props + lineProps
+            elif marker == MARKER_PROPS_LINE:
+                props.extend(value)
 
-            elif sourceFileLine.startswith(MARKER_PARAM_LINE):
-                param = self._readParam(sourceFileLine)
-                if param is not None:
-                    params.append(param)
+            elif marker == MARKER_PARAM_LINE:
+                if value is not None:
+                    params.append(value)
 
-            elif sourceFileLine.startswith(MARKER_RETURN_LINE):
-                returnInfo = self._readReturnInfo(sourceFileLine)
+            elif marker == MARKER_RETURN_LINE:
+                returnInfo = value
 
-            elif sourceFileLine == MARKER_BODY_START_LINE:
+            elif marker == MARKER_BODY_START_LINE:
                 isReadingBody = True
 
-            elif sourceFileLine == MARKER_BODY_END_LINE:
+            elif marker == MARKER_BODY_END_LINE:
                 isReadingBody = False
 
             elif isReadingBody:
-                bodySourceFileLine = self._expandFunctionBodyLine(sourceFileLine)
+                bodySourceFileLine = self._expandFunctionBodyLine(value)
                 bodyParts.append(bodySourceFileLine)
 
         dbFunction = DbFunction(name, props)
@@ -75,36 +90,17 @@ class DbFunctionParser:
 
         return dbFunction
 
-    def _readName(self, sourceFileLine: str) -> str:
-        name = self._prepareNameLine(sourceFileLine)
-        return self._mapping.expandString(name)
+    def _readName(self, nameContents: str) -> str:
+        return self._mapping.expandString(nameContents)
 
-    def _prepareNameLine(self, sourceFileLine: str) -> str:
-        return sourceFileLine.replace(MARKER_NAME_LINE, '').strip()
+    def _readProps(self, propsListContents: str) -> list[DbObjectProp]:
+        return self._propsListParser.parse(propsListContents) or []
 
-    def _readProps(self, sourceFileLine: str) -> list[DbObjectProp]:
-        parser = DbObjectPropsListParser()
-        propsListContents = self._preparePropsLine(sourceFileLine)
-        return parser.parse(propsListContents) or []
+    def _readParam(self, paramContents: str) -> DbFunctionParam:
+        return self._paramParser.parse(paramContents)
 
-    def _preparePropsLine(self, sourceFileLine: str) -> str:
-        return sourceFileLine.replace(MARKER_PROPS_LINE, '').strip()
-
-    def _readParam(self, sourceFileLine: str) -> DbFunctionParam:
-        parser = DbFunctionParamParaser()
-        paramContents = self._prepareParamLine(sourceFileLine)
-        return parser.parse(paramContents)
-
-    def _prepareParamLine(self, sourceFileLine: str) -> str:
-        return sourceFileLine.replace(MARKER_PARAM_LINE, '').strip()
-
-    def _readReturnInfo(self, sourceFileLine: str) -> DbFunctionReturn:
-        parser = DbFunctionReturnParser()
-        returnInfoContents = self._prepareReturnInfoLine(sourceFileLine)
-        return parser.parse(returnInfoContents)
-
-    def _prepareReturnInfoLine(self, sourceFileLine: str) -> str:
-        return sourceFileLine.replace(MARKER_RETURN_LINE, '').strip()
+    def _readReturnInfo(self, returnInfoContents: str) -> DbFunctionReturn:
+        return self._returnParser.parse(returnInfoContents)
 
     def _expandFunctionBodyLine(self, sourceFileLineStr: str) -> str:
         return self._mapping.expandString(sourceFileLineStr)
\ No newline at end of file
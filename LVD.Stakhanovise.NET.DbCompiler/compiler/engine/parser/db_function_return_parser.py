@@ -3,6 +3,11 @@ from .support.named_spec_with_named_args import NamedSpecWithNamedArgs
 from .support.named_spec_with_named_args_parser import NamedSpecWithNamedArgsParser
 
 class DbFunctionReturnParser:
+    _returnSpecParser: NamedSpecWithNamedArgsParser = None
+
+    def __init__(self):
+        self._returnSpecParser = NamedSpecWithNamedArgsParser()
+
     def parse(self, returnInfoContents: str) -> DbFunctionReturn:
         returnInfoContents = returnInfoContents or ''
         if (len(returnInfoContents) > 0):
@@ -19,6 +24,5 @@ class DbFunctionReturnParser:
             return None
 
     def _readRawReturnPropsValues(self, returnInfoContents: str) -> NamedSpecWithNamedArgs:
-        parser = NamedSpecWithNamedArgsParser()
-        paramPropsValues = parser.parse(returnInfoContents)
+        paramPropsValues = self._returnSpecParser.parse(returnInfoContents)
         return paramPropsValues
\ No newline at end of file
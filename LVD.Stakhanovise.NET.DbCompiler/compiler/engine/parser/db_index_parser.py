@@ -7,9 +7,13 @@ from ..model.db_index import DbIndex
 
 class DbIndexParser:
     _mapping: DbMapping = None
+    _definitionParser: DefinitionWithPropertiesParser = None
+    _columnsParser: NamedArgsListParser = None
 
     def __init__(self, mapping: DbMapping):
         self._mapping = mapping
+        self._definitionParser = DefinitionWithPropertiesParser(mapping)
+        self._columnsParser = NamedArgsListParser(',')
 
     def parse(self, indexContents: str) -> DbIndex:
         indexContents = indexContents or ''
@@ -30,9 +34,7 @@ class DbIndexParser:
             return None
 
     def _readRawIndexDefinition(self, indexContents: str) -> DefinitionWithProperties:
-       parser = DefinitionWithPropertiesParser(self._mapping)
-       return parser.parse(indexContents)
+       return self._definitionParser.parse(indexContents)
 
     def _readIndexColumns(self, argsContents: str) -> dict[str, str]:
-        parser = NamedArgsListParser(',')
-        return parser.parse(argsContents)
\ No newline at end of file
+        return self._columnsParser.parse(argsContents)
\ No newline at end of file
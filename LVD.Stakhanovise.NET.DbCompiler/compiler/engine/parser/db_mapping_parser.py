@@ -1,11 +1,17 @@
 ﻿from .source_file_reader import SourceFileReader
+from ..helper.source_buffer_cache import SourceBufferCache
 from ..model.db_mapping import DbMapping
 
 MARKER_MAP_SYMBOL_LINE = 'MAP:'
 
 class DbMappingParser:
+    _sourceBufferCache: SourceBufferCache = None
+
+    def __init__(self, sourceBufferCache: SourceBufferCache = None):
+        self._sourceBufferCache = sourceBufferCache
+
     def parse(self, sourceFile: str)  -> DbMapping:
-        sourceFileReader = SourceFileReader()
+        sourceFileReader = SourceFileReader(sourceBufferCache = self._sourceBufferCache)
         mappingFileLines = sourceFileReader.readSourceLines(sourceFile)
         if not mappingFileLines:
             return None
@@ -7,18 +7,19 @@ from .db_object_parser import DbObjectParser
 from .db_sequence_parser import DbSequenceParser
 from .db_table_parser import DbTableParser
 from .db_function_parser import DbFunctionParser
+from ..helper.source_buffer_cache import SourceBufferCache
 
 class DbObjectParserRegistry:
-    _parsers: dict[str, Callable[[DbMapping], DbObjectParser]] = {}
+    _parsers: dict[str, Callable[[DbMapping, SourceBufferCache], DbObjectParser]] = {}
 
     def __init__(self):
-        self._parsers[DbSequence.getObjectType()] = (lambda mapping: DbSequenceParser(mapping))
-        self._parsers[DbTable.getObjectType()] = (lambda mapping: DbTableParser(mapping))
-        self._parsers[DbFunction.getObjectType()] = (lambda mapping: DbFunctionParser(mapping))
+        self._parsers[DbSequence.getObjectType()] = (lambda mapping, sourceBufferCache: DbSequenceParser(mapping, sourceBufferCache))
+        self._parsers[DbTable.getObjectType()] = (lambda mapping, sourceBufferCache: DbTableParser(mapping, sourceBufferCache))
+        self._parsers[DbFunction.getObjectType()] = (lambda mapping, sourceBufferCache: DbFunctionParser(mapping, sourceBufferCache))
 
-    def createParser(self, objectType: str, mapping: DbMapping) -> DbObjectParser:
+    def createParser(self, objectType: str, mapping: DbMapping, sourceBufferCache: SourceBufferCache = None) -> DbObjectParser:
         factory = self._parsers.get(objectType, None)
         if factory is not None:
-            return factory(mapping)
+            return factory(mapping, sourceBufferCache)
         else:
             return None
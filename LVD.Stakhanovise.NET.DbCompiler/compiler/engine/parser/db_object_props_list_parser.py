@@ -2,6 +2,11 @@
 from .support.named_args_list_parser import NamedArgsListParser
 
 class DbObjectPropsListParser:
+    _propsValuesParser: NamedArgsListParser = None
+
+    def __init__(self):
+        self._propsValuesParser = NamedArgsListParser()
+
     def parse(self, propsListContents: str) -> list[DbObjectProp]:
         propsValues: dict = {}
         props: list[DbObjectProp] = []
@@ -15,6 +20,5 @@ class DbObjectPropsListParser:
         return props
 
     def _readRawPropsValues(self, propsListContents: str) -> dict[str, str]:
-        parser = NamedArgsListParser()
-        propsValues = parser.parse(propsListContents)
+        propsValues = self._propsValuesParser.parse(propsListContents)
         return propsValues
\ No newline at end of file
@@ -2,6 +2,8 @@
 from ..model.db_sequence import DbSequence
 from ..model.db_object_prop import DbObjectProp
 from .source_file_reader import SourceFileReader
+from .source_line_tokenizer import SourceLineTokenizer
+from ..helper.source_buffer_cache import SourceBufferCache
 from .db_object_parser import DbObjectParser
 from .db_object_props_list_parser import DbObjectPropsListParser
 
@@ -10,12 +12,21 @@ MARKER_PROP_LINE = "PROPS:"
 
 class DbSequenceParser(DbObjectParser[DbSequence]):
     _mapping: DbMapping = None
+    _sourceBufferCache: SourceBufferCache = None
+    _propsListParser: DbObjectPropsListParser = None
+    _lineTokenizer: SourceLineTokenizer = None
 
-    def __init__(self, mapping: DbMapping):
+    def __init__(self, mapping: DbMapping, sourceBufferCache: SourceBufferCache = None):
         self._mapping = mapping
+        self._sourceBufferCache = sourceBufferCache
+        self._propsListParser = DbObjectPropsListParser()
+        self._lineTokenizer = SourceLineTokenizer({
+            MARKER_NAME_LINE: self._readName,
+            MARKER_PROP_LINE: self._readProps
+        })
 
     def parseFromFile(self, sourceFile:str) -> DbSequence:
-        sourceFileReader = SourceFileReader()
+        sourceFileReader = SourceFileReader(sourceBufferCache = self._sourceBufferCache)
         dbSequenceFileLines = sourceFileReader.readSourceLines(sourceFile)
         
         if __class__.isValidDbSequenceFileMapping(dbSequenceFileLines):
@@ -31,27 +42,17 @@ class DbSequenceParser(DbObjectParser[DbSequence]):
         name: str = None
         props: list[DbObjectProp] = []
 
-        for sourceFileLine in sourceFileLines:
-            if sourceFileLine.startswith(MARKER_NAME_LINE):
-                name = self._readName(sourceFileLine)
-            elif sourceFileLine.startswith(MARKER_PROP_LINE):
-                lineProps = self._readProps(sourceFileLine) or []
-                props = props + lineProps
+        for marker, value in self._lineTokenizer.tokenize(sourceFileLines):
+            if marker == MARKER_NAME_LINE:
+                name = value
+            elif marker == MARKER_PROP_LINE:
+                props.extend(value or [])
 
         return DbSequence(name, props)
 
-    def _readName(self, sourceFileLine: str) -> str:
-        name = self._prepareNameLine(sourceFileLine)
-        return self._mapping.expandString(name)
+    def _readName(self, nameContents: str) -> str:
+        return self._mapping.expandString(nameContents)
 
-    def _prepareNameLine(self, sourceFileLine: str) -> str:
-        return sourceFileLine.replace(MARKER_NAME_LINE, '').strip()
-
-    def _readProps(self, sourceFileLine: str) -> list[DbObjectProp]:
-        parser = DbObjectPropsListParser()
-        propsListContents = self._preparePropsLine(sourceFileLine)
-        return parser.parse(propsListContents)
-
-    def _preparePropsLine(self, sourceFileLine: str) -> str:
-        return sourceFileLine.replace(MARKER_PROP_LINE, '').strip()
+    def _readProps(self, propsListContents: str) -> list[DbObjectProp]:
+        return self._propsListParser.parse(propsListContents)
 
@@ -2,28 +2,60 @@
 from ..model.db_column import DbColumn
 from ..model.db_constraint import DbConstraint
 from ..model.db_index import DbIndex
+from ..model.db_table_partitioning import DbTablePartitioning
+from ..model.db_table_partition import DbTablePartition
 from ..model.db_mapping import DbMapping
 from ..model.db_object_prop import DbObjectProp
 from .db_column_parser import DbColumnParser
 from .db_constraint_parser import DbConstraintParser
 from .db_index_parser import DbIndexParser
+from .db_table_partitioning_parser import DbTablePartitioningParser
+from .db_table_partition_parser import DbTablePartitionParser
 from .db_object_props_list_parser import DbObjectPropsListParser
 from .source_file_reader import SourceFileReader
+from .source_line_tokenizer import SourceLineTokenizer
+from ..helper.source_buffer_cache import SourceBufferCache
 
 MARKER_NAME_LINE = "NAME:"
 MARKER_PROPS_LINE = "PROPS:"
 MARKER_COLUMN_LINE = "COL:"
 MARKER_CONSTRAINT_LINE = "CONSTRAINT:"
 MARKER_INDEX_LINE = "IDX:"
+MARKER_PARTITIONING_LINE = "PARTITION:"
+MARKER_PARTITION_LINE = "PART:"
 
 class DbTableParser:
     _mapping: DbMapping = None
-
-    def __init__(self, mapping: DbMapping):
+    _sourceBufferCache: SourceBufferCache = None
+    _propsListParser: DbObjectPropsListParser = None
+    _columnParser: DbColumnParser = None
+    _indexParser: DbIndexParser = None
+    _constraintParser: DbConstraintParser = None
+    _partitioningParser: DbTablePartitioningParser = None
+    _partitionParser: DbTablePartitionParser = None
+    _lineTokenizer: SourceLineTokenizer = None
+
+    def __init__(self, mapping: DbMapping, sourceBufferCache: SourceBufferCache = None):
         self._mapping = mapping
+        self._sourceBufferCache = sourceBufferCache
+        self._propsListParser = DbObjectPropsListParser()
+        self._columnParser = DbColumnParser(mapping)
+        self._indexParser = DbIndexParser(mapping)
+        self._constraintParser = DbConstraintParser(mapping)
+        self._partitioningParser = DbTablePartitioningParser(mapping)
+        self._partitionParser = DbTablePartitionParser(mapping)
+        self._lineTokenizer = SourceLineTokenizer({
+            MARKER_NAME_LINE: self._readName,
+            MARKER_PROPS_LINE: self._readProps,
+            MARKER_COLUMN_LINE: self._readColumn,
+            MARKER_INDEX_LINE: self._readIndex,
+            MARKER_CONSTRAINT_LINE: self._readConstraint,
+            MARKER_PARTITIONING_LINE: self._readPartitioning,
+            MARKER_PARTITION_LINE: self._readPartition
+        })
 
     def parseFromFile(self, sourceFile:str) -> DbTable:
-        sourceFileReader = SourceFileReader()
+        sourceFileReader = SourceFileReader(sourceBufferCache = self._sourceBufferCache)
         dbTableFileLines = sourceFileReader.readSourceLines(sourceFile)
 
         if __class__.isValidDbTableFileMapping(dbTableFileLines):
@@ -42,32 +74,37 @@ class DbTableParser:
         primaryKey: DbConstraint = None
         uniqueKeys: list[DbConstraint] = []
         indexes: list[DbIndex] = []
+        partitioning: DbTablePartitioning = None
+        partitions: list[DbTablePartition] = []
+
+        for marker, value in self._lineTokenizer.tokenize(sourceFileLines):
+            if marker == MARKER_NAME_LINE:
+                name = value
 
-        for sourceFileLine in sourceFileLines:
-            if sourceFileLine.startswith(MARKER_NAME_LINE):
-                name = self._readName(sourceFileLine)
+            elif marker == MARKER_PROPS_LINE:
+                props.extend(value)
 
-            elif sourceFileLine.startswith(MARKER_PROPS_LINE):
-                lineProps = self._readProps(sourceFileLine) or []
-                props = props + lineProps
+            elif marker == MARKER_COLUMN_LINE:
+                if value is not None:
+                    columns.append(value)
 
-            elif sourceFileLine.startswith(MARKER_COLUMN_LINE):
-                column = self._readColumn(sourceFileLine)
-                if column is not None:
-                    columns.append(column)
+            elif marker == MARKER_INDEX_LINE:
+                if value is not None:
+                    indexes.append(value)
 
-            elif sourceFileLine.startswith(MARKER_INDEX_LINE):
-                index = self._readIndex(sourceFileLine)
-                if index is not None:
-                    indexes.append(index)
+            elif marker == MARKER_CONSTRAINT_LINE:
+                if value is not None:
+                    if value.isUniqueConstraint():
+                        uniqueKeys.append(value)
+                    elif value.isPrimaryKeyConstraint():
+                        primaryKey = value
 
-            elif sourceFileLine.startswith(MARKER_CONSTRAINT_LINE):
-                constraint = self._readConstraint(sourceFileLine)
-                if constraint is not None:
-                    if constraint.isUniqueConstraint():
-                        uniqueKeys.append(constraint)
-                    elif constraint.isPrimaryKeyConstraint():
-                        primaryKey = constraint
+            elif marker == MARKER_PARTITIONING_LINE:
+                partitioning = value
+
+            elif marker == MARKER_PARTITION_LINE:
+                if value is not None:
+                    partitions.append(value)
 
         table = DbTable(name, props)
         table.setColumns(columns)
@@ -77,43 +114,58 @@ class DbTableParser:
         if primaryKey is not None:
             table.setPrimaryKey(primaryKey)
 
-        return table
+        if partitioning is not None or len(partitions) > 0:
+            self._validatePartitioning(name, partitioning, partitions, primaryKey, uniqueKeys)
+            table.setPartitioning(partitioning)
+            table.setPartitions(partitions)
 
-    def _readName(self, sourceFileLine: str) -> str:
-        name = self._prepareNameLine(sourceFileLine)
-        return self._mapping.expandString(name)
-
-    def _prepareNameLine(self, sourceFileLine: str) -> str:
-        return sourceFileLine.replace(MARKER_NAME_LINE, '').strip()
+        return table
 
-    def _readProps(self, sourceFileLine: str) -> list[DbObjectProp]:
-        parser = DbObjectPropsListParser()
-        propsListContents = self._preparePropsLine(sourceFileLine)
-        return parser.parse(propsListContents) or []
+    def _validatePartitioning(self, name: str, 
+            partitioning: DbTablePartitioning, 
+            partitions: list[DbTablePartition], 
+            primaryKey: DbConstraint, 
+            uniqueKeys: list[DbConstraint]) -> None:
+        if partitioning is None:
+            raise ValueError('Table <' + name + '> declares partitions, but no partitioning method')
+
+        for partition in partitions:
+            if not self._isPartitionBoundCompatible(partitioning, partition):
+                raise ValueError('Partition <' + partition.getName() + '> bounds do not match the <' + partitioning.getMethod() + '> partitioning of table <' + name + '>')
+
+        keyConstraints = ([primaryKey] if primaryKey is not None else []) + uniqueKeys
+        for keyConstraint in keyConstraints:
+            for columnName in partitioning.getColumnNames():
+                if not keyConstraint.hasColumn(columnName):
+                    raise ValueError('Constraint <' + keyConstraint.getName() + '> must include partition key column <' + columnName + '>')
+
+    def _isPartitionBoundCompatible(self, partitioning: DbTablePartitioning, partition: DbTablePartition) -> bool:
+        if partition.isDefault():
+            return not partitioning.isHashPartitioning()
+        elif partitioning.isRangePartitioning():
+            return partition.getFromValues() is not None and partition.getToValues() is not None
+        elif partitioning.isListPartitioning():
+            return partition.isListPartition()
+        else:
+            return partition.getModulus() is not None and partition.getRemainder() is not None
 
-    def _preparePropsLine(self, sourceFileLine: str) -> str:
-        return sourceFileLine.replace(MARKER_PROPS_LINE, '').strip()
+    def _readName(self, nameContents: str) -> str:
+        return self._mapping.expandString(nameContents)
 
-    def _readColumn(self, sourceFileLine: str) -> DbColumn:
-        parser = DbColumnParser(self._mapping)
-        columnContents = self._prepareColumnLine(sourceFileLine)
-        return parser.parse(columnContents)
+    def _readProps(self, propsListContents: str) -> list[DbObjectProp]:
+        return self._propsListParser.parse(propsListContents) or []
 
-    def _prepareColumnLine(self, sourceFileLine: str) -> str:
-        return sourceFileLine.replace(MARKER_COLUMN_LINE, '').strip()
+    def _readColumn(self, columnContents: str) -> DbColumn:
+        return self._columnParser.parse(columnContents)
 
-    def _readIndex(self, sourceFileLine: str) -> DbIndex:
-        parser = DbIndexParser(self._mapping)
-        indexContents = self._prepareIndexLine(sourceFileLine)
-        return parser.parse(indexContents)
+    def _readIndex(self, indexContents: str) -> DbIndex:
+        return self._indexParser.parse(indexContents)
 
-    def _prepareIndexLine(self, sourceFileLine: str) -> str:
-        return sourceFileLine.replace(MARKER_INDEX_LINE, '').strip()
+    def _readConstraint(self, constraintContents: str) -> DbConstraint:
+        return self._constraintParser.parse(constraintContents)
 
-    def _readConstraint(self, sourceFileLine: str) -> DbConstraint:
-        parser = DbConstraintParser(self._mapping)
-        constraintContents = self._prepareConstraintLine(sourceFileLine)
-        return parser.parse(constraintContents)
+    def _readPartitioning(self, partitioningContents: str) -> DbTablePartitioning:
+        return self._partitioningParser.parse(partitioningContents)
 
-    def _prepareConstraintLine(self, sourceFileline: str) -> str:
-        return sourceFileline.replace(MARKER_CONSTRAINT_LINE, '').strip()
\ No newline at end of file
+    def _readPartition(self, partitionContents: str) -> DbTablePartition:
+        return self._partitionParser.parse(partitionContents)
\ No newline at end of file
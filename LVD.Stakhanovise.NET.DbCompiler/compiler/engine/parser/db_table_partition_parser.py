@@ -0,0 +1,38 @@
+﻿from ..model.db_table_partition import DbTablePartition
+from ..model.db_mapping import DbMapping
+from .support.named_spec_with_named_args import NamedSpecWithNamedArgs
+from .support.named_spec_with_named_args_parser import NamedSpecWithNamedArgsParser
+
+class DbTablePartitionParser:
+    _mapping: DbMapping
+    _partitionSpecParser: NamedSpecWithNamedArgsParser = None
+
+    def __init__(self, mapping: DbMapping):
+        self._mapping = mapping
+        self._partitionSpecParser = NamedSpecWithNamedArgsParser()
+
+    def parse(self, partitionContents: str) -> DbTablePartition:
+        partitionContents = partitionContents or ''
+        if (len(partitionContents) > 0):
+            partitionPropsValues = self._readRawPartitionPropsValues(partitionContents)
+
+            name = self._mapping.expandString(partitionPropsValues.getName().strip())
+            args = self._expandArgs(partitionPropsValues.getArgs())
+
+            return DbTablePartition.createFromNameAndArgs(name, args)
+        else:
+            return None
+
+    def _readRawPartitionPropsValues(self, partitionContents: str) -> NamedSpecWithNamedArgs:
+        return self._partitionSpecParser.parse(partitionContents)
+
+    def _expandArgs(self, args: dict[str, str]) -> dict[str, str]:
+        expandedArgs = {}
+
+        for argKey in args.keys():
+            argValue = args[argKey]
+            if argKey != "description" and argValue is not None:
+                argValue = self._mapping.expandString(argValue)
+            expandedArgs[argKey] = argValue
+
+        return expandedArgs
@@ -0,0 +1,37 @@
+﻿from .support.args_list_parser import ArgsListParser
+from .support.named_spec_with_args_raw_parser import NamedSpecWithArgsRawParser
+from ..model.db_mapping import DbMapping
+from ..model.db_table_partitioning import DbTablePartitioning
+
+class DbTablePartitioningParser:
+    _mapping: DbMapping
+    _partitioningSpecParser: NamedSpecWithArgsRawParser = None
+    _columnsParser: ArgsListParser = None
+
+    def __init__(self, mapping: DbMapping):
+        self._mapping = mapping
+        self._partitioningSpecParser = NamedSpecWithArgsRawParser()
+        self._columnsParser = ArgsListParser(',')
+
+    def parse(self, partitioningContents: str) -> DbTablePartitioning:
+        partitioningContents = partitioningContents or ''
+        if (len(partitioningContents) > 0):
+            partitioningParts = self._readRawPartitioningParts(partitioningContents)
+
+            partitioningMethod = partitioningParts["name"].strip().lower()
+            if (not DbTablePartitioning.isValidMethod(partitioningMethod)):
+                raise ValueError('Partitioning method is of invalid type: <' + partitioningMethod + '>')
+
+            partitioningColumns = self._readPartitioningColumns(partitioningParts["args"])
+            if (len(partitioningColumns) == 0):
+                raise ValueError('Partitioning method <' + partitioningMethod + '> requires at least one key column')
+
+            return DbTablePartitioning(partitioningMethod, partitioningColumns)
+        else:
+            return None
+
+    def _readRawPartitioningParts(self, partitioningContents: str) -> dict[str, str]:
+        return self._partitioningSpecParser.parse(partitioningContents)
+
+    def _readPartitioningColumns(self, argsContents: str) -> list[str]:
+        return self._columnsParser.parse(argsContents)
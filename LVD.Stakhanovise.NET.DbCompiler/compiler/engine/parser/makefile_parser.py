@@ -2,19 +2,32 @@
 from os.path import exists
 
 from .source_file_reader import SourceFileReader
+from ..helper.source_buffer_cache import SourceBufferCache
 from .support.named_spec_with_named_args import NamedSpecWithNamedArgs
 from .support.named_spec_with_named_args_parser import NamedSpecWithNamedArgsParser
 
 from ..model.compiler_output_info import CompilerOutputInfo
+from ..model.compiler_variant_info import CompilerVariantInfo
 from ..model.makefile_info import MakefileInfo
+from ..helper.string import str_to_bool
 
 MARKER_MAP_LINE = 'MAP='
 MARKER_DEFINITIONS_LINE = 'DEFINITIONS='
 MARKER_OUTPUT_LINE = 'OUTPUT='
+MARKER_JOBS_LINE = 'JOBS='
+MARKER_CONCURRENT_OUTPUTS_LINE = 'CONCURRENT_OUTPUTS='
+MARKER_STREAMING_LINE = 'STREAMING='
+MARKER_VARIANT_LINE = 'VARIANT='
+MARKER_VALIDATE_LINE = 'VALIDATE='
 
 class MakefileParser:
+    _sourceBufferCache: SourceBufferCache = None
+
+    def __init__(self, sourceBufferCache: SourceBufferCache = None):
+        self._sourceBufferCache = sourceBufferCache
+
     def parse(self, sourceFile: str) -> MakefileInfo:
-        sourceFileReader = SourceFileReader()
+        sourceFileReader = SourceFileReader(sourceBufferCache = self._sourceBufferCache)
         makefileLines = sourceFileReader.readSourceLines(sourceFile)
         if not makefileLines:
             return None
@@ -41,11 +54,32 @@ class MakefileParser:
             definitionFilesGlob = self._readDefinitionsFilesGlob(makefileLine)
             makefileInfo.setDefinitionFilesGlob(definitionFilesGlob)
 
+        elif (makefileLine.startswith(MARKER_JOBS_LINE)):
+            jobs = self._readJobs(makefileLine)
+            makefileInfo.setJobs(jobs)
+
+        elif (makefileLine.startswith(MARKER_CONCURRENT_OUTPUTS_LINE)):
+            concurrentOutputs = self._readConcurrentOutputs(makefileLine)
+            makefileInfo.setConcurrentOutputs(concurrentOutputs)
+
+        elif (makefileLine.startswith(MARKER_STREAMING_LINE)):
+            streaming = self._readStreaming(makefileLine)
+            makefileInfo.setStreaming(streaming)
+
+        elif (makefileLine.startswith(MARKER_VALIDATE_LINE)):
+            validate = self._readValidate(makefileLine)
+            makefileInfo.setValidate(validate)
+
         elif makefileLine.startswith(MARKER_OUTPUT_LINE):
             compilerOutpuInfo = self._readCompilerOutputInfo(makefileLine)
             if (compilerOutpuInfo is not None):
                 makefileInfo.addOutput(compilerOutpuInfo)
 
+        elif makefileLine.startswith(MARKER_VARIANT_LINE):
+            compilerVariantInfo = self._readCompilerVariantInfo(makefileLine)
+            if (compilerVariantInfo is not None):
+                makefileInfo.addVariant(compilerVariantInfo)
+
     def _readMappingFileName(self, makefileLine: str) -> str:
         mappingFileName = self._prepareMappingFileNameLine(makefileLine)
         if (len(mappingFileName) > 0):
@@ -66,6 +100,40 @@ class MakefileParser:
     def _prepareDefinitionFilesGlobLine(self, makefileLine: str) -> str:
         return makefileLine.replace(MARKER_DEFINITIONS_LINE, '').strip()
 
+    def _readJobs(self, makefileLine: str) -> int:
+        jobs = self._prepareJobsLine(makefileLine)
+        if (len(jobs) == 0):
+            return None
+
+        if not jobs.isdigit():
+            raise ValueError('Invalid JOBS value <' + jobs + '>: a positive integer is expected')
+
+        return int(jobs)
+
+    def _prepareJobsLine(self, makefileLine: str) -> str:
+        return makefileLine.replace(MARKER_JOBS_LINE, '').strip()
+
+    def _readConcurrentOutputs(self, makefileLine: str) -> bool:
+        concurrentOutputs = self._prepareConcurrentOutputsLine(makefileLine)
+        return str_to_bool(concurrentOutputs)
+
+    def _prepareConcurrentOutputsLine(self, makefileLine: str) -> str:
+        return makefileLine.replace(MARKER_CONCURRENT_OUTPUTS_LINE, '').strip()
+
+    def _readStreaming(self, makefileLine: str) -> bool:
+        streaming = self._prepareStreamingLine(makefileLine)
+        return str_to_bool(streaming)
+
+    def _prepareStreamingLine(self, makefileLine: str) -> str:
+        return makefileLine.replace(MARKER_STREAMING_LINE, '').strip()
+
+    def _readValidate(self, makefileLine: str) -> bool:
+        validate = self._prepareValidateLine(makefileLine)
+        return str_to_bool(validate)
+
+    def _prepareValidateLine(self, makefileLine: str) -> str:
+        return makefileLine.replace(MARKER_VALIDATE_LINE, '').strip()
+
     def _readCompilerOutputInfo(self, makefileLine: str) -> CompilerOutputInfo:
         compilerOutputInfoContents = self._prepareCompilerOutputInfoLine(makefileLine)
         
@@ -79,6 +147,25 @@ class MakefileParser:
     def _prepareCompilerOutputInfoLine(self, makefileLine: str) -> str:
         return makefileLine.replace(MARKER_OUTPUT_LINE, '').strip()
 
+    def _readCompilerVariantInfo(self, makefileLine: str) -> CompilerVariantInfo:
+        compilerVariantInfoContents = self._prepareCompilerVariantInfoLine(makefileLine)
+        if (len(compilerVariantInfoContents) == 0):
+            return None
+
+        compilerVariantParser = NamedSpecWithNamedArgsParser()
+        compilerVariantSpec = compilerVariantParser.parse(compilerVariantInfoContents)
+
+        compilerVariantInfo = CompilerVariantInfo.createFromArguments(compilerVariantSpec.getName(), 
+            compilerVariantSpec.getArgs())
+
+        if not compilerVariantInfo.hasMappingFileName() and not compilerVariantInfo.getPrefix():
+            raise ValueError('Variant <' + compilerVariantInfo.getName() + '> must specify a mapping file (map) or a prefix (prefix)')
+
+        return compilerVariantInfo
+
+    def _prepareCompilerVariantInfoLine(self, makefileLine: str) -> str:
+        return makefileLine.replace(MARKER_VARIANT_LINE, '').strip()
+
     def _parseCompilerOutputInfo(self, compilerOutputInfoContents: str) -> CompilerOutputInfo:
         compilerOutputParser = NamedSpecWithNamedArgsParser()
         compilerOutputSpec = compilerOutputParser.parse(compilerOutputInfoContents)
@@ -1,20 +1,36 @@
 ﻿from os.path import abspath
-from os.path import exists
+from ..helper.source_buffer_cache import SourceBufferCache
+
+MARKER_NAME_LINE = "NAME:"
 
 class SourceDefinitionFileTypeSniffer:
-    def readType(self, sourceFile: str) -> str:
-        absoluteSourceFilePath = self._determineAbsoluteSourceFilePath(sourceFile)
-        if (exists(absoluteSourceFilePath) is False):
-            raise FileNotFoundError("Source not found at path <" + absoluteSourceFilePath + ">")
+    _sourceBufferCache: SourceBufferCache = None
+
+    def __init__(self, sourceBufferCache: SourceBufferCache = None):
+        self._sourceBufferCache = sourceBufferCache or SourceBufferCache()
 
-        peekFileHandle = open(absoluteSourceFilePath, 'r', encoding='utf_8_sig')
-        typeLine = peekFileHandle.readline()
-        peekFileHandle.close()
+    def readType(self, sourceFile: str) -> str:
+        absoluteSourceFilePath = self._determineExistingSourceFilePath(sourceFile)
+        typeLine = self._sourceBufferCache.getFirstLine(absoluteSourceFilePath)
 
         if typeLine:
             return typeLine.strip()
         else:
             return None
 
+    def readName(self, sourceFile: str) -> str:
+        absoluteSourceFilePath = self._determineExistingSourceFilePath(sourceFile)
+        for sourceFileLine in self._sourceBufferCache.getLines(absoluteSourceFilePath):
+            if sourceFileLine.startswith(MARKER_NAME_LINE):
+                return sourceFileLine[len(MARKER_NAME_LINE):].strip()
+
+        return None
+
+    def _determineExistingSourceFilePath(self, sourceFile: str) -> str:
+        absoluteSourceFilePath = self._determineAbsoluteSourceFilePath(sourceFile)
+        if (self._sourceBufferCache.exists(absoluteSourceFilePath) is False):
+            raise FileNotFoundError("Source not found at path <" + absoluteSourceFilePath + ">")
+        return absoluteSourceFilePath
+
     def _determineAbsoluteSourceFilePath(self, sourceFile: str) -> str:
         return abspath(sourceFile)
\ No newline at end of file
@@ -1,5 +1,5 @@
 ﻿from os.path import abspath
-from os.path import exists
+from ..helper.source_buffer_cache import SourceBufferCache
 
 def _removeLineEnding(line: str) -> str:
     return line.rstrip()
@@ -13,19 +13,19 @@ def _isProcessableFileLine(line: str) -> bool:
 class SourceFileReader:
     _verbatimFromMarker: str = None
     _verbatimToMarker: str = None
+    _sourceBufferCache: SourceBufferCache = None
 
-    def __init__(self, vermatimFromMarker: str = None, verbatimToMarker: str = None):
+    def __init__(self, vermatimFromMarker: str = None, verbatimToMarker: str = None, sourceBufferCache: SourceBufferCache = None):
         self._verbatimFromMarker = vermatimFromMarker
         self._verbatimToMarker = verbatimToMarker
+        self._sourceBufferCache = sourceBufferCache or SourceBufferCache()
 
     def readSourceLines(self, sourceFile: str) -> list[str]:
         absoluteSourceFilePath = self._determineAbsoluteSourceFilePath(sourceFile)
-        if (exists(absoluteSourceFilePath) is False):
+        if (self._sourceBufferCache.exists(absoluteSourceFilePath) is False):
             raise FileNotFoundError("Source not found at path <" + absoluteSourceFilePath + ">")
 
-        sourceFileHandle = open(absoluteSourceFilePath, 'r', encoding='utf_8_sig')
-        sourceFileLines = sourceFileHandle.readlines()
-        sourceFileHandle.close()
+        sourceFileLines = self._sourceBufferCache.getLines(absoluteSourceFilePath)
 
         sourceFileLines = self._preprocessLines(sourceFileLines)
         sourceFileLines = filter(lambda line: _isProcessableFileLine(line), sourceFileLines)
@@ -0,0 +1,34 @@
+﻿import re
+from typing import Any, Callable, Iterator
+
+SourceLineToken = tuple[str, Any]
+
+class SourceLineTokenizer:
+    _lineRegex: re.Pattern = None
+    _lineReaders: dict[str, Callable[[str], Any]] = None
+    _exactMarkers: frozenset[str] = None
+
+    def __init__(self, lineReaders: dict[str, Callable[[str], Any]], exactMarkers: list[str] = None):
+        self._lineReaders = lineReaders
+        self._lineRegex = self._compileLineRegex(lineReaders.keys())
+        self._exactMarkers = frozenset(exactMarkers or [])
+
+    def _compileLineRegex(self, markers: list[str]) -> re.Pattern:
+        sortedMarkers = sorted(markers, key = len, reverse = True)
+        markersPattern = '|'.join(map(re.escape, sortedMarkers))
+        return re.compile('^(' + markersPattern + ')(.*)$', re.DOTALL)
+
+    def tokenize(self, sourceFileLines: list[str]) -> Iterator[SourceLineToken]:
+        matchLine = self._lineRegex.match
+        lineReaders = self._lineReaders
+        exactMarkers = self._exactMarkers
+
+        for sourceFileLine in sourceFileLines:
+            lineMatch = matchLine(sourceFileLine)
+            if lineMatch is not None:
+                marker = lineMatch.group(1)
+                yield (marker, lineReaders[marker](lineMatch.group(2).strip()))
+            elif sourceFileLine in exactMarkers:
+                yield (sourceFileLine, None)
+            else:
+                yield (None, sourceFileLine)
@@ -5,9 +5,13 @@ from .named_spec_with_args_raw_parser import NamedSpecWithArgsRawParser
 
 class DefinitionWithPropertiesParser:
     _mapping: DbMapping = None
+    _objectPartsParser: NamedSpecWithArgsRawParser = None
+    _propertiesParser: NamedArgsListParser = None
 
     def __init__(self, mapping: DbMapping):
         self._mapping = mapping
+        self._objectPartsParser = NamedSpecWithArgsRawParser()
+        self._propertiesParser = NamedArgsListParser(';')
 
     def parse(self, contents: str) -> DefinitionWithProperties:
         if (len(contents) > 0):
@@ -46,12 +50,10 @@ class DefinitionWithPropertiesParser:
         return definitionParts
 
     def _readDefinitionObjectParts(self, definitionObject: str) -> dict[str, str]:
-        parser = NamedSpecWithArgsRawParser()
-        return parser.parse(definitionObject)
+        return self._objectPartsParser.parse(definitionObject)
 
     def _readDefinitionProperties(self, definitionProperties: str) -> dict:
-        parser = NamedArgsListParser(';')
-        return parser.parse(definitionProperties)
+        return self._propertiesParser.parse(definitionProperties)
 
     def _expandName(self, name:str) -> str:
         return self._mapping.expandString(name)
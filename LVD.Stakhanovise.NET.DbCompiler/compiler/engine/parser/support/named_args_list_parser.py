@@ -2,9 +2,11 @@
 
 class NamedArgsListParser:
     _separator: str = None
+    _argsListParser: ArgsListParser = None
 
     def __init__(self, separator: str = ';'):
         self._separator = separator
+        self._argsListParser = ArgsListParser(separator)
 
     def parse(self, argsContents: str) -> dict[str, str]:
         args = {}
@@ -27,5 +29,4 @@ class NamedArgsListParser:
         return args
 
     def _parseRawArgsList(self, argsContents: str) -> list[str]:
-        parser = ArgsListParser(self._separator)
-        return parser.parse(argsContents)
\ No newline at end of file
+        return self._argsListParser.parse(argsContents)
\ No newline at end of file
@@ -4,9 +4,13 @@ from .named_spec_with_args_raw_parser import NamedSpecWithArgsRawParser
 
 class NamedSpecWithNamedArgsParser:
     _separator: str = None
+    _rawParser: NamedSpecWithArgsRawParser = None
+    _argsParser: NamedArgsListParser = None
 
     def __init__(self, separator: str = ';'):
         self._separator = separator
+        self._rawParser = NamedSpecWithArgsRawParser()
+        self._argsParser = NamedArgsListParser(separator)
 
     def parse(self, contents: str) -> NamedSpecWithNamedArgs:
         rawParts = self._parseRawParts(contents)
@@ -18,9 +22,7 @@ class NamedSpecWithNamedArgsParser:
         return NamedSpecWithNamedArgs(name, args)
 
     def _parseRawParts(self, contents: str) -> dict[str, str]:
-        rawParser = NamedSpecWithArgsRawParser()
-        return rawParser.parse(contents)
+        return self._rawParser.parse(contents)
 
     def _parseArgs(self, argsContents: str) -> dict[str, str]:
-        parser = NamedArgsListParser(self._separator)
-        return parser.parse(argsContents)
\ No newline at end of file
+        return self._argsParser.parse(argsContents)
\ No newline at end of file
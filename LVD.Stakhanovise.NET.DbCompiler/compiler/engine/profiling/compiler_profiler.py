@@ -0,0 +1,144 @@
+﻿import time
+import cProfile
+import tracemalloc
+from threading import Lock
+from threading import local
+
+from ..compiler_hooks import CompilerHooks
+from .profiled_phase import ProfiledPhase
+
+class _OpenPhase:
+    phase: str = None
+    subject: str = None
+    depth: int = 0
+    wallStart: float = 0
+    cpuStart: float = 0
+    memoryStart: int = 0
+    memoryPeak: int = 0
+
+class CompilerProfiler(CompilerHooks):
+    _traceMemory: bool = True
+    _cProfileDumpFilePath: str = None
+    _cProfile: cProfile.Profile = None
+    _startedTracingMemory: bool = False
+    _profilerStart: float = 0
+    _records: list[ProfiledPhase] = None
+    _openPhases: list[_OpenPhase] = None
+    _threadState: local = None
+    _lock: Lock = None
+
+    def __init__(self, traceMemory: bool = True, cProfileDumpFilePath: str = None) -> None:
+        self._traceMemory = traceMemory
+        self._cProfileDumpFilePath = cProfileDumpFilePath
+        self._records = []
+        self._openPhases = []
+        self._threadState = local()
+        self._lock = Lock()
+
+    def start(self) -> None:
+        self._profilerStart = time.perf_counter()
+
+        if self._traceMemory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._startedTracingMemory = True
+
+        if self._cProfileDumpFilePath:
+            self._cProfile = cProfile.Profile()
+            self._cProfile.enable()
+
+    def stop(self) -> None:
+        if self._cProfile is not None:
+            self._cProfile.disable()
+            self._cProfile.dump_stats(self._cProfileDumpFilePath)
+            self._cProfile = None
+
+        if self._startedTracingMemory:
+            tracemalloc.stop()
+            self._startedTracingMemory = False
+
+    def getRecords(self) -> list[ProfiledPhase]:
+        with self._lock:
+            return sorted(self._records, key = lambda record: record.getStartTime())
+
+    def beforePhase(self, phase: str, subject: str = None) -> None:
+        phaseStack = self._getPhaseStack()
+
+        openPhase = _OpenPhase()
+        openPhase.phase = phase
+        openPhase.subject = subject
+        openPhase.depth = len(phaseStack)
+
+        with self._lock:
+            self._foldMemoryPeak()
+            openPhase.memoryStart = self._getCurrentMemory()
+            openPhase.memoryPeak = openPhase.memoryStart
+            self._openPhases.append(openPhase)
+
+        phaseStack.append(openPhase)
+        openPhase.cpuStart = time.thread_time()
+        openPhase.wallStart = time.perf_counter()
+
+    def afterPhase(self, phase: str, subject: str = None) -> None:
+        wallEnd = time.perf_counter()
+        cpuEnd = time.thread_time()
+
+        phaseStack = self._getPhaseStack()
+        if len(phaseStack) == 0:
+            return
+
+        openPhase = phaseStack.pop()
+        with self._lock:
+            self._foldMemoryPeak()
+            self._openPhases.remove(openPhase)
+            self._records.append(ProfiledPhase(openPhase.phase, 
+                openPhase.subject, 
+                openPhase.depth, 
+                openPhase.wallStart - self._profilerStart, 
+                wallEnd - openPhase.wallStart, 
+                cpuEnd - openPhase.cpuStart, 
+                self._getMemoryPeakDelta(openPhase)))
+
+    def recordPhase(self, phase: str, subject: str, wallTime: float, cpuTime: float) -> None:
+        phaseEnd = time.perf_counter()
+        phaseStack = self._getPhaseStack()
+
+        with self._lock:
+            self._records.append(ProfiledPhase(phase, 
+                subject, 
+                len(phaseStack), 
+                phaseEnd - wallTime - self._profilerStart, 
+                wallTime, 
+                cpuTime, 
+                None))
+
+    def _getPhaseStack(self) -> list[_OpenPhase]:
+        phaseStack = getattr(self._threadState, 'phaseStack', None)
+        if phaseStack is None:
+            phaseStack = []
+            self._threadState.phaseStack = phaseStack
+        return phaseStack
+
+    def _isTracingMemory(self) -> bool:
+        return self._traceMemory and tracemalloc.is_tracing()
+
+    def _getCurrentMemory(self) -> int:
+        if self._isTracingMemory():
+            return tracemalloc.get_traced_memory()[0]
+        else:
+            return 0
+
+    def _foldMemoryPeak(self) -> None:
+        if not self._isTracingMemory():
+            return
+
+        memoryPeak = tracemalloc.get_traced_memory()[1]
+        for openPhase in self._openPhases:
+            openPhase.memoryPeak = max(openPhase.memoryPeak, memoryPeak)
+
+        tracemalloc.reset_peak()
+
+    def _getMemoryPeakDelta(self, openPhase: _OpenPhase) -> int:
+        if self._isTracingMemory():
+            return openPhase.memoryPeak - openPhase.memoryStart
+        else:
+            return None
@@ -0,0 +1,94 @@
+﻿import json
+
+from .profiled_phase import ProfiledPhase
+
+PROFILE_FORMAT_TABLE = 'table'
+PROFILE_FORMAT_JSON = 'json'
+
+SUBJECT_MAX_WIDTH = 70
+
+class ProfileReportWriter:
+    _records: list[ProfiledPhase] = None
+
+    def __init__(self, records: list[ProfiledPhase]) -> None:
+        self._records = records
+
+    def render(self, profileFormat: str) -> str:
+        if profileFormat == PROFILE_FORMAT_JSON:
+            return self.renderJson()
+        elif profileFormat == PROFILE_FORMAT_TABLE:
+            return self.renderTable()
+        else:
+            raise ValueError('Unsupported profile format <' + str(profileFormat) + '>')
+
+    def toDict(self) -> dict:
+        return {
+            'unit': { 'time': 'seconds', 'memory': 'bytes' },
+            'phases': self._summarizePhases(),
+            'entries': [record.toDict() for record in self._records]
+        }
+
+    def renderJson(self) -> str:
+        return json.dumps(self.toDict(), indent = 2)
+
+    def renderTable(self) -> str:
+        from prettytable import PrettyTable
+
+        summaryTable = PrettyTable()
+        summaryTable.field_names = ['Phase', 'Count', 'Wall (ms)', 'CPU (ms)', 'Peak memory (KiB)']
+        summaryTable.align = 'r'
+        summaryTable.align['Phase'] = 'l'
+
+        for phase, phaseSummary in self._summarizePhases().items():
+            summaryTable.add_row([phase, 
+                phaseSummary['count'], 
+                self._formatTime(phaseSummary['wall_time']), 
+                self._formatTime(phaseSummary['cpu_time']), 
+                self._formatMemory(phaseSummary['memory_peak_bytes'])])
+
+        detailsTable = PrettyTable()
+        detailsTable.field_names = ['Phase', 'Subject', 'Wall (ms)', 'CPU (ms)', 'Peak memory (KiB)']
+        detailsTable.align = 'r'
+        detailsTable.align['Phase'] = 'l'
+        detailsTable.align['Subject'] = 'l'
+        detailsTable.max_width['Subject'] = SUBJECT_MAX_WIDTH
+
+        for record in self._records:
+            detailsTable.add_row(['  ' * record.getDepth() + record.getPhase(), 
+                record.getSubject() or '', 
+                self._formatTime(record.getWallTime()), 
+                self._formatTime(record.getCpuTime()), 
+                self._formatMemory(record.getMemoryPeak())])
+
+        return summaryTable.get_string() + '\n\n' + detailsTable.get_string()
+
+    def _summarizePhases(self) -> dict[str, dict]:
+        phaseSummaries: dict[str, dict] = {}
+
+        for record in self._records:
+            phaseSummary = phaseSummaries.get(record.getPhase(), None)
+            if phaseSummary is None:
+                phaseSummary = {
+                    'count': 0,
+                    'wall_time': 0,
+                    'cpu_time': 0,
+                    'memory_peak_bytes': record.getMemoryPeak()
+                }
+                phaseSummaries[record.getPhase()] = phaseSummary
+
+            phaseSummary['count'] += 1
+            phaseSummary['wall_time'] += record.getWallTime()
+            phaseSummary['cpu_time'] += record.getCpuTime()
+
+            if record.getMemoryPeak() is not None:
+                phaseSummary['memory_peak_bytes'] = max(phaseSummary['memory_peak_bytes'] or 0, record.getMemoryPeak())
+
+        return phaseSummaries
+
+    def _formatTime(self, seconds: float) -> str:
+        return '%.3f' % (seconds * 1000.0)
+
+    def _formatMemory(self, memoryBytes: int) -> str:
+        if memoryBytes is None:
+            return '-'
+        return '%.1f' % (memoryBytes / 1024.0)
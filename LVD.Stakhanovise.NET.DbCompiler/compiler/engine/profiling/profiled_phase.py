@@ -0,0 +1,55 @@
+﻿class ProfiledPhase:
+    _phase: str = None
+    _subject: str = None
+    _depth: int = 0
+    _startTime: float = 0
+    _wallTime: float = 0
+    _cpuTime: float = 0
+    _memoryPeak: int = None
+
+    def __init__(self, phase: str, 
+            subject: str, 
+            depth: int, 
+            startTime: float, 
+            wallTime: float, 
+            cpuTime: float, 
+            memoryPeak: int) -> None:
+        self._phase = phase
+        self._subject = subject
+        self._depth = depth
+        self._startTime = startTime
+        self._wallTime = wallTime
+        self._cpuTime = cpuTime
+        self._memoryPeak = memoryPeak
+
+    def getPhase(self) -> str:
+        return self._phase
+
+    def getSubject(self) -> str:
+        return self._subject
+
+    def getDepth(self) -> int:
+        return self._depth
+
+    def getStartTime(self) -> float:
+        return self._startTime
+
+    def getWallTime(self) -> float:
+        return self._wallTime
+
+    def getCpuTime(self) -> float:
+        return self._cpuTime
+
+    def getMemoryPeak(self) -> int:
+        return self._memoryPeak
+
+    def toDict(self) -> dict:
+        return {
+            'phase': self._phase,
+            'subject': self._subject,
+            'depth': self._depth,
+            'start': self._startTime,
+            'wall_time': self._wallTime,
+            'cpu_time': self._cpuTime,
+            'memory_peak_bytes': self._memoryPeak
+        }
@@ -0,0 +1,178 @@
+﻿import re
+
+from ..compiler_asset_provider import CompilerAssetProvider
+from ..helper.string_builder import StringBuilder
+from ..model.db_mapping import DbMapping
+from ..model.db_object import DbObject
+from ..model.db_function import DbFunction
+from ..model.db_sequence import DbSequence
+from ..model.db_table import DbTable
+from ..output.sql_script.sql_db_table_writer import SqlDbTableWriter
+from ..output.sql_script.sql_db_sequence_writer import SqlDbSequenceWriter
+from ..output.sql_script.sql_db_function_writer import SqlDbFunctionWriter
+from .db_validation_issue import DbValidationIssue
+
+MARKER_BODY_START_LINE = 'BODY:'
+MARKER_BODY_END_LINE = 'BODY;'
+
+LANGUAGE_PLPGSQL = 'plpgsql'
+LANGUAGE_SQL = 'sql'
+
+MARKER_LINE_REGEX = re.compile(r'^[A-Z_]+:')
+IDENTIFIER_REGEX = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+QUOTED_TOKEN_REGEX = re.compile(r'"([^"]+)"')
+
+class DbSqlValidator:
+    _compilerAssetProvider: CompilerAssetProvider = None
+    _mapping: DbMapping = None
+    _parser = None
+
+    def __init__(self, compilerAssetProvider: CompilerAssetProvider, mapping: DbMapping) -> None:
+        self._compilerAssetProvider = compilerAssetProvider
+        self._mapping = mapping
+        self._parser = self._loadParser()
+
+    def _loadParser(self):
+        try:
+            from pglast import parser
+        except ImportError:
+            raise ValueError('The <pglast> package is required in order to validate the database objects')
+
+        return parser
+
+    def validateObject(self, obj: DbObject) -> DbValidationIssue:
+        sql = self._renderSql(obj)
+
+        try:
+            self._parser.parse_sql(sql)
+        except self._parser.ParseError as parseError:
+            return self._createIssue(obj, sql, parseError, 0)
+
+        if DbFunction.getObjectType() == obj.getType():
+            return self._validateFunctionBody(obj, sql)
+        else:
+            return None
+
+    def _renderSql(self, obj: DbObject) -> str:
+        sqlStringBuilder = StringBuilder()
+        objectType = obj.getType()
+
+        if DbTable.getObjectType() == objectType:
+            SqlDbTableWriter(sqlStringBuilder).write(obj)
+        elif DbFunction.getObjectType() == objectType:
+            SqlDbFunctionWriter(sqlStringBuilder).write(obj)
+        elif DbSequence.getObjectType() == objectType:
+            SqlDbSequenceWriter(sqlStringBuilder).write(obj)
+
+        sql = sqlStringBuilder.toString()
+        sqlStringBuilder.close()
+        return sql
+
+    def _validateFunctionBody(self, dbFunction: DbFunction, sql: str) -> DbValidationIssue:
+        language = (dbFunction.getLanguage() or '').lower()
+
+        try:
+            if language == LANGUAGE_PLPGSQL:
+                self._parser.parse_plpgsql_json(sql)
+            elif language == LANGUAGE_SQL and dbFunction.getBody():
+                self._parser.parse_sql(dbFunction.getBody())
+        except self._parser.ParseError as parseError:
+            if language == LANGUAGE_SQL:
+                return self._createIssue(dbFunction, sql, parseError, self._getBodyOffset(dbFunction, sql))
+            else:
+                return self._createIssue(dbFunction, sql, parseError, None)
+
+        return None
+
+    def _getBodyOffset(self, dbFunction: DbFunction, sql: str) -> int:
+        body = dbFunction.getBody() or ''
+        separatorOffset = sql.find('AS ' + dbFunction.getSeparator())
+        return sql.find(body, max(separatorOffset, 0))
+
+    def _createIssue(self, obj: DbObject, sql: str, parseError: Exception, positionOffset: int) -> DbValidationIssue:
+        message = str(parseError.args[0]) if len(parseError.args) > 0 else str(parseError)
+        position = parseError.args[1] if len(parseError.args) > 1 else None
+
+        sourceLines = self._readSourceLines(obj)
+        if position is not None and positionOffset is not None:
+            lineNumber = self._locatePosition(obj, sql, positionOffset + position - 1, sourceLines)
+        else:
+            lineNumber = self._locateMessage(obj, message, sourceLines)
+
+        return DbValidationIssue(obj.getSourceFile(), 
+            lineNumber, 
+            obj.getName(), 
+            message)
+
+    def _readSourceLines(self, obj: DbObject) -> list[str]:
+        sourceFile = obj.getSourceFile()
+        if not sourceFile or not self._compilerAssetProvider.sourceFileExists(sourceFile):
+            return []
+
+        sourceContents = self._compilerAssetProvider.getSourceFileContents(sourceFile) or ''
+        return sourceContents.split('\n')
+
+    def _locatePosition(self, obj: DbObject, sql: str, offset: int, sourceLines: list[str]) -> int:
+        if DbFunction.getObjectType() == obj.getType():
+            bodyOffset = self._getBodyOffset(obj, sql)
+            bodyLength = len(obj.getBody() or '')
+            if bodyOffset >= 0 and bodyOffset <= offset <= bodyOffset + bodyLength:
+                bodyLineIndex = sql.count('\n', bodyOffset, offset)
+                return self._getBodySourceLineNumber(sourceLines, bodyLineIndex)
+
+        lineStart = sql.rfind('\n', 0, offset) + 1
+        lineEnd = sql.find('\n', offset)
+        generatedLine = sql[lineStart:lineEnd if lineEnd >= 0 else len(sql)]
+        return self._findDefinitionLineNumber(sourceLines, IDENTIFIER_REGEX.findall(generatedLine))
+
+    def _locateMessage(self, obj: DbObject, message: str, sourceLines: list[str]) -> int:
+        bodyLineNumbers = self._getBodySourceLineNumbers(sourceLines)
+        quotedTokens = QUOTED_TOKEN_REGEX.findall(message)
+
+        for quotedToken in quotedTokens:
+            for bodyLineNumber in bodyLineNumbers:
+                if quotedToken in self._mapping.expandString(sourceLines[bodyLineNumber - 1]):
+                    return bodyLineNumber
+
+        return self._findMarkerLineNumber(sourceLines, MARKER_BODY_START_LINE)
+
+    def _getBodySourceLineNumber(self, sourceLines: list[str], bodyLineIndex: int) -> int:
+        bodyLineNumbers = self._getBodySourceLineNumbers(sourceLines)
+        if bodyLineIndex < len(bodyLineNumbers):
+            return bodyLineNumbers[bodyLineIndex]
+        else:
+            return self._findMarkerLineNumber(sourceLines, MARKER_BODY_START_LINE)
+
+    def _getBodySourceLineNumbers(self, sourceLines: list[str]) -> list[int]:
+        bodyLineNumbers: list[int] = []
+        isReadingBody = False
+
+        for lineIndex, sourceLine in enumerate(sourceLines):
+            strippedSourceLine = sourceLine.strip()
+            if strippedSourceLine == MARKER_BODY_START_LINE:
+                isReadingBody = True
+            elif strippedSourceLine == MARKER_BODY_END_LINE:
+                isReadingBody = False
+            elif isReadingBody and len(strippedSourceLine) > 0 and not sourceLine.rstrip().startswith('#'):
+                bodyLineNumbers.append(lineIndex + 1)
+
+        return bodyLineNumbers
+
+    def _findDefinitionLineNumber(self, sourceLines: list[str], identifiers: list[str]) -> int:
+        for identifier in identifiers:
+            if identifier.upper() == identifier:
+                continue
+
+            identifierRegex = re.compile(r'\b' + re.escape(identifier) + r'\b')
+            for lineIndex, sourceLine in enumerate(sourceLines):
+                if MARKER_LINE_REGEX.match(sourceLine) and identifierRegex.search(self._mapping.expandString(sourceLine)):
+                    return lineIndex + 1
+
+        return 1
+
+    def _findMarkerLineNumber(self, sourceLines: list[str], marker: str) -> int:
+        for lineIndex, sourceLine in enumerate(sourceLines):
+            if sourceLine.strip() == marker:
+                return lineIndex + 1
+
+        return 1
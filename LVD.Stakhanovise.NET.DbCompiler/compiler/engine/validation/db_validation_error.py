@@ -0,0 +1,12 @@
+﻿from .db_validation_issue import DbValidationIssue
+
+class DbValidationError(ValueError):
+    _issues: list[DbValidationIssue] = None
+
+    def __init__(self, issues: list[DbValidationIssue]) -> None:
+        super().__init__('Validation failed with ' + str(len(issues)) + ' error(s):\n' 
+            + '\n'.join([str(issue) for issue in issues]))
+        self._issues = issues
+
+    def getIssues(self) -> list[DbValidationIssue]:
+        return self._issues
@@ -0,0 +1,39 @@
+﻿from ..helper.string import sprintf
+
+class DbValidationIssue:
+    _sourceFile: str = None
+    _lineNumber: int = None
+    _objectName: str = None
+    _message: str = None
+
+    def __init__(self, sourceFile: str, lineNumber: int, objectName: str, message: str) -> None:
+        self._sourceFile = sourceFile
+        self._lineNumber = lineNumber
+        self._objectName = objectName
+        self._message = message
+
+    def getSourceFile(self) -> str:
+        return self._sourceFile
+
+    def getLineNumber(self) -> int:
+        return self._lineNumber
+
+    def getObjectName(self) -> str:
+        return self._objectName
+
+    def getMessage(self) -> str:
+        return self._message
+
+    def toDict(self) -> dict:
+        return {
+            'file': self._sourceFile,
+            'line': self._lineNumber,
+            'object': self._objectName,
+            'message': self._message
+        }
+
+    def __str__(self) -> str:
+        return sprintf('%s:%s: %s: %s' % (self._sourceFile or '<unknown>', 
+            self._lineNumber or 1, 
+            self._objectName, 
+            self._message))
@@ -0,0 +1,48 @@
+﻿import os
+import time
+import traceback
+
+from ..compiler import Compiler
+from .source_directory_watcher import SourceDirectoryWatcher
+
+class CompileWatcher:
+    _compiler: Compiler = None
+    _sourceDirectoryWatcher: SourceDirectoryWatcher = None
+    _makefileName: str = None
+
+    def __init__(self, compiler: Compiler, sourceDirectoryWatcher: SourceDirectoryWatcher, makefileName: str = 'makefile') -> None:
+        self._compiler = compiler
+        self._sourceDirectoryWatcher = sourceDirectoryWatcher
+        self._makefileName = makefileName
+
+    def run(self) -> None:
+        print('Watching <' + self._sourceDirectoryWatcher.getSourceDirectory() + '> for changes using ' 
+            + self._sourceDirectoryWatcher.getName() + '. Press Ctrl+C to stop.')
+
+        try:
+            self._recompile([])
+            while True:
+                changedFilePaths = self._sourceDirectoryWatcher.waitForChanges()
+                if len(changedFilePaths) > 0:
+                    self._recompile(changedFilePaths)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._sourceDirectoryWatcher.close()
+
+    def _recompile(self, changedFilePaths: list[str]) -> None:
+        if len(changedFilePaths) > 0:
+            print('Changed: ' + ', '.join(self._describeChangedFilePaths(changedFilePaths)))
+
+        startTime = time.perf_counter()
+        try:
+            self._compiler.recompile(changedFilePaths, self._makefileName)
+            print('Compiled in %.3fs.' % (time.perf_counter() - startTime))
+        except Exception:
+            traceback.print_exc()
+            print('Compilation failed. Waiting for changes...')
+
+    def _describeChangedFilePaths(self, changedFilePaths: list[str]) -> list[str]:
+        sourceDirectory = self._sourceDirectoryWatcher.getSourceDirectory()
+        return [os.path.relpath(changedFilePath, sourceDirectory) 
+            for changedFilePath in changedFilePaths]
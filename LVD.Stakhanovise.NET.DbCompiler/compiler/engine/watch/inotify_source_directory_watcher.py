@@ -0,0 +1,165 @@
+﻿import os
+import sys
+import time
+import errno
+import select
+import struct
+import ctypes
+import ctypes.util
+from .source_directory_watcher import SourceDirectoryWatcher
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO 
+    | IN_CREATE | IN_DELETE | IN_DELETE_SELF)
+
+EVENT_HEADER_FORMAT = 'iIII'
+EVENT_HEADER_SIZE = struct.calcsize(EVENT_HEADER_FORMAT)
+EVENT_READ_BUFFER_SIZE = 64 * 1024
+
+DEFAULT_SETTLE_DELAY = 0.1
+
+def _loadLibc():
+    if not sys.platform.startswith('linux'):
+        return None
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno = True)
+    except OSError:
+        return None
+
+    if not hasattr(libc, 'inotify_init1') or not hasattr(libc, 'inotify_add_watch'):
+        return None
+
+    return libc
+
+class InotifySourceDirectoryWatcher(SourceDirectoryWatcher):
+    _libc = None
+    _inotifyFd: int = -1
+    _watchedDirectories: dict[int, str] = None
+    _settleDelay: float = DEFAULT_SETTLE_DELAY
+
+    def __init__(self, sourceDirectory: str, settleDelay: float = DEFAULT_SETTLE_DELAY) -> None:
+        super().__init__(sourceDirectory)
+        self._libc = _loadLibc()
+        if self._libc is None:
+            raise OSError('inotify is not available on this platform')
+
+        self._inotifyFd = self._libc.inotify_init1(os.O_CLOEXEC)
+        if self._inotifyFd < 0:
+            raise self._createOSError('inotify_init1')
+
+        self._watchedDirectories = {}
+        self._settleDelay = settleDelay
+        self._addWatchRecursively(self._sourceDirectory)
+
+    @staticmethod
+    def isAvailable() -> bool:
+        return _loadLibc() is not None
+
+    def getName(self) -> str:
+        return 'inotify'
+
+    def _createOSError(self, functionName: str) -> OSError:
+        errorNumber = ctypes.get_errno()
+        return OSError(errorNumber, functionName + ' failed: ' + os.strerror(errorNumber))
+
+    def _addWatchRecursively(self, directoryPath: str) -> None:
+        self._addWatch(directoryPath)
+        for childDirectoryPath, directoryNames, fileNames in os.walk(directoryPath):
+            directoryNames[:] = [directoryName 
+                for directoryName in directoryNames 
+                    if self._isWatchedDirectoryName(directoryName)]
+            for directoryName in directoryNames:
+                self._addWatch(os.path.join(childDirectoryPath, directoryName))
+
+    def _addWatch(self, directoryPath: str) -> None:
+        watchDescriptor = self._libc.inotify_add_watch(self._inotifyFd, 
+            os.fsencode(directoryPath), 
+            ctypes.c_uint32(WATCH_MASK))
+
+        if watchDescriptor < 0:
+            if ctypes.get_errno() in (errno.ENOENT, errno.ENOTDIR):
+                return
+            raise self._createOSError('inotify_add_watch')
+
+        self._watchedDirectories[watchDescriptor] = directoryPath
+
+    def waitForChanges(self, timeout: float = None) -> list[str]:
+        changedFilePaths: set[str] = set()
+        if not self._waitForEvents(timeout):
+            return []
+
+        while True:
+            self._readEvents(changedFilePaths)
+            if not self._waitForEvents(self._settleDelay):
+                break
+
+        return sorted(changedFilePaths)
+
+    def _waitForEvents(self, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        while True:
+            remaining = max(deadline - time.monotonic(), 0) if deadline is not None else None
+            try:
+                readyFds, _, _ = select.select([self._inotifyFd], [], [], remaining)
+                return len(readyFds) > 0
+            except InterruptedError:
+                continue
+
+    def _readEvents(self, changedFilePaths: set[str]) -> None:
+        eventsBuffer = os.read(self._inotifyFd, EVENT_READ_BUFFER_SIZE)
+        offset = 0
+
+        while offset + EVENT_HEADER_SIZE <= len(eventsBuffer):
+            watchDescriptor, mask, cookie, nameLength = struct.unpack_from(EVENT_HEADER_FORMAT, 
+                eventsBuffer, 
+                offset)
+
+            nameOffset = offset + EVENT_HEADER_SIZE
+            name = eventsBuffer[nameOffset:nameOffset + nameLength].rstrip(b'\0')
+            offset = nameOffset + nameLength
+
+            self._processEvent(watchDescriptor, mask, os.fsdecode(name), changedFilePaths)
+
+    def _processEvent(self, watchDescriptor: int, mask: int, name: str, changedFilePaths: set[str]) -> None:
+        if mask & IN_Q_OVERFLOW:
+            changedFilePaths.add(self._sourceDirectory)
+            return
+
+        directoryPath = self._watchedDirectories.get(watchDescriptor, None)
+        if directoryPath is None:
+            return
+
+        if mask & IN_IGNORED:
+            del self._watchedDirectories[watchDescriptor]
+            return
+
+        if not name:
+            return
+
+        eventPath = os.path.join(directoryPath, name)
+        if mask & IN_ISDIR:
+            if not self._isWatchedDirectoryName(name):
+                return
+            if mask & (IN_CREATE | IN_MOVED_TO):
+                self._addWatchRecursively(eventPath)
+            changedFilePaths.add(eventPath)
+        elif self._isWatchedFileName(name):
+            changedFilePaths.add(eventPath)
+
+    def close(self) -> None:
+        if self._inotifyFd >= 0:
+            os.close(self._inotifyFd)
+            self._inotifyFd = -1
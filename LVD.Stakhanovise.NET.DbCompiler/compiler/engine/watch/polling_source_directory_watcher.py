@@ -0,0 +1,68 @@
+﻿import os
+import time
+from .source_directory_watcher import SourceDirectoryWatcher
+
+DEFAULT_POLL_INTERVAL = 0.5
+
+FileSnapshot = dict[str, tuple[int, int]]
+
+class PollingSourceDirectoryWatcher(SourceDirectoryWatcher):
+    _pollInterval: float = DEFAULT_POLL_INTERVAL
+    _snapshot: FileSnapshot = None
+
+    def __init__(self, sourceDirectory: str, pollInterval: float = DEFAULT_POLL_INTERVAL) -> None:
+        super().__init__(sourceDirectory)
+        self._pollInterval = pollInterval or DEFAULT_POLL_INTERVAL
+        self._snapshot = self._takeSnapshot()
+
+    def getName(self) -> str:
+        return 'polling'
+
+    def waitForChanges(self, timeout: float = None) -> list[str]:
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        while True:
+            snapshot = self._takeSnapshot()
+            changedFilePaths = self._diffSnapshots(self._snapshot, snapshot)
+            self._snapshot = snapshot
+
+            if len(changedFilePaths) > 0:
+                return changedFilePaths
+
+            if deadline is not None and time.monotonic() >= deadline:
+                return []
+
+            time.sleep(self._pollInterval)
+
+    def _takeSnapshot(self) -> FileSnapshot:
+        snapshot: FileSnapshot = {}
+
+        for directoryPath, directoryNames, fileNames in os.walk(self._sourceDirectory):
+            directoryNames[:] = [directoryName 
+                for directoryName in directoryNames 
+                    if self._isWatchedDirectoryName(directoryName)]
+
+            for fileName in fileNames:
+                if not self._isWatchedFileName(fileName):
+                    continue
+
+                filePath = os.path.join(directoryPath, fileName)
+                try:
+                    fileStat = os.stat(filePath)
+                except OSError:
+                    continue
+
+                snapshot[filePath] = (fileStat.st_mtime_ns, fileStat.st_size)
+
+        return snapshot
+
+    def _diffSnapshots(self, previousSnapshot: FileSnapshot, currentSnapshot: FileSnapshot) -> list[str]:
+        changedFilePaths = [filePath 
+            for filePath, fileState in currentSnapshot.items() 
+                if previousSnapshot.get(filePath, None) != fileState]
+
+        changedFilePaths.extend([filePath 
+            for filePath in previousSnapshot.keys() 
+                if filePath not in currentSnapshot])
+
+        return sorted(changedFilePaths)
@@ -0,0 +1,39 @@
+﻿import os
+from abc import ABC, abstractmethod
+from fnmatch import fnmatchcase
+
+IGNORED_FILE_NAME_PATTERNS = ('*~', '*.tmp', '*.swp', '*.swx', '*.bak', 
+    'sed??????', '4913', '*___jb_tmp___', '*___jb_old___')
+
+class SourceDirectoryWatcher(ABC):
+    _sourceDirectory: str = None
+
+    def __init__(self, sourceDirectory: str) -> None:
+        self._sourceDirectory = os.path.abspath(sourceDirectory)
+
+    def getSourceDirectory(self) -> str:
+        return self._sourceDirectory
+
+    @abstractmethod
+    def getName(self) -> str:
+        pass
+
+    @abstractmethod
+    def waitForChanges(self, timeout: float = None) -> list[str]:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def _isWatchedDirectoryName(self, directoryName: str) -> bool:
+        return not directoryName.startswith('.')
+
+    def _isWatchedFileName(self, fileName: str) -> bool:
+        if fileName.startswith('.'):
+            return False
+
+        for ignoredFileNamePattern in IGNORED_FILE_NAME_PATTERNS:
+            if fnmatchcase(fileName, ignoredFileNamePattern):
+                return False
+
+        return True
@@ -0,0 +1,14 @@
+﻿from .source_directory_watcher import SourceDirectoryWatcher
+from .inotify_source_directory_watcher import InotifySourceDirectoryWatcher
+from .polling_source_directory_watcher import PollingSourceDirectoryWatcher
+from .polling_source_directory_watcher import DEFAULT_POLL_INTERVAL
+
+class SourceDirectoryWatcherFactory:
+    def createWatcher(self, sourceDirectory: str, forcePolling: bool = False, pollInterval: float = DEFAULT_POLL_INTERVAL) -> SourceDirectoryWatcher:
+        if not forcePolling and InotifySourceDirectoryWatcher.isAvailable():
+            try:
+                return InotifySourceDirectoryWatcher(sourceDirectory)
+            except OSError:
+                pass
+
+        return PollingSourceDirectoryWatcher(sourceDirectory, pollInterval)
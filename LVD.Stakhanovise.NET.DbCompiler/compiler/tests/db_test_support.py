@@ -0,0 +1,20 @@
+﻿import os
+
+from engine.filesystem.memory_file_system import MemoryFileSystem
+from engine.helper.source_buffer_cache import SourceBufferCache
+from engine.model.db_mapping import DbMapping
+from engine.model.db_object import DbObject
+from engine.model.db_symbolic_mapping import DbSymbolicMapping
+from engine.parser.db_definition_file_parser import DbDefinitionFileParser
+
+SOURCE_DIRECTORY = os.path.abspath('/sk_test_src')
+
+def parseDefinition(contents: str, sourceFileName: str = 'object.dbdef') -> DbObject:
+    fileSystem = MemoryFileSystem()
+    fileSystem.addFiles(SOURCE_DIRECTORY, { sourceFileName: contents })
+
+    definitionFileParser = DbDefinitionFileParser(DbSymbolicMapping(), SourceBufferCache(fileSystem = fileSystem))
+    return definitionFileParser.parse(sourceFileName, os.path.join(SOURCE_DIRECTORY, sourceFileName))
+
+def parseExpandedDefinition(contents: str, symbols: dict[str, str] = None, sourceFileName: str = 'object.dbdef') -> DbObject:
+    return parseDefinition(contents, sourceFileName).expandSymbols(DbMapping(symbols or {}))
@@ -0,0 +1,72 @@
+﻿import unittest
+
+from engine.model.db_dependency_graph import DbDependencyGraph
+
+from .db_test_support import parseExpandedDefinition
+
+SEQUENCE_DEFINITION = """SEQ
+NAME: sk_ids_seq
+PROPS: start=1; increment=1
+"""
+
+TASKS_TABLE_DEFINITION = """TBL
+NAME: sk_tasks_t
+COL: task_id (type=bigint; not_null=true; default=nextval('sk_ids_seq'))
+COL: task_type (type=character varying(250); not_null=true)
+"""
+
+COUNT_TASKS_FUNCTION_DEFINITION = """FUNC
+NAME: sk_count_tasks
+PROPS: language=sql
+RET: bigint
+BODY:
+SELECT COUNT(1) FROM sk_tasks_t
+BODY;
+"""
+
+def createFunctionDefinition(functionName: str, calledFunctionName: str) -> str:
+    return """FUNC
+NAME: """ + functionName + """
+PROPS: language=plpgsql
+RET: integer
+BODY:
+BEGIN
+    RETURN """ + calledFunctionName + """();
+END;
+BODY;
+"""
+
+class DbDependencyGraphTests(unittest.TestCase):
+    def test_objectsComeAfterTheObjectsTheyReference(self) -> None:
+        countTasksFunction = parseExpandedDefinition(COUNT_TASKS_FUNCTION_DEFINITION)
+        tasksTable = parseExpandedDefinition(TASKS_TABLE_DEFINITION)
+        sequence = parseExpandedDefinition(SEQUENCE_DEFINITION)
+
+        graph = DbDependencyGraph([countTasksFunction, tasksTable, sequence])
+
+        self.assertEqual(['sk_ids_seq', 'sk_tasks_t', 'sk_count_tasks'], 
+            [obj.getName() for obj in graph.getOrderedObjects()])
+        self.assertFalse(graph.hasCycles())
+
+    def test_independentObjectsKeepTheirOrder(self) -> None:
+        firstFunction = parseExpandedDefinition(createFunctionDefinition('sk_first', 'now'))
+        secondFunction = parseExpandedDefinition(createFunctionDefinition('sk_second', 'now'))
+
+        graph = DbDependencyGraph([secondFunction, firstFunction])
+
+        self.assertEqual(['sk_second', 'sk_first'], 
+            [obj.getName() for obj in graph.getOrderedObjects()])
+
+    def test_cyclesAreReportedWithAllTheObjectsInvolved(self) -> None:
+        pingFunction = parseExpandedDefinition(createFunctionDefinition('sk_ping', 'sk_pong'))
+        pongFunction = parseExpandedDefinition(createFunctionDefinition('sk_pong', 'sk_pang'))
+        pangFunction = parseExpandedDefinition(createFunctionDefinition('sk_pang', 'sk_ping'))
+        callerFunction = parseExpandedDefinition(createFunctionDefinition('sk_caller', 'sk_ping'))
+
+        graph = DbDependencyGraph([callerFunction, pingFunction, pongFunction, pangFunction])
+
+        self.assertTrue(graph.hasCycles())
+        self.assertEqual([['sk_ping', 'sk_pong', 'sk_pang']], 
+            [[obj.getName() for obj in cycle] for cycle in graph.getCycles()])
+        orderedObjectNames = [obj.getName() for obj in graph.getOrderedObjects()]
+        self.assertEqual(['sk_ping', 'sk_caller', 'sk_pang', 'sk_pong'], orderedObjectNames)
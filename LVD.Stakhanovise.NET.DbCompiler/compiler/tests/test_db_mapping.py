@@ -0,0 +1,71 @@
+﻿import unittest
+
+from engine.model.db_mapping import DbMapping
+
+from .db_test_support import parseExpandedDefinition
+
+QUEUE_TABLE_DEFINITION = """TBL
+NAME: $queue_table_name$
+COL: task_id(type=bigint; not_null=true)
+CONSTRAINT: pk_$queue_table_name$(task_id); type=pk
+"""
+
+class DbMappingTests(unittest.TestCase):
+    def test_builtInTokensHaveDefaultValues(self) -> None:
+        mapping = DbMapping({})
+
+        self.assertEqual('sk_tasks_queue_t', mapping.getQueueTableName())
+        self.assertEqual('sk_tasks_queue_t', mapping.expandString('$queue_table_name$'))
+
+    def test_tokenValuesReferencingOtherTokensAreExpanded(self) -> None:
+        mapping = DbMapping({
+            'schema_prefix': 'app_',
+            'table_prefix': '$schema_prefix$sk_',
+            'queue_table_name': '$table_prefix$tasks_queue_t'
+        })
+
+        self.assertEqual('app_sk_tasks_queue_t', mapping.getQueueTableName())
+        self.assertEqual('SELECT * FROM app_sk_tasks_queue_t', mapping.expandString('SELECT * FROM $queue_table_name$'))
+
+    def test_longestTokenNameIsMatchedFirst(self) -> None:
+        mapping = DbMapping({
+            'queue': 'q',
+            'queue_table_name': 'tasks_t'
+        })
+
+        self.assertEqual('tasks_t q', mapping.expandString('$queue_table_name$ $queue$'))
+
+    def test_unknownTokensAreLeftAsTheyAre(self) -> None:
+        mapping = DbMapping({})
+
+        self.assertEqual('$unknown_token$', mapping.expandString('$unknown_token$'))
+
+    def test_tokensReferringToThemselvesAreRejected(self) -> None:
+        with self.assertRaises(ValueError) as raised:
+            DbMapping({
+                'first_token': 'x_$second_token$',
+                'second_token': 'y_$first_token$'
+            })
+
+        self.assertEqual('Mapping token <first_token> refers to itself through <first_token -> second_token -> first_token>', str(raised.exception))
+
+    def test_prefixIsAppliedToTheExpandedBuiltInTokens(self) -> None:
+        mapping = DbMapping({
+            'table_prefix': 'app_',
+            'queue_table_name': '$table_prefix$tasks_queue_t'
+        })
+        prefixedMapping = mapping.withPrefix('tenant_')
+
+        self.assertEqual('tenant_app_tasks_queue_t', prefixedMapping.getQueueTableName())
+        self.assertEqual('tenant_sk_task_results_t', prefixedMapping.getResultsQueueTableName())
+        self.assertEqual('app_', prefixedMapping.expandString('$table_prefix$'))
+        self.assertIs(mapping, mapping.withPrefix(''))
+
+    def test_definitionsAreExpandedWithTheMapping(self) -> None:
+        dbTable = parseExpandedDefinition(QUEUE_TABLE_DEFINITION, {
+            'table_prefix': 'app_',
+            'queue_table_name': '$table_prefix$tasks_queue_t'
+        })
+
+        self.assertEqual('app_tasks_queue_t', dbTable.getName())
+        self.assertEqual('pk_app_tasks_queue_t', dbTable.getPrimaryKey().getName())
@@ -0,0 +1,130 @@
+﻿import unittest
+
+from engine.helper.string_builder import StringBuilder
+from engine.model.db_object import DbObject
+from engine.output.db_create.db_catalog_snapshot import DbCatalogSnapshot
+from engine.output.db_create.db_migration_planner import DbMigrationPlanner
+
+from .db_test_support import parseExpandedDefinition
+
+TASKS_TABLE_DEFINITION = """TBL
+NAME: sk_tasks_t
+COL: task_id(type=bigint; not_null=true)
+COL: task_type(type=character varying(250); not_null=true)
+CONSTRAINT: pk_sk_tasks_t(task_id); type=pk
+IDX: idx_sk_tasks_t_type(task_type=ASC); type=btree
+"""
+
+PARTITIONED_TASKS_TABLE_DEFINITION = """TBL
+NAME: sk_tasks_t
+COL: task_id(type=bigint; not_null=true)
+COL: task_type(type=character varying(250); not_null=true)
+COL: task_posted_at_ts(type=timestamp with time zone; not_null=true)
+IDX: idx_sk_tasks_t_type(task_type=ASC); type=btree
+PARTITION: range(task_posted_at_ts)
+PART: sk_tasks_t_2024(from='2024-01-01'; to='2025-01-01')
+"""
+
+INOUT_FUNCTION_DEFINITION = """FUNC
+NAME: sk_increment
+PROPS: language=plpgsql
+PARAM: counter(type=integer; direction=inout)
+RET: integer
+BODY:
+BEGIN
+    counter := counter + 1;
+END;
+BODY;
+"""
+
+def createTasksTableSnapshot(primaryKeyName: str = 'pk_sk_tasks_t', taskIdType: str = 'bigint', indexSortOrder: str = 'ASC') -> DbCatalogSnapshot:
+    snapshot = DbCatalogSnapshot()
+    snapshot.addTableColumn('sk_tasks_t', 'task_id', taskIdType, True, None)
+    snapshot.addTableColumn('sk_tasks_t', 'task_type', 'character varying(250)', True, None)
+    snapshot.addTableConstraint('sk_tasks_t', primaryKeyName, 'p', ['task_id'])
+    snapshot.addTableIndexColumn('sk_tasks_t', 'idx_sk_tasks_t_type', 'btree', 'task_type', indexSortOrder)
+    return snapshot
+
+class DbMigrationPlannerTests(unittest.TestCase):
+    def _plan(self, snapshot: DbCatalogSnapshot, dbObject: DbObject) -> tuple[str, list[str]]:
+        planner = DbMigrationPlanner(snapshot)
+        sqlStringBuilder = StringBuilder()
+        planner.planObject(dbObject, sqlStringBuilder)
+        return (sqlStringBuilder.toString(), planner.getDeferredStatements())
+
+    def test_missingTableIsCreated(self) -> None:
+        plan, deferredStatements = self._plan(DbCatalogSnapshot(), parseExpandedDefinition(TASKS_TABLE_DEFINITION))
+
+        self.assertIn('CREATE TABLE IF NOT EXISTS public.sk_tasks_t(', plan)
+        self.assertIn('CREATE INDEX IF NOT EXISTS idx_sk_tasks_t_type', plan)
+        self.assertEqual([], deferredStatements)
+
+    def test_unchangedTableNeedsNoChanges(self) -> None:
+        plan, deferredStatements = self._plan(createTasksTableSnapshot(), parseExpandedDefinition(TASKS_TABLE_DEFINITION))
+
+        self.assertEqual('', plan)
+        self.assertEqual([], deferredStatements)
+
+    def test_changedColumnTypeIsAlteredWithAWarning(self) -> None:
+        plan, deferredStatements = self._plan(createTasksTableSnapshot(taskIdType = 'integer'), parseExpandedDefinition(TASKS_TABLE_DEFINITION))
+
+        planLines = plan.splitlines()
+        alterColumnLineIndex = planLines.index('ALTER TABLE public.sk_tasks_t ALTER COLUMN task_id TYPE bigint USING task_id::bigint;')
+        self.assertTrue(planLines[alterColumnLineIndex - 1].startswith('-- WARNING: '))
+
+    def test_renamedPrimaryKeyIsDroppedWithoutCascade(self) -> None:
+        plan, deferredStatements = self._plan(createTasksTableSnapshot(primaryKeyName = 'sk_tasks_t_pkey'), parseExpandedDefinition(TASKS_TABLE_DEFINITION))
+
+        self.assertIn('ALTER TABLE public.sk_tasks_t DROP CONSTRAINT IF EXISTS sk_tasks_t_pkey;', plan)
+        self.assertIn('ADD CONSTRAINT pk_sk_tasks_t', plan)
+        self.assertNotIn('CASCADE', plan)
+        self.assertEqual(2, plan.count('-- WARNING: '))
+
+    def test_changedIndexIsRebuiltConcurrentlyOutsideThePlan(self) -> None:
+        plan, deferredStatements = self._plan(createTasksTableSnapshot(indexSortOrder = 'DESC'), parseExpandedDefinition(TASKS_TABLE_DEFINITION))
+
+        self.assertEqual('', plan)
+        self.assertEqual(2, len(deferredStatements))
+        self.assertEqual('DROP INDEX CONCURRENTLY IF EXISTS public.idx_sk_tasks_t_type;', deferredStatements[0])
+        self.assertTrue(deferredStatements[1].startswith('CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sk_tasks_t_type'))
+
+    def test_indexOfPartitionedTableIsBuiltInThePlan(self) -> None:
+        snapshot = DbCatalogSnapshot()
+        snapshot.addTableColumn('sk_tasks_t', 'task_id', 'bigint', True, None)
+        snapshot.addTableColumn('sk_tasks_t', 'task_type', 'character varying(250)', True, None)
+        snapshot.addTableColumn('sk_tasks_t', 'task_posted_at_ts', 'timestamp with time zone', True, None)
+
+        plan, deferredStatements = self._plan(snapshot, parseExpandedDefinition(PARTITIONED_TASKS_TABLE_DEFINITION))
+
+        self.assertIn('-- WARNING: ', plan)
+        self.assertIn('CREATE INDEX IF NOT EXISTS idx_sk_tasks_t_type', plan)
+        self.assertIn('PARTITION OF public.sk_tasks_t', plan)
+        self.assertEqual([], deferredStatements)
+
+    def test_functionWithInoutParameterMatchesTheCatalogIdentity(self) -> None:
+        dbFunction = parseExpandedDefinition(INOUT_FUNCTION_DEFINITION)
+        snapshot = DbCatalogSnapshot()
+        snapshot.addFunction('sk_increment', {
+            'identity': 'INOUT counter integer',
+            'result': 'integer',
+            'language': 'plpgsql',
+            'body': dbFunction.getBody()
+        })
+
+        plan, deferredStatements = self._plan(snapshot, dbFunction)
+
+        self.assertEqual('', plan)
+
+    def test_functionWithOtherParametersIsDroppedAndCreated(self) -> None:
+        snapshot = DbCatalogSnapshot()
+        snapshot.addFunction('sk_increment', {
+            'identity': 'counter integer',
+            'result': 'integer',
+            'language': 'plpgsql',
+            'body': ''
+        })
+
+        plan, deferredStatements = self._plan(snapshot, parseExpandedDefinition(INOUT_FUNCTION_DEFINITION))
+
+        self.assertIn('DROP FUNCTION IF EXISTS public.sk_increment(counter integer);', plan)
+        self.assertIn('INOUT counter integer', plan)
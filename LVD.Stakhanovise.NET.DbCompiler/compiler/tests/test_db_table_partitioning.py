@@ -0,0 +1,117 @@
+﻿import unittest
+
+from engine.helper.string_builder import StringBuilder
+from engine.model.db_table import DbTable
+from engine.output.sql_script.sql_db_table_writer import SqlDbTableWriter
+
+from .db_test_support import parseDefinition
+from .db_test_support import parseExpandedDefinition
+
+RANGE_PARTITIONED_TABLE_DEFINITION = """TBL
+NAME: $queue_table_name$
+COL: task_id(type=bigint; not_null=true)
+COL: task_posted_at_ts(type=timestamp with time zone; not_null=true)
+CONSTRAINT: pk_$queue_table_name$(task_id, task_posted_at_ts); type=pk
+PARTITION: range(task_posted_at_ts)
+PART: $queue_table_name$_2024(from='2024-01-01'; to='2025-01-01')
+PART: $queue_table_name$_default(default=true)
+"""
+
+LIST_PARTITIONED_TABLE_DEFINITION = """TBL
+NAME: sk_metrics_t
+COL: metric_category(type=character varying(64); not_null=true)
+COL: metric_value(type=bigint; not_null=true)
+PARTITION: list(metric_category)
+PART: sk_metrics_t_queue(in='queue', 'dequeue')
+"""
+
+HASH_PARTITIONED_TABLE_DEFINITION = """TBL
+NAME: sk_task_results_t
+COL: task_id(type=bigint; not_null=true)
+PARTITION: hash(task_id)
+PART: sk_task_results_t_p0(modulus=2; remainder=0)
+PART: sk_task_results_t_p1(modulus=2; remainder=1)
+"""
+
+class DbTablePartitioningTests(unittest.TestCase):
+    def _writeTable(self, dbTable: DbTable) -> str:
+        sqlStringBuilder = StringBuilder()
+        SqlDbTableWriter(sqlStringBuilder).write(dbTable)
+        return sqlStringBuilder.toString()
+
+    def test_rangePartitionedTableIsWrittenWithItsPartitions(self) -> None:
+        sql = self._writeTable(parseExpandedDefinition(RANGE_PARTITIONED_TABLE_DEFINITION, { 'queue_table_name': 'acme_tasks_t' }))
+
+        self.assertIn(') PARTITION BY RANGE (task_posted_at_ts);', sql)
+        self.assertIn('CREATE TABLE IF NOT EXISTS public.acme_tasks_t_2024\n'
+            + '\tPARTITION OF public.acme_tasks_t\n'
+            + "\tFOR VALUES FROM ('2024-01-01') TO ('2025-01-01');", sql)
+        self.assertIn('CREATE TABLE IF NOT EXISTS public.acme_tasks_t_default\n'
+            + '\tPARTITION OF public.acme_tasks_t\n'
+            + '\tDEFAULT;', sql)
+        self.assertLess(sql.index('ADD CONSTRAINT pk_acme_tasks_t'), sql.index('PARTITION OF'))
+
+    def test_listPartitionBoundsAreWritten(self) -> None:
+        sql = self._writeTable(parseExpandedDefinition(LIST_PARTITIONED_TABLE_DEFINITION))
+
+        self.assertIn(') PARTITION BY LIST (metric_category);', sql)
+        self.assertIn("\tFOR VALUES IN ('queue', 'dequeue');", sql)
+
+    def test_hashPartitionBoundsAreWritten(self) -> None:
+        sql = self._writeTable(parseExpandedDefinition(HASH_PARTITIONED_TABLE_DEFINITION))
+
+        self.assertIn(') PARTITION BY HASH (task_id);', sql)
+        self.assertIn('\tFOR VALUES WITH (MODULUS 2, REMAINDER 0);', sql)
+        self.assertIn('\tFOR VALUES WITH (MODULUS 2, REMAINDER 1);', sql)
+
+    def test_tableWithoutPartitioningIsWrittenAsBefore(self) -> None:
+        sql = self._writeTable(parseExpandedDefinition("""TBL
+NAME: sk_ids_t
+COL: id(type=bigint; not_null=true)
+"""))
+
+        self.assertIn('\tid bigint NOT NULL\n);', sql)
+        self.assertNotIn('PARTITION', sql)
+
+    def test_partitionsWithoutPartitioningAreRejected(self) -> None:
+        with self.assertRaises(ValueError) as raised:
+            parseDefinition("""TBL
+NAME: sk_tasks_t
+COL: task_id(type=bigint; not_null=true)
+PART: sk_tasks_t_default(default=true)
+""")
+
+        self.assertEqual('Table <sk_tasks_t> declares partitions, but no partitioning method', str(raised.exception))
+
+    def test_partitionBoundsMustMatchThePartitioningMethod(self) -> None:
+        with self.assertRaises(ValueError) as raised:
+            parseDefinition("""TBL
+NAME: sk_tasks_t
+COL: task_id(type=bigint; not_null=true)
+PARTITION: hash(task_id)
+PART: sk_tasks_t_p0(from=1; to=10)
+""")
+
+        self.assertIn('Partition <sk_tasks_t_p0> bounds do not match', str(raised.exception))
+
+    def test_keysMustIncludeThePartitionKeyColumns(self) -> None:
+        with self.assertRaises(ValueError) as raised:
+            parseDefinition("""TBL
+NAME: sk_tasks_t
+COL: task_id(type=bigint; not_null=true)
+COL: task_posted_at_ts(type=timestamp with time zone; not_null=true)
+CONSTRAINT: pk_sk_tasks_t(task_id); type=pk
+PARTITION: range(task_posted_at_ts)
+""")
+
+        self.assertEqual('Constraint <pk_sk_tasks_t> must include partition key column <task_posted_at_ts>', str(raised.exception))
+
+    def test_invalidPartitioningMethodIsRejected(self) -> None:
+        with self.assertRaises(ValueError) as raised:
+            parseDefinition("""TBL
+NAME: sk_tasks_t
+COL: task_id(type=bigint; not_null=true)
+PARTITION: interval(task_id)
+""")
+
+        self.assertEqual('Partitioning method is of invalid type: <interval>', str(raised.exception))
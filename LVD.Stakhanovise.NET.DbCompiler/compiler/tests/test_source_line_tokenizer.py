@@ -0,0 +1,110 @@
+﻿import unittest
+
+from engine.model.db_function import DbFunction
+from engine.model.db_sequence import DbSequence
+from engine.model.db_table import DbTable
+from engine.parser.source_line_tokenizer import SourceLineTokenizer
+
+from .db_test_support import parseDefinition
+
+TABLE_DEFINITION = """TBL
+NAME: sk_tasks_t
+PROPS: description=Queued tasks
+COL: task_id(type=bigint; not_null=true)
+COL: task_type(type=character varying(250); not_null=true; default='none')
+COL: task_posted_at_ts(type=timestamp with time zone; not_null=true)
+CONSTRAINT: pk_sk_tasks_t(task_id, task_posted_at_ts); type=pk
+CONSTRAINT: unq_sk_tasks_t_type(task_type, task_posted_at_ts); type=unq
+IDX: idx_sk_tasks_t_type(task_type=ASC, task_posted_at_ts=DESC); type=btree
+PARTITION: range(task_posted_at_ts)
+PART: sk_tasks_t_2024(from='2024-01-01'; to='2025-01-01')
+PART: sk_tasks_t_default(default=true)
+"""
+
+FUNCTION_DEFINITION = """FUNC
+NAME: sk_count_tasks
+PROPS: language=plpgsql
+PARAM: task_type(type=character varying; direction=in)
+PARAM: task_count(type=bigint; direction=out)
+RET: table(task_type=character varying; task_count=bigint)
+BODY:
+BEGIN
+    NAME: is not a marker inside the body
+END;
+BODY;
+"""
+
+SEQUENCE_DEFINITION = """SEQ
+NAME: sk_ids_seq
+PROPS: start=10; increment=5
+"""
+
+class SourceLineTokenizerTests(unittest.TestCase):
+    def test_linesAreSplitIntoMarkersAndValues(self) -> None:
+        tokenizer = SourceLineTokenizer({
+            'PART:': lambda value: 'part ' + value,
+            'PARTITION:': lambda value: 'partitioning ' + value
+        }, ['BODY:'])
+
+        tokens = list(tokenizer.tokenize([
+            'PARTITION:   range(a)  ',
+            'PART: p1(default=true)',
+            'BODY:',
+            'BODY: x',
+            'anything else'
+        ]))
+
+        self.assertEqual([
+            ('PARTITION:', 'partitioning range(a)'),
+            ('PART:', 'part p1(default=true)'),
+            ('BODY:', None),
+            (None, 'BODY: x'),
+            (None, 'anything else')
+        ], tokens)
+
+    def test_markersOnlyMatchAtTheStartOfTheLine(self) -> None:
+        tokenizer = SourceLineTokenizer({ 'NAME:': lambda value: value })
+
+        self.assertEqual([(None, ' NAME: x')], list(tokenizer.tokenize([' NAME: x'])))
+
+    def test_tableDefinitionIsTokenized(self) -> None:
+        dbTable: DbTable = parseDefinition(TABLE_DEFINITION)
+
+        self.assertEqual('sk_tasks_t', dbTable.getName())
+        self.assertEqual('Queued tasks', dbTable.getPropertyValue('description'))
+        self.assertEqual(['task_id', 'task_type', 'task_posted_at_ts'], [dbColumn.getName() for dbColumn in dbTable.getColumns()])
+        self.assertEqual('character varying(250)', dbTable.getColumns()[1].getType())
+        self.assertTrue(dbTable.getColumns()[1].isNotNull())
+        self.assertEqual("'none'", dbTable.getColumns()[1].getDefaultValue())
+        self.assertEqual(['task_id', 'task_posted_at_ts'], dbTable.getPrimaryKey().getColumnNames())
+        self.assertEqual(['unq_sk_tasks_t_type'], [dbUniqueKey.getName() for dbUniqueKey in dbTable.getUniqueKeys()])
+
+        dbIndex = dbTable.getIndexes()[0]
+        self.assertEqual('btree', dbIndex.getIndexType())
+        self.assertEqual(['task_type', 'task_posted_at_ts'], dbIndex.getColumnNames())
+        self.assertEqual('DESC', dbIndex.getColumnSortOrder('task_posted_at_ts'))
+
+        self.assertTrue(dbTable.getPartitioning().isRangePartitioning())
+        self.assertEqual(['task_posted_at_ts'], dbTable.getPartitioning().getColumnNames())
+        self.assertEqual(['sk_tasks_t_2024', 'sk_tasks_t_default'], [dbPartition.getName() for dbPartition in dbTable.getPartitions()])
+        self.assertEqual("'2024-01-01'", dbTable.getPartitions()[0].getFromValues())
+        self.assertTrue(dbTable.getPartitions()[1].isDefault())
+
+    def test_functionDefinitionIsTokenized(self) -> None:
+        dbFunction: DbFunction = parseDefinition(FUNCTION_DEFINITION)
+
+        self.assertEqual('sk_count_tasks', dbFunction.getName())
+        self.assertEqual('plpgsql', dbFunction.getLanguage())
+        self.assertEqual([('task_type', 'character varying', 'in'), ('task_count', 'bigint', 'out')], 
+            [(dbParam.getName(), dbParam.getType(), dbParam.getDirection()) for dbParam in dbFunction.getParams()])
+        self.assertTrue(dbFunction.getReturnInfo().isTableReturn())
+        self.assertEqual(['task_type', 'task_count'], dbFunction.getReturnInfo().getColumnNames())
+        self.assertIn('NAME: is not a marker inside the body', dbFunction.getBody())
+        self.assertNotIn('BODY', dbFunction.getBody())
+
+    def test_sequenceDefinitionIsTokenized(self) -> None:
+        dbSequence: DbSequence = parseDefinition(SEQUENCE_DEFINITION)
+
+        self.assertEqual('sk_ids_seq', dbSequence.getName())
+        self.assertEqual('10', dbSequence.getStartValue())
+        self.assertEqual('5', dbSequence.getIncrementValue())